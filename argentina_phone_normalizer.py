@@ -1,98 +1,1093 @@
+from __future__ import annotations
+
 import re
-import pandas as pd
-import numpy as np
-from typing import Dict, List, Tuple, Optional, Union
+import os
+import sys
+import importlib.util
+from typing import Dict, Iterator, List, Tuple, Optional, Union
 import json
+import hashlib
+import sqlite3
 from datetime import datetime
 import logging
+import time
+import gc
+import heapq
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from itertools import chain
+from contextlib import contextmanager
 
-class ArgentinaPhoneNormalizer:
-    def __init__(self):
-        self.setup_logging()
+def _lazy_import(name: str):
+    """Devuelve el módulo y lo ejecuta recién al usar uno de sus atributos (si ya estaba cargado, tal cual)"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+# pandas y NumPy se cargan al primer uso: normalize_phone_number no los necesita y el arranque
+# de un proceso que normaliza pocos números no paga su importación
+pd = _lazy_import('pandas')
+np = _lazy_import('numpy')
+
+# Tamaño de bloque del motor vectorizado de batch_normalize
+BATCH_CHUNK_SIZE = 100_000
+# Bloque mínimo al repartir entre procesos, para que el envío no domine
+MIN_WORKER_CHUNK_SIZE = 10_000
+
+RESULT_COLUMNS = [
+    'original', 'normalized', 'is_valid', 'type', 'area_code', 'local_number', 'operator',
+    'region', 'format_e164', 'format_national', 'format_international', 'errors',
+]
+
+# Códigos de tipo del motor vectorizado (0 = sin tipo, número inválido)
+TYPE_LABELS = ['', 'mobile', 'landline']
+_TYPE_MOBILE = 1
+_TYPE_LANDLINE = 2
+
+# Estados por fila del motor vectorizado
+_STATE_NAN = 1
+_STATE_FALLBACK = 2
+
+def _nan_error_message() -> str:
+    """Mensaje que produce el camino escalar al recibir un float NaN"""
+    try:
+        int(float('nan'))
+    except ValueError as e:
+        return f"Error de procesamiento: {str(e)}"
+    return ""
+
+_NAN_ERROR = _nan_error_message()
+
+# Tablas del analizador de una pasada, válidas para entradas ASCII (las demás usan las regex)
+_FORMATTING_TABLE = str.maketrans('', '', ''.join(c for c in map(chr, range(128)) if c.isspace() or c in '()-.'))
+_NON_DIGIT_TABLE = str.maketrans('', '', ''.join(c for c in map(chr, range(128)) if not c.isdigit()))
+_COUNTRY_PREFIXES = ('+54', '0054', '54')
+
+# Las mismas tablas en bytes para la validación liviana (_check)
+_FORMATTING_DELETE = bytes(c for c in range(128) if chr(c).isspace() or chr(c) in '()-.')
+_NON_DIGIT_DELETE = bytes(c for c in range(128) if not chr(c).isdigit())
+# Prefijo de país (solo si queda algo después) y luego móvil (9 + área de 4, 3 o 2 dígitos + 15 + resto)
+# o el resto del número, en el mismo orden que scan_number
+_CHECK_PATTERN = re.compile(rb'(?:(?:\+54|0054|54)(?=.))?(?:9(\d{2,4})15(.+)|(.*))', re.DOTALL)
+_NO_AREA = (False, False)
+
+# Analizadores disponibles para normalize_phone_number
+PARSERS = ['regex', 'single_pass']
+
+def _pack(text: bytes) -> np.uint64:
+    """Empaqueta hasta 8 bytes en una palabra little-endian"""
+    return np.uint64(int.from_bytes(text, 'little'))
+
+# Tablas del motor vectorizado; las crea _init_engine_tables al primer lote para no importar NumPy antes
+_FORMATTING_BYTES = _DIGIT_BYTES = _WORD_MASKS = None
+_ASCII_ZEROS = _HIGH_BITS = _ABOVE_NINE = _POWERS_OF_TEN = _KEY_HASH_TABLE = None
+
+# Posiciones de la tabla de store_key_hashes; en claves más largas las posiciones se repiten
+KEY_HASH_POSITIONS = 256
+
+def _init_engine_tables():
+    """Crea las tablas por byte y las constantes SWAR del motor vectorizado"""
+    global _FORMATTING_BYTES, _DIGIT_BYTES, _WORD_MASKS, _ASCII_ZEROS, _HIGH_BITS, _ABOVE_NINE, _POWERS_OF_TEN
+    global _KEY_HASH_TABLE
+    if _WORD_MASKS is not None:
+        return
+    
+    # Caracteres que remueve clean_input (ASCII de \s incluido) y dígitos
+    _FORMATTING_BYTES = np.zeros(256, dtype=bool)
+    _FORMATTING_BYTES[[ord(c) for c in '()-.'] + list(range(9, 14)) + list(range(28, 33))] = True
+    _DIGIT_BYTES = np.zeros(256, dtype=bool)
+    _DIGIT_BYTES[ord('0'):ord('9') + 1] = True
+    
+    # Máscaras para conservar los primeros k bytes de una palabra de 64 bits
+    _WORD_MASKS = np.array([(1 << (8 * k)) - 1 for k in range(9)], dtype=np.uint64)
+    _ASCII_ZEROS = _pack(b'0' * 8)
+    _HIGH_BITS = _pack(b'\x80' * 8)
+    _ABOVE_NINE = _pack(b'\x76' * 8)
+    
+    # 10**0 a 10**18 para el camino numérico (10**19 no entra en int64)
+    _POWERS_OF_TEN = 10 ** np.arange(19, dtype=np.int64)
+    
+    # Hashing por tabulación de store_key_hashes: un valor al azar por (posición, byte); la semilla es
+    # fija para que los resúmenes coincidan entre corridas y procesos
+    _KEY_HASH_TABLE = np.random.default_rng(0x54454C).integers(
+        0, 2 ** 64 - 1, size=(KEY_HASH_POSITIONS, 256), dtype=np.uint64, endpoint=True)
+
+def _pad(buffer: np.ndarray) -> np.ndarray:
+    """Agrega los 8 bytes en cero que espera _head_words"""
+    return np.concatenate([buffer, np.zeros(8, dtype=np.uint8)])
+
+def _head_words(buffer: np.ndarray, starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Primeros 8 bytes de cada segmento del buffer, empaquetados y rellenos con ceros"""
+    windows = np.lib.stride_tricks.sliding_window_view(buffer, 8)
+    words = np.ascontiguousarray(windows[starts]).view('<u8').ravel()
+    return words & _WORD_MASKS[np.clip(lengths, 0, 8)]
+
+def _non_digit_bytes(words: np.ndarray) -> np.ndarray:
+    """Marca con el bit alto cada byte de la palabra que no es un dígito ASCII"""
+    shifted = words ^ _ASCII_ZEROS
+    return ((shifted + _ABOVE_NINE) | shifted) & _HIGH_BITS
+
+def _byte_at(words: np.ndarray, position: int) -> np.ndarray:
+    """Byte en la posición indicada de cada palabra"""
+    return (words >> np.uint64(8 * position)) & np.uint64(0xFF)
+
+def _prefix_keys(words: np.ndarray) -> List[np.ndarray]:
+    """Claves int('1' + prefijo) de los prefijos de 0 a 4 dígitos de cada palabra"""
+    keys = [np.ones(len(words), dtype=np.int64)]
+    for position in range(4):
+        keys.append(keys[-1] * 10 + _byte_at(words, position).astype(np.int64) - ord('0'))
+    return keys
+
+def _segment_counts(mask: np.ndarray, starts: np.ndarray, lengths: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Posiciones marcadas dentro de cada segmento [start, start + length) y dónde empieza cada
+    segmento en buffer[mask]; los bytes entre segmentos no corren los inicios"""
+    totals = np.concatenate([[0], np.cumsum(mask)])
+    return totals[starts + lengths] - totals[starts], totals[starts]
+
+def _line_batches(buffer: np.ndarray, batch_size: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Inicio y largo de las líneas no vacías del buffer, de a batch_size, buscando los saltos por ventanas"""
+    size = len(buffer)
+    position = 0
+    # Unos 16 bytes por línea; la ventana crece si no entra ninguna línea completa
+    window = max(batch_size * 16, 1 << 16)
+    while position < size:
+        end = min(position + window, size)
+        ends = position + np.flatnonzero(buffer[position:end] == ord('\n'))[:batch_size]
+        if end == size and ends.size < batch_size and (ends.size == 0 or ends[-1] < size - 1):
+            # Última línea sin salto final
+            ends = np.append(ends, size)
+        if ends.size == 0:
+            window *= 2
+            continue
         
-        # Códigos de área de Argentina
-        self.area_codes = {
-            # CABA y Gran Buenos Aires
-            '11': {'type': 'mobile_landline', 'region': 'CABA_GBA', 'operator': 'mixed'},
-            
-            # Códigos de área por provincia
-            '220': {'type': 'landline', 'region': 'Buenos_Aires', 'operator': 'landline'},
-            '221': {'type': 'landline', 'region': 'La_Plata', 'operator': 'landline'},
-            '223': {'type': 'landline', 'region': 'Mar_del_Plata', 'operator': 'landline'},
-            '236': {'type': 'landline', 'region': 'Junin', 'operator': 'landline'},
-            '237': {'type': 'landline', 'region': 'Tandil', 'operator': 'landline'},
-            '249': {'type': 'landline', 'region': 'Azul', 'operator': 'landline'},
-            '261': {'type': 'landline', 'region': 'Mendoza', 'operator': 'landline'},
-            '264': {'type': 'landline', 'region': 'San_Juan', 'operator': 'landline'},
-            '266': {'type': 'landline', 'region': 'San_Luis', 'operator': 'landline'},
-            '280': {'type': 'landline', 'region': 'Viedma', 'operator': 'landline'},
-            '291': {'type': 'landline', 'region': 'Bahia_Blanca', 'operator': 'landline'},
-            '294': {'type': 'landline', 'region': 'San_Carlos_Bariloche', 'operator': 'landline'},
-            '297': {'type': 'landline', 'region': 'Comodoro_Rivadavia', 'operator': 'landline'},
-            '298': {'type': 'landline', 'region': 'Neuquen', 'operator': 'landline'},
-            '299': {'type': 'landline', 'region': 'Zapala', 'operator': 'landline'},
-            
-            # Córdoba
-            '351': {'type': 'landline', 'region': 'Cordoba_Capital', 'operator': 'landline'},
-            '353': {'type': 'landline', 'region': 'Villa_Maria', 'operator': 'landline'},
-            '354': {'type': 'landline', 'region': 'Bell_Ville', 'operator': 'landline'},
-            '358': {'type': 'landline', 'region': 'Rio_Cuarto', 'operator': 'landline'},
-            
-            # Santa Fe
-            '341': {'type': 'landline', 'region': 'Rosario', 'operator': 'landline'},
-            '342': {'type': 'landline', 'region': 'Santa_Fe_Capital', 'operator': 'landline'},
-            '343': {'type': 'landline', 'region': 'Parana', 'operator': 'landline'},
-            
-            # Norte
-            '381': {'type': 'landline', 'region': 'Tucuman', 'operator': 'landline'},
-            '383': {'type': 'landline', 'region': 'Catamarca', 'operator': 'landline'},
-            '385': {'type': 'landline', 'region': 'Santiago_del_Estero', 'operator': 'landline'},
-            '387': {'type': 'landline', 'region': 'Salta', 'operator': 'landline'},
-            '388': {'type': 'landline', 'region': 'Jujuy', 'operator': 'landline'},
+        starts = np.concatenate([[position], ends[:-1] + 1])
+        lengths = ends - starts
+        position = int(ends[-1]) + 1
+        # Fin de línea \r\n
+        lengths -= (lengths > 0) & (buffer[np.maximum(ends - 1, 0)] == ord('\r'))
+        present = lengths > 0
+        if present.any():
+            yield starts[present], lengths[present]
+
+def _hash_key_bytes(key: bytes) -> int:
+    """Resumen de store_key_hashes de una clave en bytes, para las filas que se limpian una por una"""
+    total = 0
+    for position, byte in enumerate(key):
+        total += int(_KEY_HASH_TABLE[position % KEY_HASH_POSITIONS, byte])
+    return total % 2 ** 64
+
+def _mark_area_errors(errors: np.ndarray, mask: np.ndarray, area_key: np.ndarray):
+    """Mensaje de código de área inválido; area_key es int('1' + código), 1 si no se reconoció"""
+    bad_keys, inverse = np.unique(area_key[mask], return_inverse=True)
+    messages = np.array([f"Código de área inválido: {str(key)[1:]}" for key in bad_keys], dtype=object)
+    errors[mask] = messages[inverse]
+
+def _mark_length_errors(errors: np.ndarray, active: np.ndarray, mobile: np.ndarray, landline: np.ndarray,
+                        local_len: np.ndarray) -> np.ndarray:
+    """Mensajes de longitud local inválida; devuelve las filas marcadas"""
+    bad_mobile = active & mobile & (local_len != 7) & (local_len != 8)
+    bad_landline = active & landline & ((local_len < 6) | (local_len > 8))
+    for mask, label in ((bad_mobile, 'móvil'), (bad_landline, 'fijo')):
+        for length in np.unique(local_len[mask]):
+            errors[mask & (local_len == length)] = f"Longitud inválida para {label}: {length} dígitos"
+    return bad_mobile | bad_landline
+
+@contextmanager
+def _gc_paused():
+    """Suspende el recolector de ciclos durante la creación masiva de objetos"""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+# Estado de cada proceso del pool: el normalizador y sus tablas se reciben una sola vez
+_worker_state = {}
+
+def _init_batch_worker(normalizer: 'ArgentinaPhoneNormalizer'):
+    """Prepara el normalizador y sus tablas en un proceso del pool"""
+    _worker_state['normalizer'] = normalizer
+    _worker_state['lookup'] = normalizer._build_batch_lookup()
+
+def _normalize_chunk_in_worker(block, python_scalars: bool) -> Dict[str, any]:
+    """Normaliza un bloque dentro de un proceso del pool y devuelve sus arrays codificados"""
+    normalizer = _worker_state['normalizer']
+    return normalizer._normalize_chunk(block, _worker_state['lookup'], python_scalars)
+
+# Métodos de ArgentinaPhoneNormalizer que se miden al activar la instrumentación
+PROFILED_STAGES = [
+    'normalize_phone_number',
+    'clean_input',
+    'extract_country_code',
+    'identify_number_type',
+    'scan_number',
+    'validate_area_code',
+    'detect_mobile_operator',
+    'format_result',
+    'batch_normalize',
+    'batch_normalize_compact',
+    '_normalize_chunk',
+    '_results_to_dataframe',
+]
+
+# Rama de error según el prefijo del mensaje
+ERROR_BRANCHES = [
+    ("Número vacío o inválido", 'empty_input'),
+    ("Número inválido después de limpieza", 'empty_after_cleaning'),
+    ("Código de área inválido", 'invalid_area_code'),
+    ("Longitud inválida para móvil", 'invalid_mobile_length'),
+    ("Longitud inválida para fijo", 'invalid_landline_length'),
+    ("Error de procesamiento", 'processing_error'),
+]
+
+# Códigos de error de la validación liviana (validation_code, batch_validate): 0 = válido y luego
+# las ramas de ERROR_BRANCHES en el mismo orden
+ERROR_CODES = ['valid'] + [branch for _, branch in ERROR_BRANCHES]
+(_CODE_EMPTY_INPUT, _CODE_EMPTY_AFTER_CLEANING, _CODE_INVALID_AREA_CODE, _CODE_INVALID_MOBILE_LENGTH,
+ _CODE_INVALID_LANDLINE_LENGTH, _CODE_PROCESSING_ERROR) = range(1, len(ERROR_CODES))
+
+def _error_code(error: str) -> int:
+    """Código de ERROR_CODES de un mensaje de error según su prefijo"""
+    for code, (prefix, _) in enumerate(ERROR_BRANCHES, start=1):
+        if error.startswith(prefix):
+            return code
+    return _CODE_PROCESSING_ERROR
+
+class _TimedStage:
+    """Envoltorio que acumula llamadas y tiempo de una etapa en stats = [llamadas, segundos]"""
+    
+    def __init__(self, method, stats: List, on_result=None):
+        self.method = method
+        self.stats = stats
+        self.on_result = on_result
+    
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = self.method(*args, **kwargs)
+        finally:
+            self.stats[0] += 1
+            self.stats[1] += time.perf_counter() - start
+        if self.on_result is not None:
+            self.on_result(result)
+        return result
+
+class _LineSlices:
+    """Líneas de un archivo mapeado en memoria; se decodifican recién al pedirlas"""
+    
+    def __init__(self, mapped, starts: np.ndarray, lengths: np.ndarray):
+        self.mapped = mapped
+        self.starts = starts
+        self.lengths = lengths
+    
+    def __len__(self) -> int:
+        return len(self.starts)
+    
+    def __getitem__(self, i: int) -> str:
+        start = int(self.starts[i])
+        return self.mapped[start:start + int(self.lengths[i])].decode('utf-8', 'replace')
+    
+    def to_numpy(self) -> np.ndarray:
+        """Todas las líneas como array de strings"""
+        mapped = self.mapped
+        lines = np.empty(len(self), dtype=object)
+        lines[:] = [mapped[start:start + length].decode('utf-8', 'replace')
+                    for start, length in zip(self.starts.tolist(), self.lengths.tolist())]
+        return lines
+
+class BatchResult:
+    """Resultado de un lote en columnas compactas; los strings se arman solo al pedir cada columna"""
+    
+    CATEGORICAL_COLUMNS = ['type', 'area_code', 'operator', 'region']
+    
+    def __init__(self, originals, is_valid: np.ndarray, types: np.ndarray, areas: np.ndarray,
+                 operators: np.ndarray, local: np.ndarray, error_codes: np.ndarray,
+                 error_labels: List[Optional[str]], overrides: Dict[int, Dict[str, any]],
+                 lookup: Dict[str, any]):
+        # types: índice en TYPE_LABELS; areas: slot de la tabla de códigos (0 = sin código);
+        # operators: índice en lookup['operator']; local: dígitos locales como S8;
+        # error_codes: índice en error_labels (0 = sin error); overrides: resultados completos
+        # de las filas calculadas por normalize_phone_number
+        self.originals = originals
+        self.is_valid = is_valid
+        self.types = types
+        self.areas = areas
+        self.operators = operators
+        self.local = local
+        self.error_codes = error_codes
+        self.error_labels = error_labels
+        self.overrides = overrides
+        self.lookup = lookup
+        self._local_text = None
+    
+    @classmethod
+    def from_chunks(cls, originals, chunks: List[Dict[str, any]], lookup: Dict[str, any]) -> 'BatchResult':
+        """Une los bloques codificados del motor vectorizado en un único resultado"""
+        def merged(key, dtype):
+            if not chunks:
+                return np.zeros(0, dtype=dtype)
+            return np.concatenate([chunk[key] for chunk in chunks])
+        
+        is_valid = merged('is_valid', bool)
+        types = merged('type', np.int8)
+        areas = merged('area', np.int64)
+        operators = merged('operator', np.int16)
+        local = merged('local', 'S8')
+        error_codes, error_labels = pd.factorize(merged('errors', object), use_na_sentinel=True)
+        error_codes = (error_codes + 1).astype(np.int32)
+        error_labels = [None] + list(error_labels)
+        
+        # Las filas calculadas fuera del motor también quedan codificadas, salvo los strings
+        overrides = {}
+        offset = 0
+        operator_index = {label: code for code, label in enumerate(lookup['operator'])}
+        error_index = {label: code for code, label in enumerate(error_labels)}
+        for chunk in chunks:
+            for i, result in chunk['fallback'].items():
+                row = offset + i
+                overrides[row] = result
+                is_valid[row] = result['is_valid']
+                types[row] = TYPE_LABELS.index(result['type'])
+                areas[row] = lookup['slots'][int('1' + result['area_code'])] if result['area_code'] else 0
+                operators[row] = operator_index[result['operator']]
+                error = result['errors'][0] if result['errors'] else None
+                if error not in error_index:
+                    error_index[error] = len(error_labels)
+                    error_labels.append(error)
+                error_codes[row] = error_index[error]
+            offset += len(chunk['is_valid'])
+        
+        return cls(originals, is_valid, types, areas, operators, local, error_codes, error_labels, overrides, lookup)
+    
+    def __len__(self) -> int:
+        return len(self.is_valid)
+    
+    def take(self, indices: np.ndarray, originals) -> 'BatchResult':
+        """Expande el resultado por índice de fila, p. ej. de los valores únicos a todas las filas"""
+        overrides = {}
+        if self.overrides:
+            rows = np.flatnonzero(np.isin(indices, list(self.overrides)))
+            overrides = {row: self.overrides[source] for row, source in zip(rows.tolist(), indices[rows].tolist())}
+        return BatchResult(originals, self.is_valid[indices], self.types[indices], self.areas[indices],
+                           self.operators[indices], self.local[indices], self.error_codes[indices],
+                           self.error_labels, overrides, self.lookup)
+    
+    def _patched(self, name: str, column: np.ndarray) -> np.ndarray:
+        """Aplica los valores de las filas calculadas fuera del motor vectorizado"""
+        for row, result in self.overrides.items():
+            column[row] = result[name]
+        return column
+    
+    def _local_strings(self) -> np.ndarray:
+        """Dígitos locales de las filas válidas como str, compartidos por todas las columnas de formato"""
+        if self._local_text is None:
+            self._local_text = self.local[self.is_valid].astype('U8').astype(object)
+        return self._local_text
+    
+    def _formatted(self, mobile_prefix: str, landline_prefix: str, separator: str) -> np.ndarray:
+        """Arma un formato de número solo para las filas válidas"""
+        column = np.full(len(self), '', dtype=object)
+        valid = np.flatnonzero(self.is_valid)
+        if valid.size:
+            # Hay pocas combinaciones de prefijo y área: se arman una vez y por fila solo se suma el número local
+            heads = np.array([landline_prefix, mobile_prefix], dtype=object)[:, None] + self.lookup['code'] + separator
+            mobile = (self.types[valid] == _TYPE_MOBILE).astype(np.intp)
+            column[valid] = heads[mobile, self.areas[valid]] + self._local_strings()
+        return column
+    
+    def column(self, name: str) -> np.ndarray:
+        """Materializa una columna de resultados con los mismos valores que normalize_phone_number"""
+        if name == 'original':
+            if isinstance(self.originals, _LineSlices):
+                return self.originals.to_numpy()
+            return self.originals
+        if name == 'is_valid':
+            return self.is_valid.copy()
+        if name == 'type':
+            column = np.array(TYPE_LABELS, dtype=object)[self.types]
+        elif name == 'area_code':
+            column = self.lookup['code'][self.areas]
+        elif name == 'operator':
+            column = self.lookup['operator'][self.operators]
+        elif name == 'region':
+            column = self.lookup['region'][self.areas]
+        elif name == 'local_number':
+            column = np.full(len(self), '', dtype=object)
+            column[self.is_valid] = self._local_strings()
+        elif name in ('normalized', 'format_e164'):
+            column = self._formatted('+549', '+54', '')
+        elif name == 'format_national':
+            column = self._formatted('15-', '', '-')
+        elif name == 'format_international':
+            column = self._formatted('+54 9 ', '+54 ', ' ')
+        elif name == 'errors':
+            # Una lista por fila: pausar el GC evita recorrer el heap mientras se crean, y fromiter
+            # no intenta leer cada lista como una secuencia
+            labels = self.error_labels
+            with _gc_paused():
+                column = np.fromiter(([labels[code]] if code else [] for code in self.error_codes.tolist()),
+                                     dtype=object, count=len(self))
+        else:
+            raise KeyError(f"Columna desconocida: {name}")
+        return self._patched(name, column)
+    
+    def _label_codes(self, name: str) -> Tuple[np.ndarray, List[str]]:
+        """Códigos por fila y etiquetas de una de las columnas categóricas"""
+        if name == 'type':
+            return self.types, TYPE_LABELS
+        if name == 'area_code':
+            return self.areas, list(self.lookup['code'])
+        if name == 'operator':
+            return self.operators, list(self.lookup['operator'])
+        return self.lookup['region_code'][self.areas], self.lookup['region_names']
+    
+    def _categorical(self, name: str) -> pd.Categorical:
+        """Columna categórica construida directamente desde los códigos"""
+        return pd.Categorical.from_codes(*self._label_codes(name))
+    
+    def _labels_taken(self, name: str):
+        """Misma columna que column(name) para el DataFrame, pero pandas convierte solo las etiquetas
+        presentes y no un str por fila"""
+        codes, labels = self._label_codes(name)
+        labels = np.array(labels, dtype=object)
+        if any(result[name] != labels[codes[row]] for row, result in self.overrides.items()):
+            return self.column(name)
+        # Solo las etiquetas que aparecen, para que pandas infiera el mismo dtype que con la columna entera
+        present = np.flatnonzero(np.bincount(codes, minlength=len(labels)))
+        remap = np.zeros(len(labels), dtype=np.intp)
+        remap[present] = np.arange(len(present))
+        return pd.Series(labels[present]).array.take(remap[codes])
+    
+    def to_dataframe(self, categorical: bool = True, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Convierte a DataFrame; con categorical=True tipo, área, operador y región usan dtype category"""
+        data = {}
+        for name in columns or RESULT_COLUMNS:
+            if name == 'format_e164' and 'normalized' in data:
+                data[name] = data['normalized'].copy()
+            elif name == 'normalized':
+                # Se convierte una vez al array de pandas, así la copia para format_e164 no repite la conversión
+                data[name] = pd.Series(self.column(name)).array
+            elif name in self.CATEGORICAL_COLUMNS:
+                data[name] = self._categorical(name) if categorical else self._labels_taken(name)
+            else:
+                data[name] = self.column(name)
+        return pd.DataFrame(data)
+
+class ReportAggregator:
+    """Contadores del reporte que se actualizan por bloque y se combinan entre bloques o procesos"""
+    
+    def __init__(self):
+        self.total = 0
+        self.valid = 0
+        self.types = Counter()
+        self.operators = Counter()
+        self.regions = Counter()
+        self.errors = Counter()
+    
+    @property
+    def invalid(self) -> int:
+        return self.total - self.valid
+    
+    def update(self, results_df: pd.DataFrame) -> 'ReportAggregator':
+        """Suma un bloque de resultados de batch_normalize; la máscara de válidos se calcula una vez"""
+        if len(results_df) == 0:
+            return self
+        valid = (results_df['is_valid'] == True).to_numpy()
+        self.total += len(results_df)
+        self.valid += int(valid.sum())
+        for counter, column in ((self.types, 'type'), (self.operators, 'operator'), (self.regions, 'region')):
+            # En columnas categóricas value_counts incluye todas las categorías, también las que no aparecen
+            counts = results_df[column][valid].value_counts(sort=False)
+            counter.update(counts[counts > 0].to_dict())
+        # Las filas válidas tienen la lista vacía, así que se recorren solo las inválidas
+        self.errors.update(chain.from_iterable(results_df['errors'][~valid]))
+        return self
+    
+    def merge(self, other: 'ReportAggregator') -> 'ReportAggregator':
+        """Agrega los contadores de otro agregador"""
+        self.total += other.total
+        self.valid += other.valid
+        self.types.update(other.types)
+        self.operators.update(other.operators)
+        self.regions.update(other.regions)
+        self.errors.update(other.errors)
+        return self
+    
+    def to_dict(self) -> Dict[str, any]:
+        """Contadores serializables a JSON, p. ej. para guardar el progreso de una corrida larga"""
+        return {
+            'total': self.total,
+            'valid': self.valid,
+            'types': dict(self.types),
+            'operators': dict(self.operators),
+            'regions': dict(self.regions),
+            'errors': dict(self.errors),
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, any]) -> 'ReportAggregator':
+        """Reconstruye un agregador guardado con to_dict, con los contadores en el mismo orden"""
+        aggregator = cls()
+        aggregator.total = data['total']
+        aggregator.valid = data['valid']
+        for name in ('types', 'operators', 'regions', 'errors'):
+            setattr(aggregator, name, Counter(data[name]))
+        return aggregator
+    
+    def to_report(self) -> Dict[str, any]:
+        """Reporte con el mismo formato que generate_report"""
+        # Los inválidos no tienen tipo; generate_report siempre los contó como tipo ''
+        types = self.types + Counter({'': self.invalid})
+        return {
+            'total_numbers': self.total,
+            'valid_numbers': self.valid,
+            'invalid_numbers': self.invalid,
+            'validity_rate': (self.valid / self.total * 100) if self.total > 0 else 0,
+            'type_distribution': dict(types.most_common()),
+            'operator_distribution': dict(self.operators.most_common()),
+            'region_distribution': dict(self.regions.most_common()),
+            'common_errors': self.errors.most_common(),
+            'processed_at': datetime.now().isoformat()
+        }
+
+class NormalizationStore:
+    """Almacén SQLite persistente de resultados indexados por número limpio, atado a una versión de las tablas"""
+    
+    # Columnas guardadas; errors se guarda como su único mensaje (o NULL)
+    STORED_COLUMNS = ['is_valid'] + [column for column in RESULT_COLUMNS[1:-1] if column != 'is_valid']
+    
+    def __init__(self, path: str, tables_version: str):
+        self.path = path
+        self.tables_version = tables_version
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0, 'invalidated': False}
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS results (cleaned TEXT PRIMARY KEY, "
+            + ", ".join(f"{column} {'INTEGER' if column == 'is_valid' else 'TEXT'}" for column in self.STORED_COLUMNS)
+            + ", error TEXT)"
+        )
         
-        # Rangos de números móviles por operador
-        self.mobile_operators = {
-            'Personal': {
-                'prefixes': ['15-2', '15-3'],
-                'ranges': [
-                    (1150000000, 1159999999),
-                    (1152000000, 1159999999)
-                ]
-            },
-            'Movistar': {
-                'prefixes': ['15-1', '15-6', '15-7'],
-                'ranges': [
-                    (1151000000, 1151999999),
-                    (1156000000, 1157999999)
-                ]
-            },
-            'Claro': {
-                'prefixes': ['15-4', '15-5', '15-9'],
-                'ranges': [
-                    (1154000000, 1155999999),
-                    (1159000000, 1159999999)
-                ]
-            }
+        # Si cambiaron los códigos de área u operadores, los resultados guardados ya no sirven
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'tables_version'").fetchone()
+        if row is None or row[0] != tables_version:
+            if row is not None:
+                self.stats['invalidated'] = True
+            self.connection.execute("DELETE FROM results")
+            self.connection.execute("INSERT OR REPLACE INTO meta VALUES ('tables_version', ?)", (tables_version,))
+        self.connection.commit()
+    
+    def lookup(self, keys: List[str]) -> Tuple[np.ndarray, Dict[str, tuple]]:
+        """Busca números limpios; devuelve las posiciones encontradas y sus columnas en el mismo orden"""
+        # Las claves van a una tabla temporal y se cruzan con un solo JOIN
+        self.connection.execute("CREATE TEMP TABLE IF NOT EXISTS wanted (position INTEGER, cleaned TEXT)")
+        self.connection.execute("DELETE FROM wanted")
+        self.connection.executemany("INSERT INTO wanted VALUES (?, ?)", enumerate(keys))
+        columns = ", ".join(f"r.{column}" for column in self.STORED_COLUMNS)
+        rows = self.connection.execute(
+            f"SELECT w.position, {columns}, r.error FROM wanted w JOIN results r ON r.cleaned = w.cleaned"
+        ).fetchall()
+        self.connection.execute("DELETE FROM wanted")
+        
+        self.stats['hits'] += len(rows)
+        self.stats['misses'] += len(keys) - len(rows)
+        if not rows:
+            return np.zeros(0, dtype=np.int64), {}
+        positions, *values = zip(*rows)
+        return np.array(positions, dtype=np.int64), dict(zip(self.STORED_COLUMNS + ['error'], values))
+    
+    def put_many(self, items: List[Tuple[str, Dict[str, any]]]):
+        """Guarda pares (número limpio, resultado)"""
+        rows = [
+            (key, int(bool(result['is_valid'])))
+            + tuple(str(result[column]) for column in self.STORED_COLUMNS[1:])
+            + (result['errors'][0] if result['errors'] else None,)
+            for key, result in items
+        ]
+        placeholders = ", ".join("?" * (len(self.STORED_COLUMNS) + 2))
+        self.connection.executemany(f"INSERT OR REPLACE INTO results VALUES ({placeholders})", rows)
+        self.connection.commit()
+        self.stats['stored'] += len(rows)
+    
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+    
+    def close(self):
+        self.connection.close()
+
+# Códigos de área de Argentina
+_BUILTIN_AREA_CODES = {
+    # CABA y Gran Buenos Aires
+    '11': {'type': 'mobile_landline', 'region': 'CABA_GBA', 'operator': 'mixed'},
+    
+    # Códigos de área por provincia
+    '220': {'type': 'landline', 'region': 'Buenos_Aires', 'operator': 'landline'},
+    '221': {'type': 'landline', 'region': 'La_Plata', 'operator': 'landline'},
+    '223': {'type': 'landline', 'region': 'Mar_del_Plata', 'operator': 'landline'},
+    '236': {'type': 'landline', 'region': 'Junin', 'operator': 'landline'},
+    '237': {'type': 'landline', 'region': 'Tandil', 'operator': 'landline'},
+    '249': {'type': 'landline', 'region': 'Azul', 'operator': 'landline'},
+    '261': {'type': 'landline', 'region': 'Mendoza', 'operator': 'landline'},
+    '264': {'type': 'landline', 'region': 'San_Juan', 'operator': 'landline'},
+    '266': {'type': 'landline', 'region': 'San_Luis', 'operator': 'landline'},
+    '280': {'type': 'landline', 'region': 'Viedma', 'operator': 'landline'},
+    '291': {'type': 'landline', 'region': 'Bahia_Blanca', 'operator': 'landline'},
+    '294': {'type': 'landline', 'region': 'San_Carlos_Bariloche', 'operator': 'landline'},
+    '297': {'type': 'landline', 'region': 'Comodoro_Rivadavia', 'operator': 'landline'},
+    '298': {'type': 'landline', 'region': 'Neuquen', 'operator': 'landline'},
+    '299': {'type': 'landline', 'region': 'Zapala', 'operator': 'landline'},
+    
+    # Córdoba
+    '351': {'type': 'landline', 'region': 'Cordoba_Capital', 'operator': 'landline'},
+    '353': {'type': 'landline', 'region': 'Villa_Maria', 'operator': 'landline'},
+    '354': {'type': 'landline', 'region': 'Bell_Ville', 'operator': 'landline'},
+    '358': {'type': 'landline', 'region': 'Rio_Cuarto', 'operator': 'landline'},
+    
+    # Santa Fe
+    '341': {'type': 'landline', 'region': 'Rosario', 'operator': 'landline'},
+    '342': {'type': 'landline', 'region': 'Santa_Fe_Capital', 'operator': 'landline'},
+    '343': {'type': 'landline', 'region': 'Parana', 'operator': 'landline'},
+    
+    # Norte
+    '381': {'type': 'landline', 'region': 'Tucuman', 'operator': 'landline'},
+    '383': {'type': 'landline', 'region': 'Catamarca', 'operator': 'landline'},
+    '385': {'type': 'landline', 'region': 'Santiago_del_Estero', 'operator': 'landline'},
+    '387': {'type': 'landline', 'region': 'Salta', 'operator': 'landline'},
+    '388': {'type': 'landline', 'region': 'Jujuy', 'operator': 'landline'},
+}
+
+# Rangos de números móviles por operador
+_BUILTIN_MOBILE_OPERATORS = {
+    'Personal': {
+        'prefixes': ['15-2', '15-3'],
+        'ranges': [
+            (1150000000, 1159999999),
+            (1152000000, 1159999999)
+        ]
+    },
+    'Movistar': {
+        'prefixes': ['15-1', '15-6', '15-7'],
+        'ranges': [
+            (1151000000, 1151999999),
+            (1156000000, 1157999999)
+        ]
+    },
+    'Claro': {
+        'prefixes': ['15-4', '15-5', '15-9'],
+        'ranges': [
+            (1154000000, 1155999999),
+            (1159000000, 1159999999)
+        ]
+    }
+}
+
+# Patrones de validación
+_PATTERNS = {
+    'with_country': re.compile(r'^(\+54|0054|54)[-\s]?(.+)$'),
+    'area_code': re.compile(r'^(\d{2,4})[-\s]?(.+)$'),
+    'mobile_format': re.compile(r'^9[-\s]?(\d{2,4})[-\s]?15[-\s]?(.+)$'),
+    'landline_format': re.compile(r'^(\d{2,4})[-\s]?(\d{6,8})$'),
+    'clean_number': re.compile(r'[^\d]'),
+    'formatting': re.compile(r'[\(\)\-\s\.]'),
+}
+
+class _FrozenDict(dict):
+    """dict de solo lectura para las tablas compartidas del plan de numeración"""
+    
+    __slots__ = ()
+    
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("El plan de numeración es inmutable: cree otro NumberingPlan con las tablas modificadas")
+    
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _readonly
+    
+    def __reduce__(self):
+        return (_FrozenDict, (dict(self),))
+
+def _freeze(value):
+    """Copia inmutable de tablas anidadas: dicts como _FrozenDict y listas como tuplas"""
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _thaw(value):
+    """Copia modificable de tablas congeladas con _freeze"""
+    if isinstance(value, dict):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+def _tables_version(area_codes, mobile_operators) -> str:
+    """Huella de las tablas de códigos de área y operadores"""
+    tables = {
+        'area_codes': area_codes,
+        'mobile_operators': mobile_operators,
+    }
+    content = json.dumps(tables, sort_keys=True, ensure_ascii=False, default=list)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+
+def _compile_area_code_trie(area_codes) -> Dict[str, any]:
+    """Trie de dígitos con los códigos de área, para la búsqueda por prefijo más largo"""
+    # Cada nodo es un dict dígito -> nodo; la clave '' marca el fin de un código y guarda el código
+    trie = {}
+    for code in area_codes:
+        if not (2 <= len(code) <= 4 and code.isascii() and code.isdigit()):
+            continue
+        node = trie
+        for digit in code:
+            node = node.setdefault(digit, {})
+        node[''] = code
+    return trie
+
+def _compile_operator_ranges(mobile_operators) -> Tuple[List[int], List[int], List[str]]:
+    """Rangos de los operadores móviles como intervalos ordenados y disjuntos: (inicios, fines, operadores)"""
+    # Ante rangos solapados gana la menor 'priority'; sin ella, el orden del dict
+    ranked = sorted(
+        (info.get('priority', position), position, operator, min_range, max_range)
+        for position, (operator, info) in enumerate(mobile_operators.items())
+        for min_range, max_range in info['ranges']
+    )
+    by_start = sorted(ranked, key=lambda entry: entry[3])
+    bounds = sorted({edge for *_, min_range, max_range in ranked for edge in (min_range, max_range + 1)})
+    
+    # Barrido por los bordes: el heap guarda los rangos abiertos ordenados por prioridad
+    starts, ends, names = [], [], []
+    open_ranges = []
+    pending = 0
+    for start, next_start in zip(bounds, bounds[1:]):
+        while pending < len(by_start) and by_start[pending][3] <= start:
+            priority, position, operator, _, max_range = by_start[pending]
+            heapq.heappush(open_ranges, (priority, position, max_range, operator))
+            pending += 1
+        while open_ranges and open_ranges[0][2] < start:
+            heapq.heappop(open_ranges)
+        if not open_ranges:
+            continue
+        owner = open_ranges[0][3]
+        if names and names[-1] == owner and ends[-1] == start - 1:
+            ends[-1] = next_start - 1
+        else:
+            starts.append(start)
+            ends.append(next_start - 1)
+            names.append(owner)
+    return starts, ends, names
+
+class NumberingPlan:
+    """Plan de numeración inmutable y versionado: códigos de área, rangos de operadores y sus índices.
+    
+    Se construye una sola vez y todas las instancias de ArgentinaPhoneNormalizer lo referencian;
+    los procesos creados con fork comparten sus páginas. Para cambiar las tablas se crea otro plan,
+    desde dicts o desde un archivo JSON con las claves 'area_codes' y 'mobile_operators'.
+    """
+    
+    # Atributos que el normalizador toma del plan
+    TABLES = ['area_codes', 'mobile_operators', 'area_code_trie', 'operator_starts', 'operator_ends',
+              'operator_names']
+    
+    __slots__ = TABLES + ['version', 'source', '_national_index']
+    
+    def __init__(self, area_codes: Dict[str, Dict[str, str]], mobile_operators: Dict[str, Dict[str, any]],
+                 source: str = 'builtin'):
+        starts, ends, names = _compile_operator_ranges(mobile_operators)
+        values = {
+            'area_codes': _freeze(area_codes),
+            'mobile_operators': _freeze(mobile_operators),
+            'area_code_trie': _freeze(_compile_area_code_trie(area_codes)),
+            'operator_starts': tuple(starts),
+            'operator_ends': tuple(ends),
+            'operator_names': tuple(names),
+            'version': _tables_version(area_codes, mobile_operators),
+            'source': source,
+            '_national_index': None,
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("El plan de numeración es inmutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError("El plan de numeración es inmutable")
+    
+    def __repr__(self) -> str:
+        return f"NumberingPlan(version={self.version!r}, source={self.source!r}, area_codes={len(self.area_codes)})"
+    
+    def __reduce__(self):
+        # El plan por defecto se reconstruye en destino como el plan por defecto de ese proceso
+        if self is _default_plan:
+            return (NumberingPlan.default, ())
+        return (NumberingPlan, (_thaw(self.area_codes), _thaw(self.mobile_operators), self.source))
+    
+    @classmethod
+    def default(cls) -> 'NumberingPlan':
+        """Plan incorporado en el módulo, construido una sola vez por proceso"""
+        global _default_plan
+        if _default_plan is None:
+            _default_plan = cls(_BUILTIN_AREA_CODES, _BUILTIN_MOBILE_OPERATORS)
+        return _default_plan
+    
+    @classmethod
+    def from_file(cls, path: str) -> 'NumberingPlan':
+        """Carga un plan desde un JSON con 'area_codes' y 'mobile_operators' (rangos como pares [desde, hasta])"""
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        missing = [key for key in ('area_codes', 'mobile_operators') if key not in data]
+        if missing:
+            raise ValueError(f"Faltan claves en el plan de numeración {path}: {', '.join(missing)}")
+        # JSON no tiene tuplas: los rangos vuelven como pares para que la huella coincida
+        operators = {
+            name: {**info, 'ranges': [tuple(pair) for pair in info.get('ranges', [])]}
+            for name, info in data['mobile_operators'].items()
         }
+        return cls(data['area_codes'], operators, source=path)
+    
+    def national_index(self) -> 'NationalNumberIndex':
+        """Índice vectorizado para números nacionales de 10 dígitos, construido al primer uso"""
+        if self._national_index is None:
+            object.__setattr__(self, '_national_index', NationalNumberIndex(self))
+        return self._national_index
+    
+    def to_file(self, path: str):
+        """Guarda las tablas en el formato que lee from_file"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'area_codes': self.area_codes, 'mobile_operators': self.mobile_operators},
+                      f, indent=2, ensure_ascii=False)
+
+_default_plan = None
+
+# Dígitos de un número nacional significativo: código de área + número local
+NATIONAL_NUMBER_DIGITS = 10
+
+# Bloque de operadores donde cambia el operador; se resuelve con la tabla de intervalos
+_MIXED_BLOCK = -1
+
+class NationalNumberIndex:
+    """Índice precalculado del plan para números nacionales de 10 dígitos ya limpios (sin 0, 9 ni 15).
+    
+    Una tabla por los primeros 4 dígitos da el código de área más largo y otra por bloques de los
+    primeros block_digits dígitos da el operador; solo los bloques que comparten operadores se buscan
+    en los intervalos. lookup() devuelve códigos: area indexa area_code y region, y operator indexa
+    operator (0 = sin área o sin operador).
+    """
+    
+    def __init__(self, plan: NumberingPlan, block_digits: int = 6):
+        codes = [code for code in plan.area_codes if 2 <= len(code) <= 4 and code.isascii() and code.isdigit()]
+        self.area_code = np.array([''] + codes, dtype=object)
+        self.region = np.array([''] + [plan.area_codes[code]['region'] for code in codes], dtype=object)
+        self.area_type = np.array([''] + [plan.area_codes[code]['type'] for code in codes], dtype=object)
+        
+        # Los códigos se asignan de menor a mayor longitud para que gane el más largo
+        self.area_slots = np.zeros(10 ** 4, dtype=np.int16)
+        for slot, code in sorted(enumerate(codes, start=1), key=lambda item: len(item[1])):
+            width = 10 ** (4 - len(code))
+            self.area_slots[int(code) * width:(int(code) + 1) * width] = slot
+        
+        self.operator = np.array([''] + list(plan.mobile_operators), dtype=object)
+        operator_index = {name: code for code, name in enumerate(self.operator)}
+        self.operator_starts = np.array(plan.operator_starts, dtype=np.int64)
+        self.operator_ends = np.array(plan.operator_ends, dtype=np.int64)
+        self.operator_codes = np.array([operator_index[name] for name in plan.operator_names], dtype=np.int16)
+        
+        self.block_size = 10 ** (NATIONAL_NUMBER_DIGITS - block_digits)
+        self.operator_blocks = np.zeros(10 ** block_digits, dtype=np.int16)
+        for start, end, code in zip(plan.operator_starts, plan.operator_ends, self.operator_codes):
+            start, end = max(start, 0), min(end, 10 ** NATIONAL_NUMBER_DIGITS - 1)
+            if start > end:
+                continue
+            first, last = -(-start // self.block_size), (end + 1) // self.block_size
+            self.operator_blocks[first:last] = code
+            # Los bloques de los extremos cubiertos en parte comparten operadores con otros intervalos
+            for block in {start // self.block_size, end // self.block_size}:
+                if not first <= block < last:
+                    self.operator_blocks[block] = _MIXED_BLOCK
+    
+    def lookup(self, numbers) -> Dict[str, np.ndarray]:
+        """Validez, área y operador de cada número nacional (array int64) solo con indexación"""
+        numbers = np.asarray(numbers, dtype=np.int64)
+        in_range = (numbers >= 10 ** (NATIONAL_NUMBER_DIGITS - 1)) & (numbers < 10 ** NATIONAL_NUMBER_DIGITS)
+        numbers = np.where(in_range, numbers, 0)
+        area = np.where(in_range, self.area_slots[numbers // 10 ** (NATIONAL_NUMBER_DIGITS - 4)], 0)
+        is_valid = area > 0
+        operator = np.where(is_valid, self.operator_blocks[numbers // self.block_size], 0).astype(np.int16)
+        
+        mixed = np.flatnonzero(operator == _MIXED_BLOCK)
+        if mixed.size:
+            values = numbers[mixed]
+            index = np.maximum(np.searchsorted(self.operator_starts, values, side='right') - 1, 0)
+            inside = (values >= self.operator_starts[index]) & (values <= self.operator_ends[index])
+            operator[mixed] = np.where(inside, self.operator_codes[index], 0)
+        return {'is_valid': is_valid, 'area': area, 'operator': operator}
+    
+    def is_valid(self, numbers) -> np.ndarray:
+        """Si cada número pertenece a un código de área conocido"""
+        numbers = np.asarray(numbers, dtype=np.int64)
+        in_range = (numbers >= 10 ** (NATIONAL_NUMBER_DIGITS - 1)) & (numbers < 10 ** NATIONAL_NUMBER_DIGITS)
+        return in_range & (self.area_slots[np.where(in_range, numbers, 0) // 10 ** (NATIONAL_NUMBER_DIGITS - 4)] > 0)
+
+# logging.basicConfig se llama una sola vez, no en cada instancia
+_logging_configured = False
+
+class ArgentinaPhoneNormalizer:
+    def __init__(self, cache_size: int = 0, profiling: bool = False, parser: str = 'regex',
+                 plan: Optional[NumberingPlan] = None):
+        self.setup_logging()
+        
+        # Analizador de números: 'regex' (patrones encadenados) o 'single_pass' (scan_number)
+        if parser not in PARSERS:
+            raise ValueError(f"Analizador desconocido: {parser}; opciones: {', '.join(PARSERS)}")
+        self.parser = parser
+        
+        # Caché LRU opcional de resultados, indexada por el número ya limpio (0 = desactivada)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        
+        # Filas recibidas y valores distintos normalizados por los lotes con deduplicate=True
+        self.dedup_stats = {'rows': 0, 'unique': 0}
+        
+        # Instrumentación opcional por etapa; desactivada no agrega ningún costo
+        self.profiling = False
+        if profiling:
+            self.enable_profiling()
+        
+        # Plan de numeración compartido: las tablas y sus índices se referencian, no se copian
+        self.plan = plan if plan is not None else NumberingPlan.default()
+        for name in NumberingPlan.TABLES:
+            setattr(self, name, getattr(self.plan, name))
         
         # Patrones de validación
-        self.patterns = {
-            'with_country': re.compile(r'^(\+54|0054|54)[-\s]?(.+)$'),
-            'area_code': re.compile(r'^(\d{2,4})[-\s]?(.+)$'),
-            'mobile_format': re.compile(r'^9[-\s]?(\d{2,4})[-\s]?15[-\s]?(.+)$'),
-            'landline_format': re.compile(r'^(\d{2,4})[-\s]?(\d{6,8})$'),
-            'clean_number': re.compile(r'[^\d]'),
-        }
+        self.patterns = _PATTERNS
+        
+        # Tipos de área por bytes de la validación liviana; se arman al primer uso
+        self._check_tables = None
+        
+        # Pool de procesos de los lotes con workers; se reutiliza entre lotes hasta close()
+        self._pool = None
+        self._pool_key = None
     
     def setup_logging(self):
-        """Configurar sistema de logging"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
+        """Configurar sistema de logging (una sola vez por proceso)"""
+        global _logging_configured
+        if not _logging_configured:
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(levelname)s - %(message)s'
+            )
+            _logging_configured = True
         self.logger = logging.getLogger(__name__)
     
+    def __getstate__(self) -> Dict[str, any]:
+        # Las tablas que vienen del plan no se copian: se vuelven a tomar del plan al deserializar
+        state = self.__dict__.copy()
+        for name in NumberingPlan.TABLES:
+            if state.get(name) is getattr(self.plan, name):
+                del state[name]
+        state['_check_tables'] = None
+        state['_pool'] = state['_pool_key'] = None
+        return state
+    
+    def __setstate__(self, state: Dict[str, any]):
+        self.__dict__.update(state)
+        for name in NumberingPlan.TABLES:
+            if name not in self.__dict__:
+                setattr(self, name, getattr(self.plan, name))
+    
+    def enable_profiling(self):
+        """Activa los contadores de tiempo y llamadas por etapa y de errores por rama"""
+        self.profiling = True
+        self.reset_profile()
+        # Cada etapa se reemplaza en la instancia por un envoltorio que mide; la clase no cambia
+        for stage in PROFILED_STAGES:
+            on_result = self._count_result_errors if stage == 'normalize_phone_number' else None
+            setattr(self, stage, _TimedStage(getattr(type(self), stage).__get__(self), self._stage_stats[stage], on_result))
+    
+    def disable_profiling(self):
+        """Desactiva la instrumentación y restaura los métodos originales"""
+        self.profiling = False
+        for stage in PROFILED_STAGES:
+            self.__dict__.pop(stage, None)
+    
+    def reset_profile(self):
+        """Reinicia los contadores de etapas y errores"""
+        self._stage_stats = {stage: [0, 0.0] for stage in PROFILED_STAGES}
+        self._error_branch_counts = {branch: 0 for _, branch in ERROR_BRANCHES}
+        for stage in PROFILED_STAGES:
+            if isinstance(self.__dict__.get(stage), _TimedStage):
+                self.__dict__[stage].stats = self._stage_stats[stage]
+    
+    def profile_snapshot(self) -> Dict[str, any]:
+        """Devuelve una copia de los contadores: llamadas y tiempo acumulado por etapa, y errores por rama"""
+        if not self.profiling:
+            return {'enabled': False}
+        
+        stages = {}
+        for stage, (calls, seconds) in self._stage_stats.items():
+            stages[stage] = {
+                'calls': calls,
+                'total_seconds': round(seconds, 6),
+                'mean_us': round(seconds / calls * 1e6, 3) if calls else 0.0,
+            }
+        return {'enabled': True, 'stages': stages, 'error_branches': dict(self._error_branch_counts)}
+    
+    def _count_result_errors(self, result: Dict[str, any]):
+        """Cuenta los errores de un resultado individual"""
+        for error in result['errors']:
+            self._count_error(error)
+    
+    def _count_error(self, error: str, count: int = 1):
+        """Suma un error al contador de su rama según el prefijo del mensaje"""
+        for prefix, branch in ERROR_BRANCHES:
+            if error.startswith(prefix):
+                self._error_branch_counts[branch] += count
+                return
+    
+    def compile_area_codes(self):
+        """Compila self.area_codes en un trie de dígitos; llamar de nuevo si se reemplaza la tabla"""
+        self.area_code_trie = _compile_area_code_trie(self.area_codes)
+        self._check_tables = None
+    
+    def match_area_code(self, digits: str, min_local_length: int = 0) -> str:
+        """Devuelve el código de área más largo al inicio de digits que deja al menos min_local_length dígitos"""
+        node = self.area_code_trie
+        best = ''
+        max_length = len(digits) - min_local_length
+        for length, digit in enumerate(digits, start=1):
+            node = node.get(digit)
+            if node is None or length > max_length:
+                break
+            best = node.get('', best)
+        return best
+    
+    def area_code_info(self, area_code: str) -> Optional[Dict[str, str]]:
+        """Devuelve la información de un código de área exacto usando el trie"""
+        node = self.area_code_trie
+        for digit in area_code:
+            node = node.get(digit)
+            if node is None:
+                return None
+        return self.area_codes[node['']] if '' in node else None
+    
+    def compile_operator_ranges(self):
+        """Compila los rangos de self.mobile_operators en intervalos ordenados y disjuntos"""
+        self.operator_starts, self.operator_ends, self.operator_names = _compile_operator_ranges(self.mobile_operators)
+    
+    def operator_for_number(self, full_number: int) -> str:
+        """Busca el operador de un número completo (área + local) con bisect"""
+        index = bisect_right(self.operator_starts, full_number) - 1
+        if index >= 0 and full_number <= self.operator_ends[index]:
+            return self.operator_names[index]
+        return 'Unknown'
+    
     def clean_input(self, phone_number: str) -> str:
         """Limpia el input removiendo caracteres especiales"""
         if not phone_number or not isinstance(phone_number, str):
@@ -102,7 +1097,7 @@ class ArgentinaPhoneNormalizer:
         cleaned = phone_number.strip()
         
         # Remover caracteres comunes de formateo pero mantener + al inicio
-        cleaned = re.sub(r'[\(\)\-\s\.]', '', cleaned)
+        cleaned = self.patterns['formatting'].sub('', cleaned)
         
         return cleaned
     
@@ -136,18 +1131,15 @@ class ArgentinaPhoneNormalizer:
         
         # Verificar formato fijo
         if len(clean_number) >= 8:
-            # Intentar extraer código de área (2-4 dígitos)
-            for area_len in [2, 3, 4]:
-                potential_area = clean_number[:area_len]
-                potential_local = clean_number[area_len:]
-                
-                if potential_area in self.area_codes and len(potential_local) >= 6:
-                    return {
-                        'type': 'landline',
-                        'area_code': potential_area,
-                        'local_number': potential_local,
-                        'full_clean': clean_number
-                    }
+            # Código de área conocido más largo (2-4 dígitos) que deje al menos 6 dígitos locales
+            area_code = self.match_area_code(clean_number, 6)
+            if area_code:
+                return {
+                    'type': 'landline',
+                    'area_code': area_code,
+                    'local_number': clean_number[len(area_code):],
+                    'full_clean': clean_number
+                }
         
         # Si no coincide con patrones conocidos
         return {
@@ -157,14 +1149,64 @@ class ArgentinaPhoneNormalizer:
             'full_clean': clean_number
         }
     
+    def scan_number(self, cleaned: str) -> Optional[Dict[str, str]]:
+        """Descompone un número limpio como extract_country_code + identify_number_type, sin regex;
+        devuelve None si no es ASCII.
+        
+        No es un recorrido carácter por carácter: en Python ese bucle cuesta más que las pocas pasadas
+        en C de startswith, isdigit y translate. Tampoco quita el '0' troncal: la ruta de regex no lo
+        hace ('0221...' no es válido) y los resultados tienen que ser idénticos a los suyos.
+        """
+        if not cleaned.isascii():
+            return None
+        
+        # Prefijo de país, solo si queda algo después (igual que '.+' en with_country)
+        start = 0
+        for prefix in _COUNTRY_PREFIXES:
+            if cleaned.startswith(prefix):
+                if len(cleaned) > len(prefix):
+                    start = len(prefix)
+                break
+        number = cleaned[start:] if start else cleaned
+        digits = number if number.isdigit() else number.translate(_NON_DIGIT_TABLE)
+        
+        # Móvil: 9 + área de 4, 3 o 2 dígitos + 15 + resto, en el orden en que retrocede mobile_format
+        if number.startswith('9'):
+            for length in (4, 3, 2):
+                end = length + 1
+                if len(number) > end + 2 and number.startswith('15', end) and number[1:end].isdigit():
+                    return {
+                        'type': 'mobile',
+                        'area_code': number[1:end],
+                        'local_number': number[end + 2:],
+                        'full_clean': digits
+                    }
+        
+        # Fijo: código de área conocido más largo que deje al menos 6 dígitos locales
+        if len(digits) >= 8:
+            area_code = self.match_area_code(digits, 6)
+            if area_code:
+                return {
+                    'type': 'landline',
+                    'area_code': area_code,
+                    'local_number': digits[len(area_code):],
+                    'full_clean': digits
+                }
+        
+        return {
+            'type': 'unknown',
+            'area_code': '',
+            'local_number': digits,
+            'full_clean': digits
+        }
+    
     def validate_area_code(self, area_code: str, number_type: str) -> bool:
         """Valida si el código de área es correcto"""
         if not area_code:
             return False
         
-        if area_code in self.area_codes:
-            area_info = self.area_codes[area_code]
-            
+        area_info = self.area_code_info(area_code)
+        if area_info is not None:
             # Validar que el tipo coincida
             if number_type == 'mobile' and area_info['type'] not in ['mobile_landline', 'mobile']:
                 return False
@@ -177,16 +1219,7 @@ class ArgentinaPhoneNormalizer:
     
     def detect_mobile_operator(self, area_code: str, local_number: str) -> str:
         """Detecta el operador móvil basado en el número"""
-        if area_code == '11':  # CABA/GBA
-            # Construir número completo para análisis
-            full_number = int(f"11{local_number}")
-            
-            for operator, info in self.mobile_operators.items():
-                for min_range, max_range in info['ranges']:
-                    if min_range <= full_number <= max_range:
-                        return operator
-        
-        return 'Unknown'
+        return self.operator_for_number(int(f"{area_code}{local_number}"))
     
     def normalize_phone_number(self, phone_number: Union[str, int, float]) -> Dict[str, any]:
         """
@@ -218,73 +1251,242 @@ class ArgentinaPhoneNormalizer:
                 result['errors'].append("Número vacío o inválido")
                 return result
             
-            # Limpiar input
-            cleaned = self.clean_input(phone_str)
+            # Limpiar input; con single_pass las entradas ASCII se limpian con una tabla de traducción
+            if self.parser == 'single_pass':
+                cleaned = phone_str.translate(_FORMATTING_TABLE)
+                if not cleaned.isascii():
+                    cleaned = self.clean_input(phone_str)
+            else:
+                cleaned = self.clean_input(phone_str)
             if not cleaned:
                 result['errors'].append("Número inválido después de limpieza")
                 return result
             
+            if self.cache_size > 0:
+                self._normalize_cached(cleaned, result)
+            else:
+                self._normalize_cleaned(cleaned, result)
+            
+        except Exception as e:
+            result['errors'].append(f"Error de procesamiento: {str(e)}")
+            self.logger.error(f"Error procesando {phone_number}: {str(e)}")
+        
+        return result
+    
+    def _normalize_cleaned(self, cleaned: str, result: Dict[str, any]):
+        """Completa el resultado a partir del número ya limpio"""
+        number_info = self.scan_number(cleaned) if self.parser == 'single_pass' else None
+        if number_info is None:
             # Extraer código de país
             country_code, remaining = self.extract_country_code(cleaned)
             
             # Identificar tipo de número
             number_info = self.identify_number_type(remaining)
+        
+        # Validar código de área
+        if not self.validate_area_code(number_info['area_code'], number_info['type']):
+            result['errors'].append(f"Código de área inválido: {number_info['area_code']}")
+            return
+        
+        # Validar longitud del número local
+        local_length = len(number_info['local_number'])
+        if number_info['type'] == 'mobile' and local_length not in [7, 8]:
+            result['errors'].append(f"Longitud inválida para móvil: {local_length} dígitos")
+            return
+        
+        if number_info['type'] == 'landline' and local_length not in [6, 7, 8]:
+            result['errors'].append(f"Longitud inválida para fijo: {local_length} dígitos")
+            return
+        
+        # Si llegamos aquí, el número es válido
+        result['is_valid'] = True
+        result['type'] = number_info['type']
+        result['area_code'] = number_info['area_code']
+        result['local_number'] = number_info['local_number']
+        
+        # Obtener información adicional
+        area_info = self.area_code_info(number_info['area_code'])
+        if area_info is not None:
+            result['region'] = area_info['region']
             
-            # Validar código de área
-            if not self.validate_area_code(number_info['area_code'], number_info['type']):
-                result['errors'].append(f"Código de área inválido: {number_info['area_code']}")
-                return result
-            
-            # Validar longitud del número local
-            local_length = len(number_info['local_number'])
-            if number_info['type'] == 'mobile' and local_length not in [7, 8]:
-                result['errors'].append(f"Longitud inválida para móvil: {local_length} dígitos")
-                return result
-            
-            if number_info['type'] == 'landline' and local_length not in [6, 7, 8]:
-                result['errors'].append(f"Longitud inválida para fijo: {local_length} dígitos")
-                return result
-            
-            # Si llegamos aquí, el número es válido
-            result['is_valid'] = True
-            result['type'] = number_info['type']
-            result['area_code'] = number_info['area_code']
-            result['local_number'] = number_info['local_number']
-            
-            # Obtener información adicional
-            if number_info['area_code'] in self.area_codes:
-                area_info = self.area_codes[number_info['area_code']]
-                result['region'] = area_info['region']
-                
-                # Detectar operador para móviles
-                if number_info['type'] == 'mobile':
-                    result['operator'] = self.detect_mobile_operator(
-                        number_info['area_code'], 
-                        number_info['local_number']
-                    )
-                else:
-                    result['operator'] = 'Landline'
-            
-            # Generar formatos normalizados
+            # Detectar operador para móviles
             if number_info['type'] == 'mobile':
-                result['format_e164'] = f"+549{result['area_code']}{result['local_number']}"
-                result['format_national'] = f"15-{result['area_code']}-{result['local_number']}"
-                result['format_international'] = f"+54 9 {result['area_code']} {result['local_number']}"
+                result['operator'] = self.detect_mobile_operator(
+                    number_info['area_code'], 
+                    number_info['local_number']
+                )
+            else:
+                result['operator'] = 'Landline'
+        
+        # Generar formatos normalizados
+        self.format_result(result)
+    
+    def format_result(self, result: Dict[str, any]):
+        """Genera los formatos E.164, nacional e internacional de un resultado válido"""
+        if result['type'] == 'mobile':
+            result['format_e164'] = f"+549{result['area_code']}{result['local_number']}"
+            result['format_national'] = f"15-{result['area_code']}-{result['local_number']}"
+            result['format_international'] = f"+54 9 {result['area_code']} {result['local_number']}"
+        else:
+            result['format_e164'] = f"+54{result['area_code']}{result['local_number']}"
+            result['format_national'] = f"{result['area_code']}-{result['local_number']}"
+            result['format_international'] = f"+54 {result['area_code']} {result['local_number']}"
+        
+        result['normalized'] = result['format_e164']
+    
+    def validation_code(self, phone_number: Union[str, int, float]) -> int:
+        """Código de ERROR_CODES del número (0 = válido) sin armar el resultado completo"""
+        return self._check(phone_number)[0]
+    
+    def is_valid(self, phone_number: Union[str, int, float]) -> bool:
+        """Si el número es válido y no tuvo errores, sin buscar región ni operador ni armar formatos"""
+        return self._check(phone_number)[0] == 0
+    
+    def to_e164(self, phone_number: Union[str, int, float]) -> str:
+        """Formato E.164 del número, o '' si no es válido"""
+        code, mobile, area_code, local_number = self._check(phone_number)
+        if code:
+            return ''
+        return ((b'+549' if mobile else b'+54') + area_code + local_number).decode()
+    
+    def _check_area_types(self) -> Tuple[Dict[bytes, Tuple[bool, bool]], Dict[bytes, Tuple[int, ...]]]:
+        """(admite móvil, admite fijo) por código de área en bytes, y por cada prefijo de 4 dígitos los
+        largos de los códigos que lo empiezan, del más largo al más corto; se rehace si cambia self.area_codes"""
+        types = {}
+        for code, info in self.area_codes.items():
+            if 2 <= len(code) <= 4 and code.isascii() and code.isdigit():
+                types[code.encode()] = (info['type'] in ('mobile_landline', 'mobile'),
+                                        info['type'] in ('mobile_landline', 'landline'))
+        prefixes = {}
+        for code in sorted(types, key=len, reverse=True):
+            tail = 4 - len(code)
+            for prefix in ([code + b'%0*d' % (tail, i) for i in range(10 ** tail)] if tail else [code]):
+                prefixes[prefix] = prefixes.get(prefix, ()) + (len(code),)
+        self._check_tables = (self.area_codes, types, prefixes)
+        return types, prefixes
+    
+    def _check(self, phone_number: Union[str, int, float]) -> Tuple[int, bool, bytes, bytes]:
+        """Valida con las reglas de normalize_phone_number cortando en el primer error;
+        devuelve (código de error, es móvil, código de área, número local), estos dos en bytes ASCII"""
+        try:
+            if type(phone_number) is str:
+                phone_str = phone_number
+            elif isinstance(phone_number, (int, float)):
+                phone_str = str(int(phone_number))
             else:
-                result['format_e164'] = f"+54{result['area_code']}{result['local_number']}"
-                result['format_national'] = f"{result['area_code']}-{result['local_number']}"
-                result['format_international'] = f"+54 {result['area_code']} {result['local_number']}"
+                phone_str = str(phone_number) if phone_number else ""
+        except Exception:
+            return _CODE_PROCESSING_ERROR, False, b'', b''
+        
+        if phone_str.isdigit() and phone_str.isascii():
+            # Solo dígitos (p. ej. números leídos como int): no hay nada que limpiar ni puede ser 'nan'
+            cleaned = phone_str.encode()
+        else:
+            if not phone_str or phone_str.lower() in ('nan', 'none'):
+                return _CODE_EMPTY_INPUT, False, b'', b''
             
-            result['normalized'] = result['format_e164']
+            if not phone_str.isascii():
+                # Las entradas no ASCII pasan por las regex: se normalizan completas
+                result = self.normalize_phone_number(phone_number)
+                code = _error_code(result['errors'][0]) if result['errors'] else 0
+                return (code, result['type'] == 'mobile', result['area_code'].encode('utf-8'),
+                        result['local_number'].encode('utf-8'))
             
-        except Exception as e:
-            result['errors'].append(f"Error de procesamiento: {str(e)}")
-            self.logger.error(f"Error procesando {phone_number}: {str(e)}")
+            # En bytes: limpiar y separar prefijo y móvil con una sola regex cuesta menos que str.translate y el trie
+            cleaned = phone_str.encode().translate(None, _FORMATTING_DELETE)
+            if not cleaned:
+                return _CODE_EMPTY_AFTER_CLEANING, False, b'', b''
+        tables = self._check_tables
+        area_types, prefixes = (tables[1:] if tables is not None and tables[0] is self.area_codes
+                                else self._check_area_types())
         
-        return result
+        # El prefijo de país se quita si deja algo detrás, como en la regex; solo un resto que empieza con 9
+        # puede ser 9 + área + 15, así que los demás no necesitan la regex
+        skip = 3 if cleaned[:3] == b'+54' else 4 if cleaned[:4] == b'0054' else 2 if cleaned[:2] == b'54' else 0
+        if len(cleaned) > skip and cleaned[skip] != 57:
+            number = cleaned[skip:]
+        else:
+            area_code, local_number, number = _CHECK_PATTERN.fullmatch(cleaned).groups()
+        if number is None:
+            if not area_types.get(area_code, _NO_AREA)[0]:
+                return _CODE_INVALID_AREA_CODE, True, area_code, b''
+            if len(local_number) not in (7, 8):
+                return _CODE_INVALID_MOBILE_LENGTH, True, area_code, local_number
+            # normalize_phone_number falla al buscar el operador de un local con otros caracteres
+            if not local_number.isdigit():
+                return _CODE_PROCESSING_ERROR, True, area_code, local_number
+            return 0, True, area_code, local_number
+        
+        # Fijo: código de área conocido más largo que deje al menos 6 dígitos locales; con menos de
+        # 8 dígitos ningún código deja 6, así que basta buscar los primeros 4
+        digits = number if number.isdigit() else number.translate(None, _NON_DIGIT_DELETE)
+        for length in prefixes.get(digits[:4], ()):
+            if len(digits) - length >= 6:
+                area_code = digits[:length]
+                if not area_types[area_code][1]:
+                    return _CODE_INVALID_AREA_CODE, False, area_code, b''
+                local_number = digits[length:]
+                if len(local_number) > 8:
+                    return _CODE_INVALID_LANDLINE_LENGTH, False, area_code, local_number
+                return 0, False, area_code, local_number
+        return _CODE_INVALID_AREA_CODE, False, b'', b''
     
-    def batch_normalize(self, phone_numbers: List[Union[str, int, float]]) -> pd.DataFrame:
-        """Normaliza una lista de números telefónicos"""
+    def batch_validate(self, phone_numbers, e164: bool = False,
+                       workers: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Versión por lotes de validation_code/to_e164 con el motor vectorizado: devuelve is_valid y
+        error_code (índice en ERROR_CODES) y, con e164=True, format_e164; no arma las demás columnas"""
+        result = self.batch_normalize_compact(phone_numbers, workers)
+        label_codes = np.array([_error_code(label) if label is not None else 0 for label in result.error_labels],
+                               dtype=np.int8)
+        error_code = label_codes[result.error_codes]
+        output = {'is_valid': error_code == 0, 'error_code': error_code}
+        if e164:
+            output['format_e164'] = result.column('format_e164')
+        return output
+    
+    def _normalize_cached(self, cleaned: str, result: Dict[str, any]):
+        """Completa el resultado usando la caché LRU; las entradas guardan los errores como tupla"""
+        cached = self._cache.get(cleaned)
+        if cached is not None:
+            self._cache.move_to_end(cleaned)
+            self.cache_stats['hits'] += 1
+            result.update(cached)
+            result['errors'] = list(cached['errors'])
+            return
+        
+        self.cache_stats['misses'] += 1
+        self._normalize_cleaned(cleaned, result)
+        
+        entry = {key: value for key, value in result.items() if key != 'original'}
+        entry['errors'] = tuple(result['errors'])
+        self._cache[cleaned] = entry
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+            self.cache_stats['evictions'] += 1
+    
+    def cache_info(self) -> Dict[str, int]:
+        """Devuelve los contadores y el tamaño actual de la caché"""
+        return {**self.cache_stats, 'size': len(self._cache), 'max_size': self.cache_size}
+    
+    def clear_cache(self):
+        """Vacía la caché y reinicia sus contadores"""
+        self._cache.clear()
+        self.cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+    
+    def dedup_info(self) -> Dict[str, int]:
+        """Devuelve cuántas filas se resolvieron reutilizando el resultado de un duplicado"""
+        return {**self.dedup_stats, 'duplicates': self.dedup_stats['rows'] - self.dedup_stats['unique']}
+    
+    def batch_normalize(self, phone_numbers: List[Union[str, int, float]],
+                        vectorized: bool = True, workers: Optional[int] = None,
+                        deduplicate: bool = False) -> pd.DataFrame:
+        """Normaliza una lista de números telefónicos; workers > 1 reparte los bloques entre procesos
+        y deduplicate=True normaliza una sola vez cada valor repetido"""
+        if vectorized:
+            return self._results_to_dataframe(self.batch_normalize_compact(phone_numbers, workers, deduplicate))
+        if deduplicate:
+            return self._results_to_dataframe(self._normalize_deduplicated(phone_numbers))
+        
         results = []
         
         for i, number in enumerate(phone_numbers):
@@ -294,12 +1496,701 @@ class ArgentinaPhoneNormalizer:
             result = self.normalize_phone_number(number)
             results.append(result)
         
+        return self._results_to_dataframe(results)
+    
+    def _normalize_deduplicated(self, phone_numbers) -> List[Dict[str, any]]:
+        """Camino escalar agrupando por número limpio: cada grupo se normaliza una vez y se copia"""
+        results = []
+        seen = {}
+        unique = 0
+        for number in phone_numbers:
+            key = self.store_key(number)
+            if key is not None and key in seen:
+                result = dict(seen[key], original=number)
+                result['errors'] = list(result['errors'])
+            else:
+                result = self.normalize_phone_number(number)
+                unique += 1
+                if key is not None:
+                    seen[key] = result
+            results.append(result)
+        
+        self.dedup_stats['rows'] += len(results)
+        self.dedup_stats['unique'] += unique
+        return results
+    
+    def _results_to_dataframe(self, results) -> pd.DataFrame:
+        """Construye el DataFrame de salida a partir de un BatchResult o de una lista de resultados"""
+        if isinstance(results, BatchResult):
+            return results.to_dataframe(categorical=False) if len(results) else pd.DataFrame()
         return pd.DataFrame(results)
     
-    def validate_csv_file(self, file_path: str, phone_column: str) -> pd.DataFrame:
+    def tables_version(self) -> str:
+        """Huella de las tablas de códigos de área y operadores, para invalidar resultados guardados"""
+        if self.area_codes is self.plan.area_codes and self.mobile_operators is self.plan.mobile_operators:
+            return self.plan.version
+        return _tables_version(self.area_codes, self.mobile_operators)
+    
+    def open_store(self, path: str) -> NormalizationStore:
+        """Abre (o crea) un almacén de resultados para la versión actual de las tablas"""
+        store = NormalizationStore(path, self.tables_version())
+        if store.stats['invalidated']:
+            self.logger.info(f"Tablas modificadas: se invalidaron los resultados guardados en {path}")
+        return store
+    
+    def store_key(self, phone_number) -> Optional[str]:
+        """Número limpio que usa el almacén como clave; None si no corresponde guardarlo"""
+        # Misma conversión que normalize_phone_number; el resto del proceso depende solo del número limpio
+        # Las entradas que fallan al convertirse (inf, pd.NA) no tienen clave
+        try:
+            if phone_number.__class__ is str:
+                phone_str = phone_number
+            elif isinstance(phone_number, (int, float)):
+                phone_str = str(int(phone_number))
+            else:
+                phone_str = str(phone_number) if phone_number else ""
+        except Exception:
+            return None
+        
+        if not phone_str or phone_str.lower() in ['nan', 'none']:
+            return None
+        # En ASCII, borrar con la tabla de bytes da lo mismo que clean_input y cuesta mucho menos
+        if phone_str.isascii():
+            return phone_str.encode().translate(None, _FORMATTING_DELETE).decode() or None
+        return self.clean_input(phone_str) or None
+    
+    def store_key_hashes(self, phone_numbers) -> Tuple[np.ndarray, np.ndarray]:
+        """store_key de cada entrada resumida en 64 bits sin armar los strings limpios; devuelve
+        (resúmenes uint64, si la fila tiene clave).
+        
+        Cada resumen suma un valor al azar por (posición, byte) de la clave, así la misma clave da el
+        mismo resumen en cualquier bloque, tipo de columna o proceso, y dos claves distintas coinciden
+        con probabilidad 2**-64. Las entradas se convierten como en batch_normalize.
+        """
+        _init_engine_tables()
+        values = phone_numbers.to_numpy() if isinstance(phone_numbers, pd.Series) else phone_numbers
+        if isinstance(values, np.ndarray) and values.dtype in (np.dtype(np.int64), np.dtype(np.float64)):
+            return self._numeric_key_hashes(values)
+        values = values.tolist() if isinstance(values, np.ndarray) else list(values)
+        
+        body, lengths, state = self._encode_chunk(values, True)
+        starts = np.cumsum(lengths) - lengths
+        # Sin clave: NaN, vacío, 'nan' o 'none' (el OR con 0x20 pasa las letras a minúscula)
+        head = _head_words(_pad(body), starts, lengths) | _pack(b' ' * 8)
+        keyed = (state == 0) & ~(
+            (lengths == 0)
+            | ((lengths == 3) & ((head & _WORD_MASKS[3]) == _pack(b'nan')))
+            | ((lengths == 4) & ((head & _WORD_MASKS[4]) == _pack(b'none')))
+        )
+        
+        # Los caracteres de formato no son parte de la clave: la posición cuenta solo los que quedan
+        keep = ~_FORMATTING_BYTES[body]
+        cleaned = body[keep]
+        clean_len, clean_starts = _segment_counts(keep, starts, lengths)
+        positions = np.arange(len(cleaned)) - np.repeat(clean_starts, clean_len)
+        totals = np.concatenate([np.zeros(1, dtype=np.uint64),
+                                 np.cumsum(_KEY_HASH_TABLE[positions % KEY_HASH_POSITIONS, cleaned])])
+        hashes = totals[clean_starts + clean_len] - totals[clean_starts]
+        keyed &= clean_len > 0
+        
+        # Entradas no ASCII o que fallan al convertirse: clave por store_key
+        for i in np.flatnonzero(state == _STATE_FALLBACK).tolist():
+            key = self.store_key(values[i])
+            if key is not None:
+                hashes[i] = _hash_key_bytes(key.encode('utf-8'))
+                keyed[i] = True
+        return hashes, keyed
+    
+    def _numeric_key_hashes(self, numbers: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """store_key_hashes de una columna int64 o float64: la clave son los dígitos de str(int(x)) sin el signo"""
+        if numbers.dtype.kind == 'f':
+            keyed = np.isfinite(numbers)
+            exact = keyed & (np.abs(numbers) < 2.0 ** 62)
+            integers = np.where(exact, numbers, 0).astype(np.int64)
+        else:
+            keyed = np.ones(len(numbers), dtype=bool)
+            exact = numbers != np.iinfo(np.int64).min
+            integers = np.where(exact, numbers, 0)
+        
+        # Los dígitos como S19, alineados a la izquierda y rellenos con ceros; la posición es la columna
+        digits = np.abs(integers).astype('S19').view(np.uint8).reshape(len(numbers), 19)
+        contributions = _KEY_HASH_TABLE[np.arange(19), digits]
+        hashes = np.where(digits > 0, contributions, np.uint64(0)).sum(axis=1, dtype=np.uint64)
+        
+        for i in np.flatnonzero(keyed & ~exact).tolist():
+            hashes[i] = _hash_key_bytes(self.store_key(numbers[i].item()).encode('utf-8'))
+        return hashes, keyed
+    
+    def batch_normalize_incremental(self, phone_numbers, store: NormalizationStore,
+                                    workers: Optional[int] = None) -> pd.DataFrame:
+        """Como batch_normalize, pero reutiliza los resultados del almacén y solo normaliza los números nuevos"""
+        values = phone_numbers.tolist() if isinstance(phone_numbers, pd.Series) else list(phone_numbers)
+        n = len(values)
+        if n == 0:
+            return pd.DataFrame()
+        
+        keys = [self.store_key(value) for value in values]
+        codes, unique_keys = pd.factorize(np.array(keys, dtype=object), use_na_sentinel=True)
+        positions, found = store.lookup(unique_keys.tolist())
+        
+        in_store = np.zeros(len(unique_keys) + 1, dtype=bool)
+        in_store[positions] = True
+        # El código -1 (sin clave) cae en la última posición, siempre False
+        hit = in_store[codes]
+        pending = np.flatnonzero(~hit)
+        self.logger.info(f"Almacén: {n - len(pending)} resultados reutilizados, {len(pending)} por normalizar")
+        self.dedup_stats['rows'] += n
+        self.dedup_stats['unique'] += len(unique_keys) + int(np.count_nonzero(codes < 0))
+        
+        rows = codes[hit]
+        columns = {'original': values}
+        for column in NormalizationStore.STORED_COLUMNS + ['error']:
+            column_values = np.empty(n, dtype=bool if column == 'is_valid' else object)
+            if rows.size:
+                by_key = np.empty(len(unique_keys), dtype=object)
+                by_key[positions] = found[column]
+                column_values[hit] = by_key[rows]
+            columns[column] = column_values
+        error = columns.pop('error')
+        errors = [[message] if message is not None else [] for message in error.tolist()]
+        
+        if pending.size:
+            # Un representante por número limpio; las filas sin clave se normalizan cada una
+            pending_codes = codes[pending]
+            keyed = pending_codes >= 0
+            pending_keys, first = np.unique(pending_codes[keyed], return_index=True)
+            representatives = np.concatenate([pending[keyed][first], pending[~keyed]])
+            source = np.empty(len(pending), dtype=np.int64)
+            source[keyed] = np.searchsorted(pending_keys, pending_codes[keyed])
+            source[~keyed] = np.arange(len(pending_keys), len(representatives))
+            
+            fresh = self.batch_normalize([values[i] for i in representatives], workers=workers)
+            for column in NormalizationStore.STORED_COLUMNS:
+                columns[column][pending] = fresh[column].to_numpy()[source]
+            fresh_errors = fresh['errors'].tolist()
+            for i, j in zip(pending.tolist(), source.tolist()):
+                errors[i] = list(fresh_errors[j])
+            
+            # Los resultados con excepción no se guardan, igual que en la caché
+            new_items = {}
+            for i in pending.tolist():
+                key = keys[i]
+                if key is not None and key not in new_items and not any(
+                        error.startswith("Error de procesamiento") for error in errors[i]):
+                    new_items[key] = {column: columns[column][i] for column in RESULT_COLUMNS[1:-1]}
+                    new_items[key]['errors'] = errors[i]
+            store.put_many(list(new_items.items()))
+        
+        columns['errors'] = errors
+        return pd.DataFrame({column: columns[column] for column in RESULT_COLUMNS})
+    
+    def batch_normalize_compact(self, phone_numbers, workers: Optional[int] = None,
+                                deduplicate: bool = False) -> 'BatchResult':
+        """Normaliza una columna completa con operaciones de NumPy por bloques y devuelve un BatchResult"""
+        # Iterar una Series entrega escalares de Python; un ndarray entrega escalares de NumPy
+        python_scalars = isinstance(phone_numbers, pd.Series)
+        if python_scalars:
+            values = phone_numbers.to_numpy()
+            native = values.dtype in (np.dtype(object), np.dtype(np.int64), np.dtype(np.float64))
+            originals = values if native else phone_numbers.tolist()
+        elif isinstance(phone_numbers, (list, np.ndarray)):
+            values = originals = phone_numbers
+        else:
+            values = originals = list(phone_numbers)
+        
+        codes = None
+        if deduplicate:
+            codes, values = self._factorize_batch(values)
+            self.dedup_stats['rows'] += len(originals)
+            self.dedup_stats['unique'] += len(values)
+        
+        total = len(values)
+        lookup = self._build_batch_lookup()
+        if workers and workers > 1 and total > MIN_WORKER_CHUNK_SIZE:
+            chunks = self._normalize_chunks_parallel(values, python_scalars, workers)
+        else:
+            chunks = []
+            for start in range(0, total, BATCH_CHUNK_SIZE):
+                self.logger.info(f"Procesando número {start+1}/{total}")
+                block = values[start:start + BATCH_CHUNK_SIZE]
+                chunks.append(self._normalize_chunk(block, lookup, python_scalars))
+        
+        if codes is None:
+            result = BatchResult.from_chunks(originals, chunks, lookup)
+        else:
+            result = BatchResult.from_chunks(values, chunks, lookup).take(codes, originals)
+        if self.profiling:
+            self._count_batch_errors(result)
+        return result
+    
+    def _count_batch_errors(self, result: BatchResult):
+        """Suma los errores de un BatchResult a las estadísticas de instrumentación"""
+        counts = np.bincount(result.error_codes, minlength=len(result.error_labels))
+        for code, label in enumerate(result.error_labels):
+            if label is not None and counts[code]:
+                self._count_error(label, int(counts[code]))
+    
+    def normalize_text_file(self, file_path: str, batch_size: int = BATCH_CHUNK_SIZE,
+                            skip_batches: int = 0) -> Iterator[BatchResult]:
+        """Normaliza un archivo de texto con un número por línea y devuelve un BatchResult por bloque.
+        
+        El archivo se mapea en memoria y el motor vectorizado lee las líneas directamente de los bytes,
+        sin crear un string por línea; la columna 'original' se decodifica solo si se pide. Las líneas
+        vacías se ignoran y cada línea equivale a pasar su texto a normalize_phone_number. Los primeros
+        skip_batches bloques solo se recorren buscando los saltos de línea, sin normalizarlos, para
+        reanudar una corrida con los mismos bloques.
+        """
+        import mmap
+        
+        with open(file_path, 'rb') as f:
+            # mmap no admite archivos vacíos
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            # El mapeo se libera cuando ya no quedan resultados que lo referencien
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        _init_engine_tables()
+        lookup = self._build_batch_lookup()
+        buffer = np.frombuffer(mapped, dtype=np.uint8)
+        # Las páginas ya procesadas se devuelven al sistema; si se vuelven a leer, se recargan del archivo
+        release = getattr(mmap, 'MADV_DONTNEED', None) if hasattr(mapped, 'madvise') else None
+        total = 0
+        for batch, (starts, lengths) in enumerate(_line_batches(buffer, batch_size)):
+            if batch >= skip_batches:
+                self.logger.info(f"Procesando línea {total+1} de {file_path}")
+                yield self._normalize_lines(mapped, buffer, starts, lengths, lookup)
+            total += len(starts)
+            
+            processed = int(starts[-1] + lengths[-1]) // mmap.PAGESIZE * mmap.PAGESIZE
+            if release is not None and processed:
+                mapped.madvise(release, 0, processed)
+    
+    def _normalize_lines(self, mapped, buffer: np.ndarray, starts: np.ndarray, lengths: np.ndarray,
+                         lookup: Dict[str, any]) -> BatchResult:
+        """Normaliza un bloque de líneas del archivo mapeado"""
+        first = int(starts[0])
+        body = buffer[first:int(starts[-1] + lengths[-1])]
+        local_starts = starts - first
+        
+        # Las líneas con bytes fuera de ASCII se resuelven por el camino escalar
+        state = np.zeros(len(starts), dtype=np.int8)
+        non_ascii = _segment_counts(body >= 0x80, local_starts, lengths)[0] > 0
+        state[non_ascii] = _STATE_FALLBACK
+        
+        lines = _LineSlices(mapped, starts, lengths)
+        chunk = self._normalize_segments(lines, body, local_starts, np.where(non_ascii, 0, lengths),
+                                         state, lookup)
+        result = BatchResult.from_chunks(lines, [chunk], lookup)
+        if self.profiling:
+            self._count_batch_errors(result)
+        return result
+    
+    def _factorize_batch(self, values):
+        """Agrupa los valores idénticos; devuelve el índice de cada fila y los valores distintos"""
+        if not isinstance(values, np.ndarray):
+            values = np.array(values, dtype=object)
+        # Con escalares de NumPy en un array object, 1 == np.float32(1.0) pero se normalizan distinto
+        if values.dtype == object and not {value.__class__ for value in values} <= {str, int, float, bool, type(None)}:
+            return None, values
+        
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        # NaN y None quedan fuera de factorize; cada uno conserva su fila para dar el mismo error
+        missing = np.flatnonzero(codes < 0)
+        if missing.size:
+            codes[missing] = np.arange(len(uniques), len(uniques) + missing.size)
+            uniques = np.concatenate([np.asarray(uniques, dtype=values.dtype), values[missing]])
+        if len(uniques) < len(values):
+            self.logger.info(f"Deduplicación: {len(uniques)} valores distintos en {len(values)} filas")
+        return codes, np.asarray(uniques, dtype=values.dtype)
+    
+    def _normalize_chunks_parallel(self, values, python_scalars: bool, workers: int) -> List[Dict[str, any]]:
+        """Reparte los bloques en un pool de procesos y los devuelve en el orden original"""
+        total = len(values)
+        # Unos cuatro bloques por proceso para equilibrar la carga
+        chunk_size = min(BATCH_CHUNK_SIZE, max(MIN_WORKER_CHUNK_SIZE, -(-total // (workers * 4))))
+        starts = range(0, total, chunk_size)
+        self.logger.info(f"Procesando {total} números en {len(starts)} bloques con {workers} procesos")
+        
+        # Los bloques viajan como slices del array o lista original y vuelven como arrays codificados
+        from concurrent.futures.process import BrokenProcessPool
+        try:
+            return list(self._worker_pool(workers).map(
+                _normalize_chunk_in_worker,
+                (values[start:start + chunk_size] for start in starts),
+                [python_scalars] * len(starts),
+            ))
+        except BrokenProcessPool:
+            # Si murió un proceso el pool ya no sirve; el próximo lote arma uno nuevo
+            self.close()
+            raise
+    
+    def _worker_pool(self, workers: int):
+        """Pool de procesos para los lotes; se arma una vez y se reutiliza mientras no cambien la cantidad
+        de procesos, el analizador ni las tablas, que cada proceso recibe al iniciarse"""
+        key = (workers, self.parser, self.tables_version())
+        if self._pool is not None and self._pool_key != key:
+            self.close()
+        if self._pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                             initargs=(self,))
+            self._pool_key = key
+        return self._pool
+    
+    def close(self):
+        """Cierra el pool de procesos de los lotes con workers, si se armó uno"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = self._pool_key = None
+    
+    def _build_batch_lookup(self) -> Dict[str, any]:
+        """Tablas de códigos de área y operadores para el motor vectorizado"""
+        # Cada código de 2 a 4 dígitos se codifica como int('1' + código), menor a 20000,
+        # y se ubica en una tabla directa; el slot 0 significa "sin código de área"
+        codes = [code for code in self.area_codes if 2 <= len(code) <= 4 and code.isascii() and code.isdigit()]
+        slots = np.zeros(20000, dtype=np.int64)
+        for slot, code in enumerate(codes, start=1):
+            slots[int('1' + code)] = slot
+        
+        info = [self.area_codes[code] for code in codes]
+        region_names = list(dict.fromkeys([''] + [area['region'] for area in info]))
+        return {
+            'slots': slots,
+            'code': np.array([''] + codes, dtype=object),
+            'code_text': np.array([''] + codes, dtype='U4'),
+            'region': np.array([''] + [area['region'] for area in info], dtype=object),
+            'region_names': region_names,
+            'region_code': np.array([0] + [region_names.index(area['region']) for area in info], dtype=np.int16),
+            'mobile_ok': np.array([False] + [area['type'] in ['mobile_landline', 'mobile'] for area in info]),
+            'landline_ok': np.array([False] + [area['type'] in ['mobile_landline', 'landline'] for area in info]),
+            'code_value': np.array([0] + [int(code) for code in codes], dtype=np.int64),
+            'operator': np.array(['', 'Landline', 'Unknown'] + list(self.mobile_operators), dtype=object),
+            'operator_starts': np.array(self.operator_starts, dtype=np.int64),
+            'operator_ends': np.array(self.operator_ends, dtype=np.int64),
+            'operator_codes': np.array([3 + list(self.mobile_operators).index(name) for name in self.operator_names],
+                                       dtype=np.int16),
+        }
+    
+    def _numeric_block(self, values) -> Optional[np.ndarray]:
+        """Array numérico del bloque si es un array de números o una lista solo de ints o solo de floats"""
+        if isinstance(values, np.ndarray):
+            return values if values.dtype.kind in 'biuf' else None
+        classes = {value.__class__ for value in values}
+        if classes == {float}:
+            return np.array(values, dtype=np.float64)
+        if classes == {int}:
+            try:
+                return np.array(values, dtype=np.int64)
+            except OverflowError:
+                return None
+        return None
+    
+    def _normalize_numeric(self, values, numbers: np.ndarray, lookup: Dict[str, any],
+                           python_scalars: bool) -> Dict[str, any]:
+        """Pipeline de normalize_phone_number para un bloque numérico con división entera y módulo sobre
+        el array: los dígitos nunca pasan a texto y los strings se arman recién al pedir cada columna"""
+        n = len(numbers)
+        state = np.zeros(n, dtype=np.int8)
+        kind = numbers.dtype.kind
+        
+        # Escalares de NumPy que no heredan de int/float siguen otra regla: str(x) if x else ""
+        if not python_scalars and (kind == 'b' or (kind == 'f' and numbers.dtype != np.float64)):
+            state[:] = _STATE_FALLBACK
+            integers = np.zeros(n, dtype=np.int64)
+        elif kind == 'f':
+            numbers = numbers.astype(np.float64, copy=False)
+            is_nan = np.isnan(numbers)
+            exact = np.isfinite(numbers) & (np.abs(numbers) < 2.0 ** 62)
+            state[is_nan] = _STATE_NAN
+            state[~is_nan & ~exact] = _STATE_FALLBACK
+            integers = np.where(exact, numbers, 0).astype(np.int64)
+        elif kind == 'u':
+            too_big = numbers > np.iinfo(np.int64).max
+            state[too_big] = _STATE_FALLBACK
+            integers = np.where(too_big, 0, numbers).astype(np.int64)
+        else:
+            integers = numbers.astype(np.int64)
+        
+        # clean_input quita el '-' del signo; 19 dígitos (o el mínimo de int64) no entran en las potencias
+        digits = np.abs(integers)
+        digit_len = np.searchsorted(_POWERS_OF_TEN, digits, side='right')
+        state[(state == 0) & ((digits < 0) | (digit_len >= len(_POWERS_OF_TEN)))] = _STATE_FALLBACK
+        digit_len = np.clip(digit_len, 1, len(_POWERS_OF_TEN) - 1)
+        errors = np.full(n, None, dtype=object)
+        errors[state == _STATE_NAN] = _NAN_ERROR
+        active = state == 0
+        
+        # str(0) es '0', pero un escalar entero de NumPy igual a 0 da "" (número vacío)
+        if not python_scalars and kind in 'iu':
+            empty = active & (integers == 0)
+            errors[empty] = "Número vacío o inválido"
+            active &= ~empty
+        
+        # extract_country_code: un entero no tiene ceros a la izquierda, así que solo puede empezar con '54'
+        country = (digit_len > 2) & (digits // _POWERS_OF_TEN[digit_len - 2] == 54)
+        rest_len = np.where(country, digit_len - 2, digit_len)
+        rest = digits % _POWERS_OF_TEN[rest_len]
+        
+        def leading(count):
+            """Primeros count dígitos del resto, con sus ceros a la izquierda (rest_len >= count)"""
+            return rest // _POWERS_OF_TEN[np.maximum(rest_len - count, 0)]
+        
+        # Formato móvil: 9 + área (2-4 dígitos, greedy) + 15 + resto
+        starts_nine = active & (leading(1) == 9)
+        mobile = np.zeros(n, dtype=bool)
+        area_len = np.zeros(n, dtype=np.int64)
+        area_key = np.ones(n, dtype=np.int64)
+        for length in (4, 3, 2):
+            head = leading(3 + length)
+            match = starts_nine & ~mobile & (rest_len > 3 + length) & (head % 100 == 15)
+            mobile |= match
+            area_len[match] = length
+            area_key[match] = 10 ** length + (head[match] // 100) % 10 ** length
+        
+        # Formato fijo: código de área conocido más largo (2 a 4 dígitos) con al menos 6 dígitos locales;
+        # la clave int('1' + código) conserva los ceros a la izquierda del resto
+        landline = np.zeros(n, dtype=bool)
+        candidates = active & ~mobile & (rest_len >= 8)
+        for length in (4, 3, 2):
+            key = 10 ** length + leading(length)
+            match = candidates & ~landline & (rest_len - length >= 6) & (lookup['slots'][np.clip(key, 0, 19999)] > 0)
+            landline |= match
+            area_len[match] = length
+            area_key[match] = key[match]
+        
+        # validate_area_code
+        recognized = mobile | landline
+        slot = lookup['slots'][np.clip(area_key, 0, 19999)]
+        type_ok = np.where(mobile, lookup['mobile_ok'][slot], lookup['landline_ok'][slot])
+        bad_area = active & ~(recognized & type_ok)
+        _mark_area_errors(errors, bad_area, area_key)
+        active &= ~bad_area
+        
+        # Longitud del número local
+        local_len = rest_len - np.where(mobile, area_len + 3, area_len)
+        active &= ~_mark_length_errors(errors, active, mobile, landline, local_len)
+        local_len = np.where(active, local_len, 0)
+        local = rest % _POWERS_OF_TEN[local_len]
+        
+        # Número local como S8, el formato compacto de BatchResult; a lo sumo 8 dígitos en las filas válidas
+        local_chars = np.zeros((n, 8), dtype=np.uint8)
+        for position in range(8):
+            exponent = local_len - 1 - position
+            digit = (local // _POWERS_OF_TEN[np.maximum(exponent, 0)]) % 10
+            local_chars[:, position] = np.where(exponent >= 0, digit + ord('0'), 0)
+        
+        # Operador móvil: número completo (área + local) buscado en la tabla de intervalos
+        operator = np.where(active, np.where(mobile, 2, 1), 0).astype(np.int16)
+        rows = np.flatnonzero(active & mobile)
+        if rows.size and lookup['operator_starts'].size:
+            full_number = lookup['code_value'][slot[rows]] * _POWERS_OF_TEN[local_len[rows]] + local[rows]
+            index = np.searchsorted(lookup['operator_starts'], full_number, side='right') - 1
+            inside = (index >= 0) & (full_number <= lookup['operator_ends'][np.maximum(index, 0)])
+            operator[rows[inside]] = lookup['operator_codes'][index[inside]]
+        
+        return {
+            'is_valid': active,
+            'type': np.where(active, np.where(mobile, _TYPE_MOBILE, _TYPE_LANDLINE), 0).astype(np.int8),
+            'area': np.where(active, slot, 0),
+            'operator': operator,
+            'local': local_chars.view('S8').ravel(),
+            'errors': errors,
+            'fallback': self._fallback_rows(values, state, python_scalars),
+        }
+    
+    def _encode_chunk(self, values, python_scalars: bool):
+        """Convierte un bloque de entradas a un buffer ASCII, igual que normalize_phone_number"""
+        n = len(values)
+        state = np.zeros(n, dtype=np.int8)
+        is_str = np.fromiter((value.__class__ is str for value in values), dtype=bool, count=n)
+        strings = values
+        if not is_str.all():
+            strings = list(values)
+            for i in np.flatnonzero(~is_str):
+                value = strings[i]
+                strings[i] = ""
+                try:
+                    if isinstance(value, (int, float)):
+                        if value != value:
+                            state[i] = _STATE_NAN
+                        else:
+                            strings[i] = str(int(value))
+                    else:
+                        strings[i] = str(value) if value else ""
+                except Exception:
+                    state[i] = _STATE_FALLBACK
+        
+        # Las filas con caracteres fuera de ASCII se resuelven por el camino escalar
+        joined = ''.join(strings)
+        encoded = joined.encode('utf-8')
+        if len(encoded) != len(joined):
+            non_ascii = np.fromiter((not text.isascii() for text in strings), dtype=bool, count=n)
+            state[non_ascii & (state == 0)] = _STATE_FALLBACK
+            strings = ['' if skip else text for text, skip in zip(strings, non_ascii)]
+            encoded = ''.join(strings).encode('ascii')
+        
+        lengths = np.fromiter(map(len, strings), dtype=np.int64, count=n)
+        return np.frombuffer(encoded, dtype=np.uint8), lengths, state
+    
+    def _normalize_chunk(self, values, lookup: Dict[str, any],
+                         python_scalars: bool = False) -> Dict[str, any]:
+        """Aplica el pipeline de normalización a un bloque guardado como buffer segmentado"""
+        _init_engine_tables()
+        # Columnas numéricas (int64/float64 de pandas): aritmética entera, sin pasar por texto
+        numbers = self._numeric_block(values)
+        if numbers is not None:
+            return self._normalize_numeric(values, numbers, lookup, python_scalars or numbers is not values)
+        body, lengths, state = self._encode_chunk(values, python_scalars)
+        return self._normalize_segments(values, body, np.cumsum(lengths) - lengths, lengths, state,
+                                        lookup, python_scalars)
+    
+    def _normalize_segments(self, values, body: np.ndarray, starts: np.ndarray, lengths: np.ndarray,
+                            state: np.ndarray, lookup: Dict[str, any],
+                            python_scalars: bool = False) -> Dict[str, any]:
+        """Pipeline vectorizado sobre los segmentos [start, start + length) de body; values[i] solo se
+        usa en las filas que se resuelven por el camino escalar"""
+        n = len(lengths)
+        active = state == 0
+        errors = np.full(n, None, dtype=object)
+        errors[state == _STATE_NAN] = _NAN_ERROR
+        
+        # Vacío, 'nan' o 'none' (el OR con 0x20 pasa las letras a minúscula)
+        head = _head_words(_pad(body), starts, lengths) | _pack(b' ' * 8)
+        empty = active & (
+            (lengths == 0)
+            | ((lengths == 3) & ((head & _WORD_MASKS[3]) == _pack(b'nan')))
+            | ((lengths == 4) & ((head & _WORD_MASKS[4]) == _pack(b'none')))
+        )
+        errors[empty] = "Número vacío o inválido"
+        active &= ~empty
+        
+        # clean_input: remover ( ) - . y espacios
+        keep = ~_FORMATTING_BYTES[body]
+        cleaned = body[keep]
+        clean_len, clean_starts = _segment_counts(keep, starts, lengths)
+        nothing_left = active & (clean_len == 0)
+        errors[nothing_left] = "Número inválido después de limpieza"
+        active &= ~nothing_left
+        
+        # extract_country_code: +54, 0054 o 54 seguido de al menos un carácter
+        cleaned_buffer = _pad(cleaned)
+        head = _head_words(cleaned_buffer, clean_starts, clean_len)
+        plus = ((head & _WORD_MASKS[3]) == _pack(b'+54')) & (clean_len > 3)
+        offset = np.where(plus, 3, 0)
+        offset[((head & _WORD_MASKS[4]) == _pack(b'0054')) & (clean_len > 4)] = 4
+        offset[((head & _WORD_MASKS[2]) == _pack(b'54')) & (clean_len > 2)] = 2
+        remaining_len = clean_len - offset
+        remaining = _head_words(cleaned_buffer, clean_starts + offset, remaining_len)
+        
+        # clean_number: dígitos del resto; el código de país aporta todos sus dígitos salvo el '+'
+        is_digit = _DIGIT_BYTES[cleaned]
+        digits = _pad(cleaned[is_digit])
+        digit_count, digit_starts = _segment_counts(is_digit, clean_starts, clean_len)
+        skipped = offset - plus
+        digit_starts = digit_starts + skipped
+        digit_len = digit_count - skipped
+        
+        # Formato móvil: 9 + área (2-4 dígitos, greedy) + 15 + resto
+        non_digit = _non_digit_bytes(remaining)
+        starts_nine = active & (_byte_at(remaining, 0) == ord('9'))
+        mobile = np.zeros(n, dtype=bool)
+        mobile_area_len = np.zeros(n, dtype=np.int64)
+        for area_len in (4, 3, 2):
+            area_bytes = _pack(b'\x00' + b'\x80' * area_len)
+            match = (
+                starts_nine & ~mobile
+                & ((non_digit & area_bytes) == 0)
+                & (((remaining >> np.uint64(8 * (1 + area_len))) & _WORD_MASKS[2]) == _pack(b'15'))
+                & (remaining_len > 3 + area_len)
+            )
+            mobile |= match
+            mobile_area_len[match] = area_len
+        
+        # Un local móvil con caracteres no numéricos sigue las reglas de int()
+        odd_local = active & mobile & (remaining_len > digit_len)
+        state[odd_local] = _STATE_FALLBACK
+        active &= ~odd_local
+        
+        # Formato fijo: código de área conocido más largo (2 a 4 dígitos) con al menos 6 dígitos locales
+        digit_head = _head_words(digits, digit_starts, digit_len)
+        landline_keys = _prefix_keys(digit_head)
+        landline = np.zeros(n, dtype=bool)
+        landline_area_len = np.zeros(n, dtype=np.int64)
+        candidates = active & ~mobile & (digit_len >= 8)
+        for area_len in (4, 3, 2):
+            found = lookup['slots'][np.clip(landline_keys[area_len], 0, 19999)] > 0
+            match = candidates & ~landline & found & (digit_len - area_len >= 6)
+            landline |= match
+            landline_area_len[match] = area_len
+        
+        # validate_area_code; en un móvil sin caracteres extra los dígitos coinciden con el resto
+        recognized = mobile | landline
+        area_len = np.where(mobile, mobile_area_len, landline_area_len)
+        area_keys = _prefix_keys(np.where(mobile, remaining >> np.uint64(8), digit_head))
+        area_key = np.select([area_len == 2, area_len == 3, area_len == 4], area_keys[2:], 1)
+        area_key = np.where(recognized, area_key, 1)
+        slot = lookup['slots'][np.clip(area_key, 0, 19999)]
+        type_ok = np.where(mobile, lookup['mobile_ok'][slot], lookup['landline_ok'][slot])
+        bad_area = active & ~(recognized & type_ok)
+        _mark_area_errors(errors, bad_area, area_key)
+        active &= ~bad_area
+        
+        # Longitud del número local
+        local_offset = np.where(mobile, area_len + 3, area_len)
+        local_len = digit_len - local_offset
+        active &= ~_mark_length_errors(errors, active, mobile, landline, local_len)
+        
+        # Número local: en las filas válidas tiene a lo sumo 8 dígitos
+        local_word = _head_words(digits, digit_starts + local_offset, np.where(active, local_len, 0))
+        
+        # Operador móvil: número completo (área + local) buscado en la tabla de intervalos
+        operator = np.where(active, np.where(mobile, 2, 1), 0).astype(np.int16)
+        rows = np.flatnonzero(active & mobile)
+        if rows.size and lookup['operator_starts'].size:
+            full_number = lookup['code_value'][slot[rows]]
+            for position in range(8):
+                digit = _byte_at(local_word[rows], position).astype(np.int64) - ord('0')
+                full_number = np.where(position < local_len[rows], full_number * 10 + digit, full_number)
+            index = np.searchsorted(lookup['operator_starts'], full_number, side='right') - 1
+            inside = (index >= 0) & (full_number <= lookup['operator_ends'][np.maximum(index, 0)])
+            operator[rows[inside]] = lookup['operator_codes'][index[inside]]
+        
+        return {
+            'is_valid': active,
+            'type': np.where(active, np.where(mobile, _TYPE_MOBILE, _TYPE_LANDLINE), 0).astype(np.int8),
+            'area': np.where(active, slot, 0),
+            'operator': operator,
+            'local': local_word.view('S8'),
+            'errors': errors,
+            'fallback': self._fallback_rows(values, state, python_scalars),
+        }
+    
+    def _fallback_rows(self, values, state: np.ndarray, python_scalars: bool) -> Dict[int, Dict[str, any]]:
+        """Normaliza una por una las filas que no encajan en la representación vectorizada"""
+        fallback = {}
+        for i in np.flatnonzero(state == _STATE_FALLBACK):
+            value = values[i]
+            if python_scalars and isinstance(value, np.generic):
+                value = value.item()
+            # Método de la clase: los errores del lote se cuentan una sola vez al final
+            fallback[int(i)] = type(self).normalize_phone_number(self, value)
+        
+        nan_count = int((state == _STATE_NAN).sum())
+        if nan_count:
+            self.logger.error(f"Error procesando {nan_count} valores NaN: {_NAN_ERROR}")
+        return fallback
+    
+    def validate_csv_file(self, file_path: str, phone_column: str,
+                          workers: Optional[int] = None) -> pd.DataFrame:
         """Procesa un archivo CSV con números telefónicos"""
         try:
-            df = pd.read_csv(file_path)
+            # De Parquet/Feather solo se lee la columna de teléfonos
+            if file_path.endswith('.parquet'):
+                df = pd.read_parquet(file_path, columns=[phone_column])
+            elif file_path.endswith(('.feather', '.arrow')):
+                df = pd.read_feather(file_path, columns=[phone_column])
+            else:
+                df = pd.read_csv(file_path)
             
             if phone_column not in df.columns:
                 raise ValueError(f"Columna '{phone_column}' no encontrada en el archivo")
@@ -307,7 +2198,7 @@ class ArgentinaPhoneNormalizer:
             self.logger.info(f"Procesando {len(df)} números del archivo {file_path}")
             
             # Normalizar números
-            normalized_results = self.batch_normalize(df[phone_column].tolist())
+            normalized_results = self.batch_normalize(df[phone_column], workers=workers)
             
             # Combinar con datos originales
             result_df = pd.concat([df, normalized_results], axis=1)
@@ -320,35 +2211,26 @@ class ArgentinaPhoneNormalizer:
     
     def generate_report(self, results_df: pd.DataFrame) -> Dict[str, any]:
         """Genera reporte de estadísticas de normalización"""
-        total_numbers = len(results_df)
-        valid_numbers = len(results_df[results_df['is_valid'] == True])
-        
-        report = {
-            'total_numbers': total_numbers,
-            'valid_numbers': valid_numbers,
-            'invalid_numbers': total_numbers - valid_numbers,
-            'validity_rate': (valid_numbers / total_numbers * 100) if total_numbers > 0 else 0,
-            'type_distribution': results_df['type'].value_counts().to_dict(),
-            'operator_distribution': results_df[results_df['is_valid']]['operator'].value_counts().to_dict(),
-            'region_distribution': results_df[results_df['is_valid']]['region'].value_counts().to_dict(),
-            'common_errors': [],
-            'processed_at': datetime.now().isoformat()
-        }
-        
-        # Analizar errores comunes
-        error_counts = {}
-        for errors in results_df['errors']:
-            if errors:  # Si hay errores
-                for error in errors:
-                    error_counts[error] = error_counts.get(error, 0) + 1
+        report = ReportAggregator().update(results_df).to_report()
         
-        report['common_errors'] = sorted(error_counts.items(), key=lambda x: x[1], reverse=True)
+        if self.profiling:
+            report['profile'] = self.profile_snapshot()
         
         return report
     
     def save_results(self, results_df: pd.DataFrame, output_path: str):
-        """Guarda resultados en archivo CSV"""
-        results_df.to_csv(output_path, index=False, encoding='utf-8')
+        """Guarda resultados en CSV, Parquet o Feather según la extensión"""
+        if output_path.endswith(('.parquet', '.feather', '.arrow')):
+            # Columnas repetitivas como categorías (dictionary encoding) y errors como lista real
+            columnar_df = results_df.astype({
+                column: 'category' for column in BatchResult.CATEGORICAL_COLUMNS if column in results_df
+            })
+            if output_path.endswith('.parquet'):
+                columnar_df.to_parquet(output_path, index=False)
+            else:
+                columnar_df.reset_index(drop=True).to_feather(output_path)
+        else:
+            results_df.to_csv(output_path, index=False, encoding='utf-8')
         self.logger.info(f"Resultados guardados en: {output_path}")
 
 def main():
@@ -0,0 +1,296 @@
+import argparse
+import contextlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer
+
+# Tamaños por defecto de cada corrida
+TAMANOS_DEFAULT = [10_000, 100_000]
+
+# Programas cuyo arranque en frío se mide en un proceso nuevo
+ARRANQUES = {
+    'normalize_phone_number': (
+        "from argentina_phone_normalizer import ArgentinaPhoneNormalizer; "
+        "ArgentinaPhoneNormalizer().normalize_phone_number('+54 9 11 3388-7576')"
+    ),
+    'import_procesar_llamadas': "import procesar_llamadas",
+}
+
+# Proporción de cada formato en los datos sintéticos (se normalizan para sumar 1)
+PROPORCIONES_DEFAULT = {
+    'movil_internacional': 0.20,
+    'movil_internacional_15': 0.10,
+    'movil_nacional': 0.15,
+    'movil_15': 0.10,
+    'fijo_caba': 0.15,
+    'fijo_provincia': 0.15,
+    'numerico': 0.05,
+    'basura': 0.07,
+    'nan': 0.03,
+}
+
+AREAS_PROVINCIA = ['221', '223', '261', '291', '297', '341', '342', '351', '381', '387']
+
+def _digitos(rng: random.Random, cantidad: int) -> str:
+    """Genera una cadena de dígitos al azar"""
+    return ''.join(rng.choice('0123456789') for _ in range(cantidad))
+
+GENERADORES: Dict[str, Callable[[random.Random], object]] = {
+    'movil_internacional': lambda rng: f"+54 9 11 {_digitos(rng, 4)}-{_digitos(rng, 4)}",
+    'movil_internacional_15': lambda rng: f"+54 9 11 15 {_digitos(rng, 4)}-{_digitos(rng, 4)}",
+    'movil_nacional': lambda rng: f"011 15-{_digitos(rng, 4)}-{_digitos(rng, 4)}",
+    'movil_15': lambda rng: f"15-{_digitos(rng, 4)}-{_digitos(rng, 4)}",
+    'fijo_caba': lambda rng: f"11-{_digitos(rng, 4)}-{_digitos(rng, 4)}",
+    'fijo_provincia': lambda rng: f"0{rng.choice(AREAS_PROVINCIA)}-{_digitos(rng, 3)}-{_digitos(rng, 4)}",
+    'numerico': lambda rng: int('11' + _digitos(rng, 8)),
+    'basura': lambda rng: ''.join(rng.choice('abcxyz-() 0123456789') for _ in range(rng.randint(0, 14))),
+    'nan': lambda rng: float('nan'),
+}
+
+def generar_numeros(cantidad: int, semilla: int = 42,
+                    proporciones: Optional[Dict[str, float]] = None) -> List[object]:
+    """Genera números argentinos sintéticos y reproducibles mezclando formatos según las proporciones"""
+    proporciones = proporciones or PROPORCIONES_DEFAULT
+    desconocidos = set(proporciones) - set(GENERADORES)
+    if desconocidos:
+        raise ValueError(f"Formatos desconocidos: {', '.join(sorted(desconocidos))}")
+    
+    rng = random.Random(semilla)
+    formatos = list(proporciones)
+    elegidos = rng.choices(formatos, weights=[proporciones[f] for f in formatos], k=cantidad)
+    return [GENERADORES[formato](rng) for formato in elegidos]
+
+def _rss_pico_mb() -> float:
+    """RSS máximo del proceso hasta el momento, en MB"""
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa KB; macOS informa bytes
+    return round(pico / (1024 * 1024 if platform.system() == 'Darwin' else 1024), 1)
+
+def _medicion(filas: int, segundos: float) -> Dict[str, float]:
+    """Arma las métricas comunes de una medición"""
+    return {
+        'filas': filas,
+        'segundos': round(segundos, 4),
+        'filas_por_segundo': round(filas / segundos, 1) if segundos > 0 else None,
+    }
+
+def _medir_en_hijo(medicion: Callable, argumentos: tuple, opciones: Dict[str, object]) -> Dict[str, float]:
+    """Corre una medición dentro del proceso aislado y le agrega su RSS máximo"""
+    logging.disable(logging.CRITICAL)
+    resultado = medicion(*argumentos, **opciones)
+    if 'omitido' not in resultado:
+        resultado['rss_pico_mb'] = _rss_pico_mb()
+    return resultado
+
+def medir_aislado(medicion: Callable, *argumentos, **opciones) -> Dict[str, float]:
+    """Corre una función medir_* en un proceso nuevo, así rss_pico_mb es el pico de esa medición
+    (intérprete, módulos y entrada incluidos) y no el de todo lo que se midió antes"""
+    # spawn y no fork: un proceso copiado arranca con el pico de memoria del padre
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context('spawn')) as pool:
+        return pool.submit(_medir_en_hijo, medicion, argumentos, opciones).result()
+
+def medir_normalize_phone_number(normalizer: ArgentinaPhoneNormalizer, numeros: List[object]) -> Dict[str, float]:
+    """Mide normalize_phone_number número por número, con latencias p50/p99"""
+    latencias = np.empty(len(numeros), dtype=np.int64)
+    inicio = time.perf_counter()
+    for i, numero in enumerate(numeros):
+        t0 = time.perf_counter_ns()
+        normalizer.normalize_phone_number(numero)
+        latencias[i] = time.perf_counter_ns() - t0
+    resultado = _medicion(len(numeros), time.perf_counter() - inicio)
+    resultado['latencia_p50_us'] = round(float(np.percentile(latencias, 50)) / 1000, 2)
+    resultado['latencia_p99_us'] = round(float(np.percentile(latencias, 99)) / 1000, 2)
+    return resultado
+
+def medir_is_valid(normalizer: ArgentinaPhoneNormalizer, numeros: List[object]) -> Dict[str, float]:
+    """Mide la validación liviana is_valid número por número"""
+    inicio = time.perf_counter()
+    for numero in numeros:
+        normalizer.is_valid(numero)
+    return _medicion(len(numeros), time.perf_counter() - inicio)
+
+def medir_batch_normalize(normalizer: ArgentinaPhoneNormalizer, numeros: List[object],
+                          **opciones) -> Dict[str, float]:
+    """Mide batch_normalize sobre la lista completa"""
+    inicio = time.perf_counter()
+    normalizer.batch_normalize(numeros, **opciones)
+    return _medicion(len(numeros), time.perf_counter() - inicio)
+
+def medir_batch_validate(normalizer: ArgentinaPhoneNormalizer, numeros: List[object]) -> Dict[str, float]:
+    """Mide batch_validate (validez y E.164) sobre la lista completa"""
+    inicio = time.perf_counter()
+    normalizer.batch_validate(numeros, e164=True)
+    return _medicion(len(numeros), time.perf_counter() - inicio)
+
+def medir_validate_csv_file(normalizer: ArgentinaPhoneNormalizer, archivo: str, filas: int) -> Dict[str, float]:
+    """Mide validate_csv_file sobre un CSV ya escrito"""
+    inicio = time.perf_counter()
+    normalizer.validate_csv_file(archivo, 'TELEFONO')
+    return _medicion(filas, time.perf_counter() - inicio)
+
+def medir_normalize_text_file(normalizer: ArgentinaPhoneNormalizer, archivo: str, filas: int) -> Dict[str, float]:
+    """Mide normalize_text_file sobre un TXT con un número por línea"""
+    inicio = time.perf_counter()
+    for _ in normalizer.normalize_text_file(archivo):
+        pass
+    return _medicion(filas, time.perf_counter() - inicio)
+
+def medir_indice_nacional(normalizer: ArgentinaPhoneNormalizer, cantidad: int, semilla: int) -> Dict[str, float]:
+    """Mide el índice precalculado del plan sobre números nacionales de 10 dígitos al azar"""
+    numeros = np.random.default_rng(semilla).integers(10 ** 9, 10 ** 10, cantidad)
+    indice = normalizer.plan.national_index()
+    inicio = time.perf_counter()
+    indice.lookup(numeros)
+    return _medicion(cantidad, time.perf_counter() - inicio)
+
+def medir_procesar_telefonos(archivo: str, filas: int, **opciones) -> Dict[str, float]:
+    """Mide el pipeline completo de procesar_llamadas.py en un directorio temporal"""
+    try:
+        import procesar_llamadas
+    except ImportError as e:
+        return {'omitido': f"No se pudo importar procesar_llamadas: {e}"}
+    
+    directorio_original = os.getcwd()
+    with tempfile.TemporaryDirectory() as directorio:
+        os.chdir(directorio)
+        try:
+            inicio = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                _, reporte = procesar_llamadas.procesar_telefonos(archivo, **opciones)
+            segundos = time.perf_counter() - inicio
+        finally:
+            os.chdir(directorio_original)
+    
+    if reporte is None:
+        return {'omitido': "procesar_telefonos no completó el procesamiento"}
+    return _medicion(filas, segundos)
+
+def medir_arranque(repeticiones: int = 5) -> Dict[str, Dict[str, float]]:
+    """Mide el tiempo de un proceso nuevo que importa el módulo y hace un trabajo mínimo"""
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    resultado = {}
+    for nombre, codigo in ARRANQUES.items():
+        tiempos = []
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            proceso = subprocess.run([sys.executable, '-c', codigo], cwd=directorio,
+                                     capture_output=True, text=True)
+            tiempos.append(time.perf_counter() - inicio)
+            if proceso.returncode != 0:
+                break
+        if proceso.returncode != 0:
+            resultado[nombre] = {'omitido': proceso.stderr.strip().splitlines()[-1]}
+        else:
+            resultado[nombre] = {
+                'segundos_min': round(min(tiempos), 4),
+                'segundos_mediana': round(float(np.median(tiempos)), 4),
+            }
+    return resultado
+
+def ejecutar_benchmark(tamanos: List[int] = None, semilla: int = 42,
+                       proporciones: Optional[Dict[str, float]] = None,
+                       pipeline: bool = True, arranque: bool = True) -> Dict[str, any]:
+    """Corre todas las mediciones para cada tamaño y devuelve un dict serializable a JSON"""
+    tamanos = tamanos or TAMANOS_DEFAULT
+    proporciones = proporciones or PROPORCIONES_DEFAULT
+    normalizer = ArgentinaPhoneNormalizer()
+    
+    # Los logs por número (NaN, errores) escribirían a consola y distorsionarían los tiempos
+    logging.disable(logging.CRITICAL)
+    try:
+        corridas = []
+        for tamano in tamanos:
+            numeros = generar_numeros(tamano, semilla, proporciones)
+            corrida = {'tamano': tamano}
+            corrida['normalize_phone_number'] = medir_aislado(medir_normalize_phone_number, normalizer, numeros)
+            corrida['normalize_phone_number_single_pass'] = medir_aislado(
+                medir_normalize_phone_number, ArgentinaPhoneNormalizer(parser='single_pass'), numeros)
+            corrida['is_valid'] = medir_aislado(medir_is_valid, normalizer, numeros)
+            corrida['batch_normalize'] = medir_aislado(medir_batch_normalize, normalizer, numeros)
+            corrida['batch_validate'] = medir_aislado(medir_batch_validate, normalizer, numeros)
+            corrida['batch_normalize_escalar'] = medir_aislado(medir_batch_normalize, normalizer, numeros,
+                                                               vectorized=False)
+            corrida['indice_nacional'] = medir_aislado(medir_indice_nacional, normalizer, tamano, semilla)
+            
+            with tempfile.TemporaryDirectory() as directorio:
+                archivo = os.path.join(directorio, 'llamadas.csv')
+                pd.DataFrame({'TELEFONO': numeros}).to_csv(archivo, index=False)
+                corrida['validate_csv_file'] = medir_aislado(medir_validate_csv_file, normalizer, archivo, tamano)
+                # El TXT no tiene NaN: cada línea no vacía es un número
+                lineas = [str(numero) for numero in numeros if numero == numero and str(numero)]
+                archivo_txt = os.path.join(directorio, 'llamadas.txt')
+                with open(archivo_txt, 'w', encoding='utf-8') as f:
+                    f.write('\n'.join(lineas) + '\n')
+                corrida['normalize_text_file'] = medir_aislado(medir_normalize_text_file, normalizer, archivo_txt,
+                                                               len(lineas))
+                if pipeline:
+                    corrida['procesar_telefonos'] = medir_aislado(medir_procesar_telefonos, archivo, tamano)
+            
+            corridas.append(corrida)
+    finally:
+        logging.disable(logging.NOTSET)
+    
+    return {
+        'fecha': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'plataforma': platform.platform(),
+        'semilla': semilla,
+        'proporciones': proporciones,
+        'arranque': medir_arranque() if arranque else None,
+        'corridas': corridas,
+    }
+
+def _parsear_proporciones(pares: List[str]) -> Dict[str, float]:
+    """Convierte argumentos formato=peso en un dict de proporciones"""
+    proporciones = {}
+    for par in pares:
+        formato, _, peso = par.partition('=')
+        proporciones[formato] = float(peso)
+    return proporciones
+
+def main():
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Benchmark del normalizador de números argentinos")
+    parser.add_argument('--tamanos', type=int, nargs='+', default=TAMANOS_DEFAULT,
+                        help="Cantidad de números por corrida")
+    parser.add_argument('--semilla', type=int, default=42, help="Semilla del generador sintético")
+    parser.add_argument('--proporcion', action='append', default=[], metavar='FORMATO=PESO',
+                        help=f"Peso de un formato; formatos: {', '.join(GENERADORES)}")
+    parser.add_argument('--sin-pipeline', action='store_true', help="No medir procesar_telefonos")
+    parser.add_argument('--sin-arranque', action='store_true', help="No medir el arranque en frío")
+    parser.add_argument('--salida', default=None, help="Archivo JSON de salida (por defecto stdout)")
+    args = parser.parse_args()
+    
+    proporciones = _parsear_proporciones(args.proporcion) if args.proporcion else None
+    resultado = ejecutar_benchmark(args.tamanos, args.semilla, proporciones, not args.sin_pipeline,
+                                   not args.sin_arranque)
+    
+    salida = json.dumps(resultado, indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            f.write(salida)
+        print(f"Resultados guardados en: {args.salida}")
+    else:
+        print(salida)
+
+if __name__ == "__main__":
+    main()
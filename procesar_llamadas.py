@@ -1,241 +1,1195 @@
 import pandas as pd
 import numpy as np
-from argentina_phone_normalizer import ArgentinaPhoneNormalizer
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer, NumberingPlan, ReportAggregator
 import json
+import os
+import sys
+import argparse
+import contextlib
+import csv
+import io
+import itertools
+import queue
+import threading
 from datetime import datetime
-import matplotlib.pyplot as plt
-import seaborn as sns
+from string import Formatter
 
-def procesar_telefonos():
-    """Procesa el archivo llamadas.csv y normaliza todos los números"""
+# Filas por bloque en el modo streaming
+CHUNK_SIZE = 50_000
+
+# Filas por bloque al recorrer la columna de un CSV para saber su tipo antes de leerlo por bloques
+FILAS_TIPO_COLUMNA = 1_000_000
+
+# Bytes que se leen por vez al cortar un CSV en bloques de filas
+BUFFER_CSV = 16 * 1024 * 1024
+
+# Lo que puede haber antes de una comilla que abre un campo: separador, fin de línea u otra comilla ("")
+INICIO_CAMPO_CSV = np.frombuffer(b',\r\n"', dtype=np.uint8)
+
+# Extensión de las salidas según el formato elegido (el TXT para el dialer se mantiene)
+FORMATOS_SALIDA = {'csv': '.csv', 'parquet': '.parquet', 'feather': '.feather'}
+
+# Salidas disponibles, relativas al directorio de salida; {ext} depende del formato elegido
+SALIDAS = {
+    'completo': 'reportes/telefonos_procesados_completo{ext}',
+    'validos': 'reportes/telefonos_validos{ext}',
+    'marcar': 'telefonos_para_marcar_argentina{ext}',
+    'marcar_txt': 'telefonos_para_marcar_argentina.txt',
+    'internacional': 'reportes/telefonos_formato_internacional{ext}',
+    'problemas': 'reportes/telefonos_con_problemas{ext}',
+    'reporte': 'reportes/reporte_procesamiento.json',
+    'graficos': 'reportes/graficos_procesamiento.png',
+}
+
+# Salidas que se generan si no se elige ninguna (los gráficos se piden aparte)
+SALIDAS_DEFAULT = [nombre for nombre in SALIDAS if nombre != 'graficos']
+
+DESCRIPCION_SALIDAS = {
+    'completo': 'Archivo completo',
+    'validos': 'Solo números válidos',
+    'marcar': 'Para marcar desde Argentina',
+    'marcar_txt': 'Lista TXT para marcar',
+    'internacional': 'Formato internacional',
+    'problemas': 'Números con problemas',
+    'reporte': 'Reporte detallado',
+    'graficos': 'Gráficos',
+}
+
+# Columnas categóricas que se guardan con dictionary encoding en Parquet/Feather
+COLUMNAS_DICCIONARIO = ['type', 'operator', 'region', 'tipo', 'operador']
+
+# Formato para marcar desde Argentina según el tipo: móviles 15 + área + local, fijos área + local.
+# Los campos son columnas de batch_normalize; los tipos sin plantilla propia usan la de 'landline'
+PLANTILLAS_MARCAR = {
+    'mobile': '15{area_code}{local_number}',
+    'landline': '{area_code}{local_number}',
+}
+
+ARCHIVO_GRAFICOS = SALIDAS['graficos']
+
+# Buffer de escritura de los TXT para el dialer
+BUFFER_TXT = 1 << 20
+
+# Bloques en espera entre etapas del pipeline (lector, normalización y cada escritor)
+PROFUNDIDAD_COLA = 4
+
+# Bloques entre dos guardados del punto de control
+BLOQUES_POR_PUNTO_CONTROL = 10
+
+# Columna de entrada por defecto; en las salidas se reemplaza por la columna elegida
+COLUMNA_TELEFONO = 'TELEFONO'
+
+COLUMNAS_VALIDOS = {
+    'TELEFONO': 'numero_original',
+    'normalized': 'numero_normalizado',
+    'type': 'tipo',
+    'operator': 'operador',
+    'region': 'region',
+    'format_e164': 'formato_internacional',
+    'format_national': 'formato_nacional'
+}
+
+def procesar_telefonos(archivo='llamadas.csv', chunksize=None, workers=None, formato='csv', almacen=None,
+                       plantillas=None, graficos=False, columna=COLUMNA_TELEFONO, salidas=None,
+                       directorio=None, salida_estandar=None, hilos=None, plan=None, punto_control=None,
+                       intervalo_control=BLOQUES_POR_PUNTO_CONTROL):
+    """Procesa el archivo llamadas.csv y normaliza todos los números.
+    
+    archivo '-' lee CSV de la entrada estándar; salidas elige qué archivos generar (por defecto
+    SALIDAS_DEFAULT) y salida_estandar manda una de ellas a la salida estándar en lugar de a un
+    archivo, con los mensajes de progreso por stderr. Con hilos=True cada salida se escribe en su
+    propio hilo y, por bloques, la lectura se superpone con la normalización; las salidas son las
+    mismas byte a byte que con hilos=False. Por defecto se usan hilos solo si os.cpu_count() > 1:
+    con un núcleo no hay nada que superponer y los cambios de contexto hacen la corrida alrededor de
+    un 6% más lenta. plan reemplaza el plan de numeración incorporado (NumberingPlan).
+    punto_control guarda el progreso cada intervalo_control bloques en ese archivo JSON para que, si
+    la corrida se corta, el mismo llamado siga desde ahí (implica el modo por bloques).
+    """
+    
+    if hilos is None:
+        hilos = _hay_varios_nucleos()
+    
+    try:
+        rutas = _rutas_salida(salidas, formato, directorio, salida_estandar, graficos)
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return None, None
+    
+    # Con la salida estándar ocupada por los datos, el progreso va a stderr
+    with contextlib.redirect_stdout(sys.stderr) if salida_estandar else contextlib.nullcontext():
+        if chunksize or punto_control:
+            return procesar_telefonos_streaming(archivo, chunksize or CHUNK_SIZE, workers, formato, almacen,
+                                                plantillas, columna=columna, rutas=rutas, hilos=hilos, plan=plan,
+                                                punto_control=punto_control, intervalo_control=intervalo_control)
+        return _procesar_completo(archivo, workers, almacen, plantillas, columna, rutas, hilos, plan)
+
+def _procesar_completo(archivo, workers, almacen, plantillas, columna, rutas, hilos=True, plan=None):
+    """Procesa el archivo completo en memoria y devuelve el DataFrame final y el reporte"""
     
     print("=== PROCESADOR DE TELEFONOS ARGENTINOS ===\n")
     
     # Inicializar normalizador
-    normalizer = ArgentinaPhoneNormalizer()
+    normalizer = ArgentinaPhoneNormalizer(plan=plan)
+    store = normalizer.open_store(almacen) if almacen else None
+    salidas = _Salidas(hilos)
     
     try:
         # Cargar archivo
-        print("1. Cargando archivo llamadas.csv...")
-        df = pd.read_csv('llamadas.csv')
+        print(f"1. Cargando archivo {_nombre_entrada(archivo)}...")
+        results_df = None
+        if archivo.endswith('.txt'):
+            # El TXT se normaliza mientras se lee del archivo mapeado
+            bloques = list(_normalizar_txt(normalizer, archivo, CHUNK_SIZE, columna, workers, store))
+            df = pd.concat([bloque for bloque, _ in bloques], ignore_index=True)
+            results_df = pd.concat([resultado for _, resultado in bloques], ignore_index=True)
+        else:
+            df = _leer_entrada(archivo, columna)
         
-        if 'TELEFONO' not in df.columns:
-            print("Error: No se encontró la columna 'TELEFONO' en el archivo")
-            return
+        if columna not in df.columns:
+            print(f"Error: No se encontró la columna '{columna}' en el archivo")
+            return None, None
         
         print(f"   Total números encontrados: {len(df)}")
         
         # Mostrar muestra de números
         print(f"\n2. Muestra de números originales:")
-        for i, numero in enumerate(df['TELEFONO'].head(10)):
+        for i, numero in enumerate(df[columna].head(10)):
             print(f"   {i+1:2d}. {numero}")
         
         # Procesar números
         print(f"\n3. Normalizando {len(df)} números telefónicos...")
         
-        results = []
-        processed = 0
-        
-        for i, phone in enumerate(df['TELEFONO']):
-            if i % 500 == 0:
-                print(f"   Progreso: {i}/{len(df)} ({i/len(df)*100:.1f}%)")
-            
-            result = normalizer.normalize_phone_number(phone)
-            results.append(result)
-            processed += 1
-        
-        print(f"   Completado: {processed}/{len(df)} números procesados")
+        if workers and workers > 1:
+            print(f"   Usando {workers} procesos")
         
         # Crear DataFrame con resultados
-        results_df = pd.DataFrame(results)
+        if results_df is None:
+            results_df = _normalizar(normalizer, df[columna], workers, store)
+        if store is not None:
+            print(f"   Almacén {almacen}: {store.stats['hits']} reutilizados, {store.stats['misses']} nuevos")
+        
+        print(f"   Completado: {len(results_df)}/{len(df)} números procesados")
         
         # Combinar con datos originales
         df_final = pd.concat([df.reset_index(drop=True), results_df], axis=1)
+        repetidos = _RepetidosEntrada(normalizer)
+        if 'reporte' in rutas:
+            repetidos.agregar(df[columna])
         
-        # Estadísticas generales
-        print(f"\n4. Estadísticas de normalización:")
+        # Todas las estadísticas en una sola pasada; alimentan la consola, el JSON y los gráficos
+        agregado = ReportAggregator().update(df_final)
+        if agregado.total == 0:
+            print("Error: El archivo no contiene números para procesar")
+            return None, None
         
-        total_numeros = len(df_final)
-        numeros_validos = len(df_final[df_final['is_valid'] == True])
-        numeros_invalidos = total_numeros - numeros_validos
+        _imprimir_estadisticas(agregado, 4)
         
-        print(f"   Total números: {total_numeros}")
-        print(f"   Números válidos: {numeros_validos} ({numeros_validos/total_numeros*100:.1f}%)")
-        print(f"   Números inválidos: {numeros_invalidos} ({numeros_invalidos/total_numeros*100:.1f}%)")
+        # Guardar archivos
+        print(f"\n7. Guardando resultados...")
+        _crear_directorios(rutas)
+        numeros_marcar_repetidos = _escribir_bloque(salidas, rutas, df_final, columna, plantillas,
+                                                    _ConjuntoEnteros())
+        salidas.terminar()
+        for nombre, ruta in rutas.items():
+            if ruta in salidas:
+                print(f"   ✓ {DESCRIPCION_SALIDAS[nombre]}: {ruta}")
+        if numeros_marcar_repetidos > 0 and rutas.keys() & {'marcar', 'marcar_txt'}:
+            print(f"     ({numeros_marcar_repetidos} números repetidos descartados del dialer)")
         
-        # Análisis de números válidos
-        if numeros_validos > 0:
-            df_validos = df_final[df_final['is_valid'] == True]
-            
-            print(f"\n5. Análisis de números válidos:")
-            
-            # Por tipo de número
-            tipos = df_validos['type'].value_counts()
-            print(f"   Distribución por tipo:")
-            for tipo, cantidad in tipos.items():
-                print(f"     {tipo}: {cantidad} ({cantidad/numeros_validos*100:.1f}%)")
-            
-            # Por operador
-            operadores = df_validos['operator'].value_counts()
-            print(f"\n   Distribución por operador:")
-            for operador, cantidad in operadores.items():
-                print(f"     {operador}: {cantidad} ({cantidad/numeros_validos*100:.1f}%)")
-            
-            # Por región
-            regiones = df_validos['region'].value_counts()
-            print(f"\n   Top 10 regiones:")
-            for region, cantidad in regiones.head(10).items():
-                print(f"     {region.replace('_', ' ')}: {cantidad}")
-        
-        # Análisis de errores
-        if numeros_invalidos > 0:
-            print(f"\n6. Análisis de números inválidos:")
-            
-            error_counts = {}
-            for errors in df_final['errors']:
-                if errors:
-                    for error in errors:
-                        error_counts[error] = error_counts.get(error, 0) + 1
-            
-            print(f"   Errores más frecuentes:")
-            for error, count in sorted(error_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
-                print(f"     {error}: {count} números")
+        # Reporte JSON
+        reporte = _armar_reporte(agregado, _resumen_duplicados(repetidos, agregado.valid, numeros_marcar_repetidos))
+        _guardar_reporte(reporte, rutas)
+        if 'reporte' in rutas:
+            print(f"   ✓ Reporte detallado: {rutas['reporte']}")
         
-        # Crear carpeta de reportes si no existe
-        import os
-        os.makedirs('reportes', exist_ok=True)
+        # Crear visualizaciones
+        if 'graficos' in rutas:
+            print(f"\n8. Generando gráficos...")
+            crear_graficos_desde_agregado(agregado, rutas['graficos'])
         
-        # Guardar archivos
-        print(f"\n7. Guardando resultados...")
+        _imprimir_resumen(agregado, rutas, salidas, detallado=True)
+        
+        return df_final, reporte
         
-        # Archivo completo
-        output_completo = 'reportes/telefonos_procesados_completo.csv'
-        df_final.to_csv(output_completo, index=False, encoding='utf-8')
-        print(f"   ✓ Archivo completo: {output_completo}")
-        
-        # Solo números válidos normalizados
-        if numeros_validos > 0:
-            df_validos_clean = df_validos[['TELEFONO', 'normalized', 'type', 'operator', 'region', 'format_e164', 'format_national']].copy()
-            df_validos_clean.rename(columns={
-                'TELEFONO': 'numero_original',
-                'normalized': 'numero_normalizado',
-                'type': 'tipo',
-                'operator': 'operador',
-                'region': 'region',
-                'format_e164': 'formato_internacional',
-                'format_national': 'formato_nacional'
-            }, inplace=True)
+    except FileNotFoundError:
+        print(f"❌ Error: No se encontró el archivo '{archivo}'")
+        print("   Asegúrate de que el archivo esté en el directorio actual.")
+        return None, None
+    except Exception as e:
+        print(f"❌ Error durante el procesamiento: {str(e)}")
+        return None, None
+    finally:
+        salidas.close()
+        normalizer.close()
+        if store is not None:
+            store.close()
+
+def _rutas_salida(salidas, formato, directorio, salida_estandar, graficos):
+    """Ruta de cada salida elegida; la que va a la salida estándar usa '-'"""
+    
+    salidas = list(salidas or (SALIDAS_DEFAULT if not salida_estandar else []))
+    if graficos and 'graficos' not in salidas:
+        salidas.append('graficos')
+    if salida_estandar and salida_estandar not in salidas:
+        salidas.append(salida_estandar)
+    
+    desconocidas = [nombre for nombre in salidas if nombre not in SALIDAS]
+    if desconocidas:
+        raise ValueError(f"Salidas desconocidas: {', '.join(desconocidas)}; opciones: {', '.join(SALIDAS)}")
+    if salida_estandar == 'graficos' or (salida_estandar and formato != 'csv'
+                                         and SALIDAS[salida_estandar].endswith('{ext}')):
+        raise ValueError("Solo las salidas CSV, TXT y JSON pueden ir a la salida estándar")
+    
+    ext = FORMATOS_SALIDA[formato]
+    rutas = {}
+    for nombre in SALIDAS:
+        if nombre not in salidas:
+            continue
+        ruta = SALIDAS[nombre].format(ext=ext)
+        rutas[nombre] = '-' if nombre == salida_estandar else os.path.join(directorio, ruta) if directorio else ruta
+    return rutas
+
+def _crear_directorios(rutas):
+    """Crea las carpetas de las salidas elegidas"""
+    
+    for ruta in rutas.values():
+        carpeta = os.path.dirname(ruta) if ruta != '-' else ''
+        if carpeta:
+            os.makedirs(carpeta, exist_ok=True)
+
+def _nombre_entrada(archivo):
+    """Nombre del archivo de entrada para los mensajes"""
+    
+    return 'la entrada estándar' if archivo == '-' else archivo
+
+def _abrir_salida_existente(ruta):
+    """Abre una salida CSV o TXT para seguir agregando al final, con las mismas opciones que al crearla"""
+    
+    opciones = {'buffering': BUFFER_TXT} if ruta.endswith('.txt') else {'newline': ''}
+    return open(ruta, 'a', encoding='utf-8', **opciones)
+
+def _abrir_texto(ruta, **opciones):
+    """Abre una salida de texto; '-' escribe en la salida estándar sin cerrarla al terminar"""
+    
+    if ruta == '-':
+        sys.__stdout__.flush()
+        return open(sys.__stdout__.fileno(), 'w', closefd=False, **opciones)
+    return open(ruta, 'w', **opciones)
+
+def _importar_pyarrow():
+    """Importa pyarrow, necesario solo para Parquet/Feather"""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Se requiere pyarrow para leer o escribir Parquet/Feather: pip install pyarrow")
+    return pyarrow
+
+def _leer_entrada(archivo, columna=COLUMNA_TELEFONO):
+    """Lee el archivo de entrada ('-' es CSV por la entrada estándar); de Parquet/Feather solo se lee la columna"""
+    if archivo == '-':
+        return pd.read_csv(sys.stdin)
+    if archivo.endswith('.parquet'):
+        _importar_pyarrow()
+        return pd.read_parquet(archivo, columns=[columna])
+    if archivo.endswith(('.feather', '.arrow')):
+        _importar_pyarrow()
+        return pd.read_feather(archivo, columns=[columna])
+    return pd.read_csv(archivo)
+
+def _leer_entrada_por_bloques(archivo, chunksize, columna=COLUMNA_TELEFONO, tipo=None, desde=0):
+    """Lee el archivo de entrada en bloques de chunksize filas como (DataFrame, byte donde termina el bloque).
+    
+    En un CSV, desde sigue a partir del final de un bloque ya leído sin volver a leer lo anterior y tipo es
+    el de la columna (ver _tipo_columna); Parquet y Feather no tienen byte y saltean desde bloques.
+    """
+    if archivo.endswith(('.parquet', '.feather', '.arrow')):
+        pa = _importar_pyarrow()
+        if archivo.endswith('.parquet'):
+            lotes = pa.parquet.ParquetFile(archivo).iter_batches(batch_size=chunksize, columns=[columna])
+        else:
+            # Feather se abre mapeado en memoria y se recorre lote por lote
+            lector = pa.ipc.open_file(pa.memory_map(archivo))
+            lotes = (
+                parte
+                for i in range(lector.num_record_batches)
+                for parte in pa.Table.from_batches([lector.get_batch(i).select([columna])]).to_batches(max_chunksize=chunksize)
+            )
+        for lote in itertools.islice(lotes, desde, None):
+            yield lote.to_pandas(), None
+        return
+    
+    # Todos los bloques con el tipo que tendría la columna leyendo el archivo entero, así se normalizan
+    # igual que en el modo completo; la entrada estándar no se puede releer y cada bloque infiere el suyo
+    if tipo is None and archivo != '-':
+        tipo = _tipo_columna(archivo, columna)
+    for bloque, fin in _cortar_csv(archivo, chunksize, desde):
+        df = pd.read_csv(io.BytesIO(bloque), dtype={columna: tipo} if tipo is not None else None)
+        # Un bloque de líneas vacías no tiene filas
+        if len(df):
+            yield df, fin
+
+def _cortar_csv(archivo, chunksize, desde=0):
+    """Corta un CSV en bloques de chunksize registros sin interpretarlos: cada uno como el encabezado más
+    sus registros en bytes, y el byte del archivo donde termina; con desde sigue a partir de ese byte.
+    
+    Las líneas vacías cuentan como registros, así los cortes dependen solo de los bytes y una corrida
+    reanudada corta igual que una sin cortes.
+    """
+    
+    with open(archivo, 'rb') if archivo != '-' else contextlib.nullcontext(sys.stdin.buffer) as f:
+        trozos = _trozos_csv(f)
+        primero = next(trozos, None)
+        if primero is None:
+            return
+        trozo, fines = primero
+        encabezado = trozo[:fines[0]]
+        if desde:
+            f.seek(desde)
+            trozos = _trozos_csv(f)
+            posicion = desde
+        else:
+            trozos = itertools.chain([(trozo[fines[0]:], [fin - fines[0] for fin in fines[1:]])], trozos)
+            posicion = len(encabezado)
+        
+        partes = []
+        registros = 0
+        for trozo, fines in trozos:
+            usado = 0
+            i = 0
+            while len(fines) - i >= chunksize - registros:
+                i += chunksize - registros
+                partes.append(trozo[usado:fines[i - 1]])
+                posicion += fines[i - 1] - usado
+                usado = fines[i - 1]
+                yield encabezado + b''.join(partes), posicion
+                partes = []
+                registros = 0
+            if usado < len(trozo):
+                partes.append(trozo[usado:])
+                posicion += len(trozo) - usado
+                registros += len(fines) - i
+        if partes:
+            yield encabezado + b''.join(partes), posicion
+
+def _trozos_csv(f):
+    """Lee un CSV abierto en binario, desde el comienzo de un registro, en trozos que terminan en un final
+    de registro; devuelve cada trozo con la posición siguiente a cada final de registro dentro de él"""
+    
+    pendiente = b''
+    while True:
+        datos = f.read(BUFFER_CSV)
+        pendiente += datos
+        fines = _fines_registro(pendiente)
+        if not datos:
+            # El último registro puede no tener salto de línea
+            if pendiente and (not fines or fines[-1] < len(pendiente)):
+                fines.append(len(pendiente))
+            if fines:
+                yield pendiente, fines
+            return
+        if fines:
+            yield pendiente[:fines[-1]], fines
+            pendiente = pendiente[fines[-1]:]
+
+def _fines_registro(datos):
+    """Posición siguiente al final de cada registro de datos, que empieza en un registro.
+    
+    Un salto de línea cierra un registro si antes hay una cantidad par de comillas, lo que vale mientras
+    cada comilla que abre esté al comienzo de un campo (o sea el escape ""). Si no, se recorre con el
+    módulo csv, que las interpreta como pandas; ahí el último registro puede estar incompleto y no se
+    devuelve.
+    """
+    
+    caracteres = np.frombuffer(datos, dtype=np.uint8)
+    comillas = np.flatnonzero(caracteres == ord('"'))
+    aperturas = comillas[::2]
+    if np.isin(caracteres[aperturas[aperturas > 0] - 1], INICIO_CAMPO_CSV).all():
+        saltos = np.flatnonzero(caracteres == ord('\n'))
+        return (saltos[np.searchsorted(comillas, saltos) % 2 == 0] + 1).tolist()
+    
+    lineas = datos.splitlines(keepends=True)
+    finales = list(itertools.accumulate(map(len, lineas)))
+    # latin-1 deja cada byte como un carácter: comillas, comas y saltos quedan donde estaban
+    registros = csv.reader(linea.decode('latin-1') for linea in lineas)
+    return [finales[registros.line_num - 1] for _ in registros][:-1]
+
+def _tipo_columna(archivo, columna):
+    """Tipo que pandas infiere para la columna de un CSV leído entero, recorriendo solo esa columna.
+    
+    Como en la lectura completa, texto en cualquier fila vuelve texto a toda la columna (y ahí se corta
+    el recorrido), y decimales o celdas vacías vuelven decimales a los enteros. None si no está la columna.
+    """
+    
+    if columna not in pd.read_csv(archivo, nrows=0).columns:
+        return None
+    tipo = None
+    for bloque in pd.read_csv(archivo, usecols=[columna], chunksize=FILAS_TIPO_COLUMNA):
+        tipo_bloque = bloque[columna].dtype
+        if tipo_bloque.kind not in 'iuf':
+            return 'str'
+        tipo = tipo_bloque if tipo is None else np.result_type(tipo, tipo_bloque)
+    # Por nombre, para guardarlo en el punto de control
+    return tipo.name if tipo is not None else None
+
+def _tabla_arrow(df, diccionarios):
+    """Convierte un bloque a tabla Arrow con columnas categóricas codificadas y errors como lista"""
+    pa = _importar_pyarrow()
+    tabla = pa.Table.from_pandas(df, preserve_index=False)
+    for posicion, nombre in enumerate(tabla.column_names):
+        if nombre in COLUMNAS_DICCIONARIO:
+            # El diccionario solo crece entre bloques, así cada bloque lo extiende sin reemplazarlo
+            valores = df[nombre].astype(object)
+            diccionario = diccionarios.setdefault(nombre, [])
+            conocidos = set(diccionario)
+            diccionario.extend(valor for valor in pd.unique(valores.dropna()) if valor not in conocidos)
+            codigos = pd.Categorical(valores, categories=diccionario).codes
+            columna = pa.DictionaryArray.from_arrays(
+                pa.array(codigos, type=pa.int32(), mask=codigos < 0),
+                pa.array(diccionario, type=pa.string())
+            )
+        elif nombre == 'errors':
+            columna = tabla.column(posicion).cast(pa.list_(pa.string()))
+        else:
+            continue
+        tabla = tabla.set_column(posicion, nombre, columna)
+    return tabla
+
+class _EscritorArrow:
+    """Escritor incremental de Parquet o Feather que mantiene el esquema y los diccionarios del primer bloque"""
+    
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self.writer = None
+        self.esquema = None
+        self.diccionarios = {}
+    
+    def write(self, df):
+        pa = _importar_pyarrow()
+        tabla = _tabla_arrow(df, self.diccionarios)
+        if self.writer is None:
+            self.esquema = tabla.schema
+            if self.ruta.endswith('.parquet'):
+                self.writer = pa.parquet.ParquetWriter(self.ruta, self.esquema)
+            else:
+                opciones = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+                self.writer = pa.ipc.new_file(self.ruta, self.esquema, options=opciones)
+        self.writer.write_table(tabla.cast(self.esquema))
+    
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+def _escribir_tabla(archivos, ruta, df):
+    """Agrega un bloque a la salida (CSV, Parquet o Feather según la extensión), abriéndola la primera vez"""
+    
+    if ruta == '-' or ruta.endswith('.csv'):
+        if ruta not in archivos:
+            archivos[ruta] = _abrir_texto(ruta, encoding='utf-8', newline='')
+            df.to_csv(archivos[ruta], index=False)
+        else:
+            df.to_csv(archivos[ruta], index=False, header=False)
+        return
+    
+    if ruta not in archivos:
+        archivos[ruta] = _EscritorArrow(ruta)
+    archivos[ruta].write(df)
+
+def _escribir_lineas(handle, lineas):
+    """Escribe las líneas de una sola vez, una por renglón"""
+    
+    if len(lineas):
+        handle.write('\n'.join(lineas))
+        handle.write('\n')
+
+def _escribir_txt(archivos, ruta, lineas):
+    """Agrega líneas al TXT de salida, abriéndolo la primera vez"""
+    
+    if ruta not in archivos:
+        archivos[ruta] = _abrir_texto(ruta, encoding='utf-8', buffering=BUFFER_TXT)
+    _escribir_lineas(archivos[ruta], lineas)
+
+class _HiloEscritor:
+    """Hilo que ejecuta en orden las escrituras de un archivo; la cola acotada frena al productor si el disco no da abasto"""
+    
+    def __init__(self, nombre):
+        self.cola = queue.Queue(maxsize=PROFUNDIDAD_COLA)
+        self.error = None
+        self.hilo = threading.Thread(target=self._ejecutar, name=f"escritor {nombre}", daemon=True)
+        self.hilo.start()
+    
+    def _ejecutar(self):
+        while True:
+            tarea = self.cola.get()
+            if tarea is None:
+                return
+            # Después de un error se sigue vaciando la cola para no bloquear al productor
+            if self.error is None:
+                funcion, argumentos = tarea
+                try:
+                    funcion(*argumentos)
+                except BaseException as e:
+                    self.error = e
+            self.cola.task_done()
+    
+    def esperar(self):
+        """Espera a que se ejecuten las escrituras encoladas y propaga su error, si hubo"""
+        self.cola.join()
+        if self.error is not None:
+            raise self.error
+    
+    def enviar(self, funcion, argumentos):
+        if self.error is not None:
+            raise self.error
+        self.cola.put((funcion, argumentos))
+    
+    def terminar(self):
+        self.cola.put(None)
+        self.hilo.join()
+
+class _Salidas:
+    """Archivos de salida abiertos; con hilos=True cada archivo se escribe en su propio hilo, en paralelo"""
+    
+    def __init__(self, hilos=False):
+        self.archivos = {}
+        self.escritores = {} if hilos else None
+        self.error = None
+    
+    def __contains__(self, ruta):
+        return ruta in self.archivos
+    
+    def tabla(self, ruta, df):
+        self._enviar(ruta, _escribir_tabla, (self.archivos, ruta, df))
+    
+    def txt(self, ruta, lineas):
+        self._enviar(ruta, _escribir_txt, (self.archivos, ruta, lineas))
+    
+    def _enviar(self, ruta, funcion, argumentos):
+        if self.escritores is None:
+            funcion(*argumentos)
+            return
+        if ruta not in self.escritores:
+            self.escritores[ruta] = _HiloEscritor(ruta)
+        self.escritores[ruta].enviar(funcion, argumentos)
+    
+    def reanudar(self, posiciones):
+        """Trunca cada salida al tamaño guardado y la deja abierta para agregar, sin repetir encabezados"""
+        for ruta, tamano in posiciones.items():
+            _truncar(ruta, tamano)
+            self.archivos[ruta] = _abrir_salida_existente(ruta)
+    
+    def sincronizar(self):
+        """Espera las escrituras pendientes, baja los archivos a disco y devuelve el tamaño de cada uno"""
+        for escritor in (self.escritores or {}).values():
+            escritor.esperar()
+        posiciones = {}
+        for ruta, handle in self.archivos.items():
+            handle.flush()
+            os.fsync(handle.fileno())
+            posiciones[ruta] = os.fstat(handle.fileno()).st_size
+        return posiciones
+    
+    def close(self):
+        """Espera las escrituras pendientes y cierra los archivos; el primer error queda en self.error"""
+        for escritor in (self.escritores or {}).values():
+            escritor.terminar()
+            self.error = self.error or escritor.error
+        if self.escritores:
+            self.escritores.clear()
+        for handle in self.archivos.values():
+            handle.close()
+    
+    def terminar(self):
+        """Cierra las salidas y propaga el error de escritura, si hubo"""
+        self.close()
+        if self.error is not None:
+            raise self.error
+
+class _PuntoControl:
+    """Progreso de una corrida por bloques guardado en disco para reanudarla después de un corte.
+    
+    Cada intervalo bloques se bajan a disco las salidas y se guardan su tamaño, los contadores, los
+    bloques ya leídos y, en un CSV, el byte de la entrada donde terminan y el tipo de la columna; al
+    reanudar, las salidas se truncan a ese tamaño, así un bloque escrito a medias se descarta, y se sigue
+    desde el bloque siguiente (en un CSV, desde ese byte, sin releer lo anterior). Los números ya enviados
+    al dialer y los resúmenes de los números limpios ya vistos en la entrada se agregan como uint64 a
+    <punto de control>.marcados y .vistos para no reescribir los conjuntos completos en cada guardado.
+    """
+    
+    ANEXOS = ('marcados', 'vistos')
+    
+    def __init__(self, ruta, parametros, intervalo=BLOQUES_POR_PUNTO_CONTROL):
+        self.ruta = ruta
+        self.rutas_anexos = {nombre: f"{ruta}.{nombre}" for nombre in self.ANEXOS}
+        # Ida y vuelta por JSON para comparar con lo guardado (tuplas como listas, etc.)
+        self.parametros = json.loads(json.dumps(parametros))
+        self.intervalo = max(1, intervalo)
+        self.anexos = {}
+        self.estado = None
+        if os.path.exists(ruta):
+            with open(ruta, encoding='utf-8') as f:
+                self.estado = json.load(f)
+            if self.estado.get('parametros') != self.parametros:
+                raise ValueError(f"El punto de control {ruta} es de otra ejecución (cambió la entrada, el tamaño "
+                                 f"de bloque o las salidas); bórralo para empezar de cero")
+    
+    def reanudar(self, salidas, agregado, repetidos, numeros_marcados):
+        """Restaura salidas y contadores del último guardado; devuelve (bloques ya procesados, posición en la
+        entrada, repetidos del dialer)"""
+        carpeta = os.path.dirname(self.ruta)
+        if carpeta:
+            os.makedirs(carpeta, exist_ok=True)
+        if self.estado is None:
+            for nombre, ruta in self.rutas_anexos.items():
+                self.anexos[nombre] = open(ruta, 'wb')
+            return 0, {}, 0
+        
+        estado = self.estado
+        salidas.reanudar(estado['posiciones'])
+        agregado.merge(ReportAggregator.from_dict(estado['agregado']))
+        repetidos.repetidas = estado['filas_entrada_repetidas']
+        conjuntos = {'marcados': numeros_marcados, 'vistos': repetidos.vistos}
+        for nombre, ruta in self.rutas_anexos.items():
+            _truncar(ruta, estado['anexos'][nombre])
+            conjuntos[nombre].agregar(np.fromfile(ruta, dtype=np.uint64))
+            self.anexos[nombre] = open(ruta, 'ab')
+        return estado['bloques'], estado['entrada'], estado['numeros_marcar_repetidos']
+    
+    def registrar(self, marcados, vistos):
+        """Agrega los números enviados al dialer (arrays) y los resúmenes nuevos de la entrada del último bloque"""
+        for nuevos in marcados:
+            nuevos.tofile(self.anexos['marcados'])
+        if vistos is not None:
+            vistos.tofile(self.anexos['vistos'])
+    
+    def guardar(self, bloques, entrada, salidas, agregado, repetidos, numeros_marcar_repetidos):
+        """Baja a disco las salidas y reemplaza el punto de control de forma atómica"""
+        anexos = {}
+        for nombre, handle in self.anexos.items():
+            handle.flush()
+            os.fsync(handle.fileno())
+            anexos[nombre] = os.fstat(handle.fileno()).st_size
+        estado = {
+            'parametros': self.parametros,
+            'bloques': bloques,
+            'entrada': entrada,
+            'filas': agregado.total,
+            'posiciones': salidas.sincronizar(),
+            'anexos': anexos,
+            'agregado': agregado.to_dict(),
+            'filas_entrada_repetidas': repetidos.repetidas,
+            'numeros_marcar_repetidos': numeros_marcar_repetidos,
+            'fecha': datetime.now().isoformat(),
+        }
+        temporal = self.ruta + '.tmp'
+        with open(temporal, 'w', encoding='utf-8') as f:
+            json.dump(estado, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, self.ruta)
+    
+    def close(self):
+        for handle in self.anexos.values():
+            handle.close()
+    
+    def terminar(self):
+        """Borra el punto de control al completar la corrida"""
+        self.close()
+        for ruta in (self.ruta, *self.rutas_anexos.values()):
+            if os.path.exists(ruta):
+                os.remove(ruta)
+
+def _truncar(ruta, tamano):
+    """Corta un archivo al tamaño guardado en el punto de control"""
+    
+    if not os.path.exists(ruta) or os.path.getsize(ruta) < tamano:
+        raise ValueError(f"{ruta} no coincide con el punto de control (falta o es más corto); "
+                         f"borra el punto de control para empezar de cero")
+    with open(ruta, 'r+b') as f:
+        f.truncate(tamano)
+
+def _parametros_control(archivo, chunksize, columna, formato, rutas, plantillas, normalizer):
+    """Lo que tiene que coincidir para reanudar: la entrada (tamaño y fecha), los bloques y las salidas"""
+    
+    estado = os.stat(archivo)
+    return {
+        'archivo': os.path.abspath(archivo),
+        'tamano': estado.st_size,
+        'modificado_ns': estado.st_mtime_ns,
+        'chunksize': chunksize,
+        'columna': columna,
+        'formato': formato,
+        'rutas': {nombre: os.path.abspath(ruta) for nombre, ruta in rutas.items()},
+        'plantillas': plantillas,
+        'tablas': normalizer.tables_version(),
+        # Los anexos guardan enteros de 64 bits; los de versiones anteriores eran texto
+        'anexos': 'uint64',
+    }
+
+def _hay_varios_nucleos():
+    """Con un solo núcleo los hilos solo agregan cambios de contexto"""
+    
+    return (os.cpu_count() or 1) > 1
+
+def _en_segundo_plano(elementos, profundidad=PROFUNDIDAD_COLA):
+    """Recorre un iterable en otro hilo y entrega sus elementos por una cola acotada"""
+    
+    cola = queue.Queue(maxsize=profundidad)
+    detener = threading.Event()
+    fin = object()
+    
+    def encolar(item):
+        # Si el consumidor deja de leer, el hilo no queda bloqueado en la cola llena
+        while not detener.is_set():
+            try:
+                cola.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def producir():
+        try:
+            for elemento in elementos:
+                if not encolar((elemento, None)):
+                    return
+            encolar((fin, None))
+        except BaseException as e:
+            encolar((fin, e))
+    
+    hilo = threading.Thread(target=producir, name="lector", daemon=True)
+    hilo.start()
+    try:
+        while True:
+            elemento, error = cola.get()
+            if elemento is fin:
+                if error is not None:
+                    raise error
+                return
+            yield elemento
+    finally:
+        detener.set()
+        hilo.join()
+
+def _aplicar_plantilla(df, plantilla):
+    """Arma una columna de texto concatenando los literales y columnas de la plantilla"""
+    
+    columna = np.full(len(df), '', dtype=object)
+    for literal, campo, especificacion, conversion in Formatter().parse(plantilla):
+        if literal:
+            columna = columna + literal
+        if campo is None:
+            continue
+        if especificacion or conversion:
+            raise ValueError(f"La plantilla solo admite campos simples: {{{campo}}}")
+        if campo not in df.columns:
+            raise ValueError(f"Campo desconocido en la plantilla: {campo}")
+        columna = columna + df[campo].astype(str).to_numpy(dtype=object)
+    return columna
+
+def formatear_para_marcar(df_validos, plantillas=None):
+    """Convierte los números válidos al formato del dialer, por tipo y sin recorrer fila por fila"""
+    
+    plantillas = {**PLANTILLAS_MARCAR, **(plantillas or {})}
+    numeros = np.full(len(df_validos), '', dtype=object)
+    tipos = df_validos['type'].to_numpy(dtype=object)
+    resto = np.ones(len(df_validos), dtype=bool)
+    for tipo, plantilla in plantillas.items():
+        if tipo == 'landline':
+            continue
+        filas = tipos == tipo
+        resto &= ~filas
+        if filas.any():
+            numeros[filas] = _aplicar_plantilla(df_validos[filas], plantilla)
+    if resto.any():
+        numeros[resto] = _aplicar_plantilla(df_validos[resto], plantillas['landline'])
+    return numeros.tolist()
+
+def _conteos_ordenados(contador):
+    """Convierte un Counter en una Series ordenada de mayor a menor, como value_counts"""
+    
+    return pd.Series(dict(contador.most_common()), dtype='int64')
+
+def _imprimir_estadisticas(agregado, paso):
+    """Muestra en consola las estadísticas de validez, tipos, operadores, regiones y errores"""
+    
+    total_numeros = agregado.total
+    numeros_validos = agregado.valid
+    numeros_invalidos = agregado.invalid
+    
+    print(f"\n{paso}. Estadísticas de normalización:")
+    print(f"   Total números: {total_numeros}")
+    print(f"   Números válidos: {numeros_validos} ({numeros_validos/total_numeros*100:.1f}%)")
+    print(f"   Números inválidos: {numeros_invalidos} ({numeros_invalidos/total_numeros*100:.1f}%)")
+    
+    # Análisis de números válidos
+    if numeros_validos > 0:
+        print(f"\n{paso + 1}. Análisis de números válidos:")
+        
+        print(f"   Distribución por tipo:")
+        for tipo, cantidad in agregado.types.most_common():
+            print(f"     {tipo}: {cantidad} ({cantidad/numeros_validos*100:.1f}%)")
+        
+        print(f"\n   Distribución por operador:")
+        for operador, cantidad in agregado.operators.most_common():
+            print(f"     {operador}: {cantidad} ({cantidad/numeros_validos*100:.1f}%)")
+        
+        print(f"\n   Top 10 regiones:")
+        for region, cantidad in agregado.regions.most_common(10):
+            print(f"     {region.replace('_', ' ')}: {cantidad}")
+    
+    # Análisis de errores
+    if numeros_invalidos > 0:
+        print(f"\n{paso + 2}. Análisis de números inválidos:")
+        print(f"   Errores más frecuentes:")
+        for error, count in agregado.errors.most_common(5):
+            print(f"     {error}: {count} números")
+
+def _armar_reporte(agregado, duplicados):
+    """Arma reporte_procesamiento.json a partir de los contadores acumulados"""
+    
+    return {
+        'fecha_procesamiento': datetime.now().isoformat(),
+        'total_numeros': agregado.total,
+        'numeros_validos': agregado.valid,
+        'numeros_invalidos': agregado.invalid,
+        'porcentaje_validez': round(agregado.valid/agregado.total*100, 2),
+        'distribucion_tipos': dict(agregado.types.most_common()),
+        'distribucion_operadores': dict(agregado.operators.most_common()),
+        'distribucion_regiones': dict(agregado.regions.most_common()),
+        'errores_frecuentes': agregado.errors.most_common(10),
+        'duplicados': duplicados
+    }
+
+def _resumen_duplicados(repetidos, numeros_validos, numeros_marcar_repetidos):
+    """Cuenta las filas repetidas en la entrada y los números descartados del dialer por repetidos"""
+    
+    return {
+        'filas_entrada_repetidas': repetidos.repetidas,
+        'numeros_marcar_repetidos': numeros_marcar_repetidos,
+        'numeros_para_marcar': numeros_validos - numeros_marcar_repetidos,
+    }
+
+def _normalizar(normalizer, telefonos, workers, store):
+    """Normaliza una columna una vez por valor distinto, reutilizando el almacén si hay uno"""
+    
+    if store is not None:
+        return normalizer.batch_normalize_incremental(telefonos, store, workers=workers)
+    return normalizer.batch_normalize(telefonos, workers=workers, deduplicate=True)
+
+def _columnas_validos(columna):
+    """Columnas de telefonos_validos, tomando el número original de la columna de entrada"""
+    
+    return {columna if origen == COLUMNA_TELEFONO else origen: destino for origen, destino in COLUMNAS_VALIDOS.items()}
+
+def _escribir_bloque(salidas, rutas, df_final, columna, plantillas, numeros_marcados, marcados_nuevos=None):
+    """Escribe un bloque en las salidas elegidas y devuelve cuántos números repetidos se descartaron del dialer.
+    
+    Lo que solo alimenta salidas no elegidas no se calcula. numeros_marcados es un _ConjuntoEnteros con
+    los números ya enviados al dialer (E.164 sin el '+'); si se pasa marcados_nuevos, se le agregan los
+    que entraron en este bloque.
+    """
+    
+    es_valido = (df_final['is_valid'] == True).to_numpy()
+    numeros_marcar_repetidos = 0
+    
+    if 'completo' in rutas:
+        salidas.tabla(rutas['completo'], df_final)
+    
+    if es_valido.any():
+        df_validos = df_final[es_valido]
+        
+        if 'validos' in rutas:
+            columnas = _columnas_validos(columna)
+            salidas.tabla(rutas['validos'], df_validos[list(columnas)].rename(columns=columnas))
+        
+        # El reporte también informa los repetidos, aunque no se genere el archivo para el dialer
+        if rutas.keys() & {'marcar', 'marcar_txt', 'reporte'}:
+            # El dialer recibe cada número una sola vez, también entre bloques: queda la primera fila
+            # de cada número que no estaba en numeros_marcados
+            numeros = df_validos['format_e164'].str.slice(1).astype(np.int64).to_numpy()
+            unicos, primeras = np.unique(numeros, return_index=True)
+            nuevos = numeros_marcados.agregar(unicos)
+            df_marcar_unicos = df_validos.iloc[np.sort(primeras[np.isin(unicos, nuevos, assume_unique=True)])]
+            numeros_marcar_repetidos = len(df_validos) - len(df_marcar_unicos)
+            if marcados_nuevos is not None:
+                marcados_nuevos.append(nuevos)
             
-            output_limpios = 'reportes/telefonos_validos.csv'
-            df_validos_clean.to_csv(output_limpios, index=False, encoding='utf-8')
-            print(f"   ✓ Solo números válidos: {output_limpios}")
-        
-        # Lista simple de números para llamar desde Argentina
-        if numeros_validos > 0:
-            # Formato para llamadas desde Argentina (sin +54)
-            numeros_para_marcar = []
+            if rutas.keys() & {'marcar', 'marcar_txt'}:
+                numeros_para_marcar = formatear_para_marcar(df_marcar_unicos, plantillas)
+                if 'marcar' in rutas:
+                    salidas.tabla(rutas['marcar'], pd.DataFrame({'TELEFONO_PARA_MARCAR': numeros_para_marcar}))
+                if 'marcar_txt' in rutas:
+                    salidas.txt(rutas['marcar_txt'], numeros_para_marcar)
+        
+        if 'internacional' in rutas:
+            salidas.tabla(rutas['internacional'],
+                          pd.DataFrame({'TELEFONO_INTERNACIONAL': df_validos['normalized'].tolist()}))
+    
+    if 'problemas' in rutas and not es_valido.all():
+        salidas.tabla(rutas['problemas'], df_final[~es_valido][[columna, 'errors']])
+    
+    return numeros_marcar_repetidos
+
+def _guardar_reporte(reporte, rutas):
+    """Escribe reporte_procesamiento.json si fue elegido"""
+    
+    if 'reporte' in rutas:
+        with _abrir_texto(rutas['reporte'], encoding='utf-8') as f:
+            json.dump(reporte, f, indent=2, ensure_ascii=False)
+
+def _imprimir_resumen(agregado, rutas, salidas, detallado=False):
+    """Muestra el resumen final y las salidas efectivamente generadas"""
+    
+    total_numeros = agregado.total
+    numeros_validos = agregado.valid
+    numeros_invalidos = agregado.invalid
+    
+    print(f"\n" + "="*50)
+    print(f"PROCESAMIENTO COMPLETADO")
+    print(f"="*50)
+    print(f"📊 Números procesados: {total_numeros}")
+    print(f"✅ Números válidos: {numeros_validos} ({numeros_validos/total_numeros*100:.1f}%)")
+    print(f"❌ Números inválidos: {numeros_invalidos} ({numeros_invalidos/total_numeros*100:.1f}%)")
+    
+    if detallado and numeros_validos > 0:
+        print(f"\n📱 Tipos encontrados:")
+        for tipo, cantidad in agregado.types.most_common():
+            print(f"   {tipo}: {cantidad}")
+        
+        print(f"\n🏢 Operadores encontrados:")
+        for operador, cantidad in agregado.operators.most_common():
+            print(f"   {operador}: {cantidad}")
+    
+    print(f"\n📁 Archivos generados:")
+    for nombre, ruta in rutas.items():
+        if ruta not in salidas and nombre not in ('reporte', 'graficos'):
+            continue
+        destino = 'salida estándar' if ruta == '-' else ruta
+        print(f"   • {destino}" + (" ⭐ PRINCIPAL PARA LLAMAR" if nombre == 'marcar' else ""))
+
+def _normalizar_txt(normalizer, archivo, chunksize, columna, workers, store, saltar=0):
+    """Normaliza un TXT con un número por línea leyendo los bytes del archivo mapeado en memoria.
+    
+    Devuelve cada bloque como (entrada, resultados), igual que las demás entradas ya normalizadas;
+    los primeros saltar bloques no se normalizan.
+    """
+    
+    if workers or store is not None:
+        print("   (TXT mapeado en memoria: no se usan --workers ni --almacen)")
+    for resultado in normalizer.normalize_text_file(archivo, chunksize, skip_batches=saltar):
+        results_df = resultado.to_dataframe(categorical=False)
+        yield pd.DataFrame({columna: results_df['original']}), results_df
+
+class _ConjuntoEnteros:
+    """Conjunto de enteros de 64 bits guardado en arrays ordenados de NumPy, 8 bytes por elemento.
+    
+    Los elementos nuevos de cada llamada forman un tramo ordenado y los tramos de tamaño parecido se
+    fusionan, así quedan O(log n) tramos para buscar y cada elemento se copia O(log n) veces.
+    """
+    
+    def __init__(self):
+        self.tramos = []
+    
+    def __len__(self):
+        return sum(len(tramo) for tramo in self.tramos)
+    
+    @property
+    def nbytes(self):
+        return sum(tramo.nbytes for tramo in self.tramos)
+    
+    def agregar(self, valores):
+        """Agrega los valores y devuelve, ordenados, los que no estaban"""
+        nuevos = np.unique(np.asarray(valores).view(np.uint64))
+        for tramo in self.tramos:
+            if not nuevos.size:
+                break
+            posiciones = np.minimum(np.searchsorted(tramo, nuevos), len(tramo) - 1)
+            nuevos = nuevos[tramo[posiciones] != nuevos]
+        if nuevos.size:
+            self.tramos.append(nuevos)
+            while len(self.tramos) > 1 and len(self.tramos[-2]) < 2 * len(self.tramos[-1]):
+                # Ordenar dos tramos ya ordenados con timsort es una fusión lineal
+                fusion = np.concatenate([self.tramos.pop(-2), self.tramos.pop()])
+                fusion.sort(kind='stable')
+                self.tramos.append(fusion)
+        return nuevos
+
+class _RepetidosEntrada:
+    """Filas de la entrada cuyo número limpio (la clave del almacén) ya apareció antes, en el mismo bloque
+    o en uno anterior, así el reporte da lo mismo procesando el archivo entero o por bloques.
+    
+    Cada número limpio distinto se guarda como su resumen de 64 bits (store_key_hashes) en un
+    _ConjuntoEnteros; las filas sin número (vacías o NaN) no cuentan como repetidas.
+    """
+    
+    def __init__(self, normalizer):
+        self.normalizer = normalizer
+        self.vistos = _ConjuntoEnteros()
+        self.repetidas = 0
+    
+    def agregar(self, telefonos):
+        """Suma las filas repetidas del bloque y devuelve los resúmenes que aparecen por primera vez"""
+        resumenes, con_clave = self.normalizer.store_key_hashes(telefonos)
+        resumenes = resumenes[con_clave]
+        nuevos = self.vistos.agregar(resumenes)
+        self.repetidas += len(resumenes) - len(nuevos)
+        return nuevos
+
+def procesar_telefonos_streaming(archivo='llamadas.csv', chunksize=CHUNK_SIZE, workers=None, formato='csv',
+                                 almacen=None, plantillas=None, graficos=False, columna=COLUMNA_TELEFONO,
+                                 rutas=None, hilos=None, plan=None, punto_control=None,
+                                 intervalo_control=BLOQUES_POR_PUNTO_CONTROL):
+    """Procesa el archivo por bloques, escribiendo las salidas a medida que avanza con memoria acotada.
+    
+    Con punto_control el progreso se guarda cada intervalo_control bloques y una corrida cortada se
+    reanuda desde el último guardado, con las mismas salidas que sin el corte.
+    """
+    
+    print("=== PROCESADOR DE TELEFONOS ARGENTINOS (STREAMING) ===\n")
+    
+    normalizer = ArgentinaPhoneNormalizer(plan=plan)
+    store = normalizer.open_store(almacen) if almacen else None
+    if rutas is None:
+        rutas = _rutas_salida(None, formato, None, None, graficos)
+    if hilos is None:
+        hilos = _hay_varios_nucleos()
+    
+    # Agregados acumulados entre bloques
+    agregado = ReportAggregator()
+    repetidos = _RepetidosEntrada(normalizer)
+    numeros_marcados = _ConjuntoEnteros()
+    numeros_marcar_repetidos = 0
+    salidas = _Salidas(hilos)
+    control = None
+    
+    try:
+        print(f"1. Leyendo {_nombre_entrada(archivo)} en bloques de {chunksize} filas...")
+        _crear_directorios(rutas)
+        
+        bloques_previos = 0
+        entrada = {}
+        if punto_control:
+            # Para reanudar hay que poder releer la entrada y truncar las salidas
+            if archivo == '-' or '-' in rutas.values() or formato != 'csv':
+                raise ValueError("El punto de control requiere leer de un archivo y escribir salidas CSV/TXT en archivos")
+            control = _PuntoControl(punto_control, _parametros_control(archivo, chunksize, columna, formato, rutas,
+                                                                       plantillas, normalizer), intervalo_control)
+            bloques_previos, entrada, numeros_marcar_repetidos = control.reanudar(salidas, agregado, repetidos,
+                                                                                  numeros_marcados)
+            if bloques_previos:
+                print(f"   Reanudando desde el punto de control: {bloques_previos} bloques "
+                      f"({agregado.total} filas) ya procesados")
+        
+        if archivo.endswith('.txt'):
+            bloques = _normalizar_txt(normalizer, archivo, chunksize, columna, workers, store, bloques_previos)
+            lector = ((df, results_df, None) for df, results_df in bloques)
+        elif archivo.endswith(('.parquet', '.feather', '.arrow')):
+            bloques = _leer_entrada_por_bloques(archivo, chunksize, columna, desde=bloques_previos)
+            lector = ((df, None, None) for df, _ in bloques)
+        else:
+            # Un CSV sigue desde el byte guardado, con el tipo de columna de la primera corrida
+            if 'tipo_columna' not in entrada and archivo != '-':
+                entrada['tipo_columna'] = _tipo_columna(archivo, columna)
+            bloques = _leer_entrada_por_bloques(archivo, chunksize, columna, entrada.get('tipo_columna'),
+                                                entrada.get('byte', 0))
+            lector = ((df, None, fin) for df, fin in bloques)
+        if hilos:
+            # El próximo bloque se lee mientras se normaliza el actual
+            lector = _en_segundo_plano(lector)
+        
+        for numero_bloque, (df, results_df, fin) in enumerate(lector, start=bloques_previos + 1):
+            if columna not in df.columns:
+                print(f"Error: No se encontró la columna '{columna}' en el archivo")
+                return None, None
             
-            for _, row in df_validos.iterrows():
-                if row['type'] == 'mobile':
-                    # Móviles: 15 + código área + número local
-                    numero_nacional = f"15{row['area_code']}{row['local_number']}"
-                else:
-                    # Fijos: código área + número local
-                    numero_nacional = f"{row['area_code']}{row['local_number']}"
-                
-                numeros_para_marcar.append(numero_nacional)
+            if numero_bloque == bloques_previos + 1:
+                print(f"\n2. Muestra de números originales:")
+                for i, numero in enumerate(df[columna].head(10)):
+                    print(f"   {i+1:2d}. {numero}")
+                print(f"\n3. Normalizando y guardando por bloques...")
             
-            # Guardar formato para marcar desde Argentina
-            df_marcar = pd.DataFrame({'TELEFONO_PARA_MARCAR': numeros_para_marcar})
-            output_marcar = 'telefonos_para_marcar_argentina.csv'
-            df_marcar.to_csv(output_marcar, index=False, encoding='utf-8')
-            print(f"   ✓ Para marcar desde Argentina: {output_marcar}")
+            if results_df is None:
+                results_df = _normalizar(normalizer, df[columna], workers, store)
+            df_final = pd.concat([df.reset_index(drop=True), results_df], axis=1)
             
-            # Guardar como TXT (uno por línea)
-            output_marcar_txt = 'telefonos_para_marcar_argentina.txt'
-            with open(output_marcar_txt, 'w', encoding='utf-8') as f:
-                for numero in numeros_para_marcar:
-                    f.write(f"{numero}\n")
-            print(f"   ✓ Lista TXT para marcar: {output_marcar_txt}")
+            agregado.update(df_final)
+            # Las filas repetidas de la entrada solo se informan en el reporte
+            vistos_nuevos = repetidos.agregar(df[columna]) if 'reporte' in rutas else None
+            marcados_nuevos = [] if control is not None else None
+            numeros_marcar_repetidos += _escribir_bloque(salidas, rutas, df_final, columna, plantillas,
+                                                         numeros_marcados, marcados_nuevos)
             
-            # También mantener formato internacional (por si acaso)
-            numeros_internacionales = df_validos['normalized'].tolist()
-            df_internacional = pd.DataFrame({'TELEFONO_INTERNACIONAL': numeros_internacionales})
-            output_internacional = 'reportes/telefonos_formato_internacional.csv'
-            df_internacional.to_csv(output_internacional, index=False, encoding='utf-8')
-            print(f"   ✓ Formato internacional: {output_internacional}")
-        
-        # Números problemáticos
-        if numeros_invalidos > 0:
-            df_problemas = df_final[df_final['is_valid'] == False][['TELEFONO', 'errors']].copy()
-            output_problemas = 'reportes/telefonos_con_problemas.csv'
-            df_problemas.to_csv(output_problemas, index=False, encoding='utf-8')
-            print(f"   ✓ Números con problemas: {output_problemas}")
+            print(f"   Bloque {numero_bloque}: {agregado.total} números procesados")
+            if fin is not None:
+                entrada['byte'] = fin
+            if control is not None:
+                control.registrar(marcados_nuevos, vistos_nuevos)
+                if numero_bloque % control.intervalo == 0:
+                    control.guardar(numero_bloque, entrada, salidas, agregado, repetidos, numeros_marcar_repetidos)
         
-        # Reporte JSON
-        reporte = {
-            'fecha_procesamiento': datetime.now().isoformat(),
-            'total_numeros': total_numeros,
-            'numeros_validos': numeros_validos,
-            'numeros_invalidos': numeros_invalidos,
-            'porcentaje_validez': round(numeros_validos/total_numeros*100, 2),
-            'distribucion_tipos': tipos.to_dict() if numeros_validos > 0 else {},
-            'distribucion_operadores': operadores.to_dict() if numeros_validos > 0 else {},
-            'distribucion_regiones': regiones.to_dict() if numeros_validos > 0 else {},
-            'errores_frecuentes': sorted(error_counts.items(), key=lambda x: x[1], reverse=True)[:10] if numeros_invalidos > 0 else []
-        }
+        if agregado.total == 0:
+            print("Error: El archivo no contiene números para procesar")
+            return None, None
         
-        output_reporte = 'reportes/reporte_procesamiento.json'
-        with open(output_reporte, 'w', encoding='utf-8') as f:
-            json.dump(reporte, f, indent=2, ensure_ascii=False)
-        print(f"   ✓ Reporte detallado: {output_reporte}")
+        _imprimir_estadisticas(agregado, 4)
+        if numeros_marcar_repetidos > 0:
+            print(f"\n   Números repetidos descartados del dialer: {numeros_marcar_repetidos}")
         
-        # Crear visualizaciones
-        print(f"\n8. Generando gráficos...")
-        crear_graficos(df_final, numeros_validos, numeros_invalidos)
-        
-        # Resumen final
-        print(f"\n" + "="*50)
-        print(f"PROCESAMIENTO COMPLETADO")
-        print(f"="*50)
-        print(f"📊 Números procesados: {total_numeros}")
-        print(f"✅ Números válidos: {numeros_validos} ({numeros_validos/total_numeros*100:.1f}%)")
-        print(f"❌ Números inválidos: {numeros_invalidos} ({numeros_invalidos/total_numeros*100:.1f}%)")
-        
-        if numeros_validos > 0:
-            print(f"\n📱 Tipos encontrados:")
-            for tipo, cantidad in tipos.items():
-                print(f"   {tipo}: {cantidad}")
-            
-            print(f"\n🏢 Operadores encontrados:")
-            for operador, cantidad in operadores.items():
-                print(f"   {operador}: {cantidad}")
-        
-        print(f"\n📁 Archivos generados:")
-        print(f"   • {output_completo}")
-        if numeros_validos > 0:
-            print(f"   • {output_limpios}")
-            print(f"   • {output_marcar} ⭐ PRINCIPAL PARA LLAMAR")
-            print(f"   • {output_marcar_txt}")
-            print(f"   • {output_internacional}")
-        if numeros_invalidos > 0:
-            print(f"   • {output_problemas}")
-        print(f"   • {output_reporte}")
-        print(f"   • reportes/graficos_procesamiento.png")
+        reporte = _armar_reporte(agregado, _resumen_duplicados(repetidos, agregado.valid, numeros_marcar_repetidos))
+        _guardar_reporte(reporte, rutas)
         
-        return df_final, reporte
+        if 'graficos' in rutas:
+            print(f"\n7. Generando gráficos...")
+            crear_graficos_desde_agregado(agregado, rutas['graficos'])
+        
+        salidas.terminar()
+        if control is not None:
+            control.terminar()
+        _imprimir_resumen(agregado, rutas, salidas)
+        
+        return None, reporte
         
     except FileNotFoundError:
-        print("❌ Error: No se encontró el archivo 'llamadas.csv'")
+        print(f"❌ Error: No se encontró el archivo '{archivo}'")
         print("   Asegúrate de que el archivo esté en el directorio actual.")
         return None, None
     except Exception as e:
         print(f"❌ Error durante el procesamiento: {str(e)}")
+        if control is not None and os.path.exists(control.ruta):
+            print(f"   El progreso quedó en {control.ruta}: vuelve a ejecutar el mismo comando para reanudar.")
         return None, None
+    finally:
+        salidas.close()
+        normalizer.close()
+        if control is not None:
+            control.close()
+        if store is not None:
+            store.close()
 
 def crear_graficos(df_final, numeros_validos, numeros_invalidos):
     """Crea gráficos del procesamiento"""
     
+    crear_graficos_desde_agregado(ReportAggregator().update(df_final))
+
+def crear_graficos_desde_agregado(agregado, ruta=ARCHIVO_GRAFICOS):
+    """Crea los gráficos a partir de los contadores acumulados"""
+    
+    crear_graficos_desde_conteos(_conteos_ordenados(agregado.types), _conteos_ordenados(agregado.operators),
+                                 _conteos_ordenados(agregado.regions), agregado.valid, agregado.invalid, ruta=ruta)
+
+def crear_graficos_desde_conteos(tipos, operadores, regiones, numeros_validos, numeros_invalidos, mostrar=False,
+                                 ruta=ARCHIVO_GRAFICOS):
+    """Crea gráficos del procesamiento a partir de los conteos ya agregados"""
+    
+    # matplotlib tarda en importarse; solo se carga cuando se piden gráficos
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("   ⚠️ matplotlib no está instalado: se omiten los gráficos")
+        return
+    
     plt.style.use('default')
     fig, axes = plt.subplots(2, 2, figsize=(15, 12))
     
@@ -251,9 +1205,6 @@ def crear_graficos(df_final, numeros_validos, numeros_invalidos):
     # 2. Distribución por tipo (solo válidos)
     ax2 = axes[0, 1]
     if numeros_validos > 0:
-        df_validos = df_final[df_final['is_valid'] == True]
-        tipos = df_validos['type'].value_counts()
-        
         colors_tipo = ['#3498db', '#9b59b6', '#f39c12']
         bars = ax2.bar(tipos.index, tipos.values, color=colors_tipo[:len(tipos)])
         ax2.set_title('Distribución por Tipo de Número', fontsize=14, fontweight='bold')
@@ -273,7 +1224,7 @@ def crear_graficos(df_final, numeros_validos, numeros_invalidos):
     # 3. Top operadores
     ax3 = axes[1, 0]
     if numeros_validos > 0:
-        operadores = df_validos['operator'].value_counts().head(5)
+        operadores = operadores.head(5)
         
         colors_op = ['#1abc9c', '#e67e22', '#8e44ad', '#2c3e50', '#d35400']
         bars = ax3.bar(operadores.index, operadores.values, color=colors_op[:len(operadores)])
@@ -294,7 +1245,7 @@ def crear_graficos(df_final, numeros_validos, numeros_invalidos):
     # 4. Top regiones
     ax4 = axes[1, 1]
     if numeros_validos > 0:
-        regiones = df_validos['region'].value_counts().head(5)
+        regiones = regiones.head(5)
         
         colors_reg = ['#27ae60', '#f1c40f', '#e74c3c', '#3498db', '#9b59b6']
         bars = ax4.barh(regiones.index, regiones.values, color=colors_reg[:len(regiones)])
@@ -316,9 +1267,12 @@ def crear_graficos(df_final, numeros_validos, numeros_invalidos):
         ax4.set_title('Top 5 Regiones', fontsize=14, fontweight='bold')
     
     plt.tight_layout()
-    plt.savefig('reportes/graficos_procesamiento.png', dpi=300, bbox_inches='tight')
-    print(f"   ✓ Gráficos guardados: reportes/graficos_procesamiento.png")
-    plt.show()
+    plt.savefig(ruta, dpi=300, bbox_inches='tight')
+    print(f"   ✓ Gráficos guardados: {ruta}")
+    if mostrar:
+        plt.show()
+    else:
+        plt.close(fig)
 
 def mostrar_ejemplos_normalizacion():
     """Muestra ejemplos de cómo quedan normalizados diferentes tipos de números"""
@@ -357,15 +1311,66 @@ def mostrar_ejemplos_normalizacion():
         
         print("-" * 40)
 
-if __name__ == "__main__":
-    # Mostrar ejemplos primero
-    mostrar_ejemplos_normalizacion()
+def main(argv=None):
+    """Punto de entrada de línea de comandos"""
     
-    # Procesar archivo real
-    df_resultado, reporte = procesar_telefonos()
+    parser = argparse.ArgumentParser(description="Procesa y normaliza números telefónicos argentinos")
+    parser.add_argument('archivo', nargs='?', default='llamadas.csv',
+                        help="Archivo de entrada (CSV, Parquet o Feather); '-' lee CSV de la entrada estándar")
+    parser.add_argument('--columna', default=COLUMNA_TELEFONO, help="Columna con los números telefónicos")
+    parser.add_argument('--directorio', default=None,
+                        help="Carpeta donde se escriben las salidas (por defecto la actual)")
+    parser.add_argument('--salidas', nargs='+', choices=list(SALIDAS), default=None, metavar='SALIDA',
+                        help=f"Salidas a generar (por defecto todas menos graficos): {', '.join(SALIDAS)}")
+    parser.add_argument('--stdout', choices=[nombre for nombre in SALIDAS if nombre != 'graficos'], default=None,
+                        metavar='SALIDA',
+                        help="Escribir esta salida en la salida estándar; sin --salidas es la única que se genera")
+    parser.add_argument('--chunksize', type=int, default=None,
+                        help=f"Procesar en bloques de N filas con memoria acotada (ej. {CHUNK_SIZE})")
+    parser.add_argument('--formato', choices=sorted(FORMATOS_SALIDA), default='csv',
+                        help="Formato de los archivos de salida (la entrada se detecta por extensión)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Cantidad de procesos para normalizar en paralelo (ej. os.cpu_count())")
+    parser.add_argument('--almacen', default=None, metavar='ARCHIVO.sqlite',
+                        help="Base SQLite con resultados de ejecuciones anteriores; solo se normalizan los números nuevos")
+    parser.add_argument('--punto-control', default=None, metavar='ARCHIVO.json',
+                        help="Guardar el progreso en este archivo y, si ya existe, reanudar desde ahí (procesa por bloques)")
+    parser.add_argument('--punto-control-cada', type=int, default=BLOQUES_POR_PUNTO_CONTROL, metavar='BLOQUES',
+                        help=f"Bloques entre dos guardados del punto de control (por defecto {BLOQUES_POR_PUNTO_CONTROL})")
+    parser.add_argument('--plan', default=None, metavar='ARCHIVO.json',
+                        help="Plan de numeración (códigos de área y rangos de operadores) en lugar del incorporado")
+    parser.add_argument('--plantilla-movil', default=PLANTILLAS_MARCAR['mobile'],
+                        help="Formato para marcar móviles; campos: columnas de resultado como {area_code} o {local_number}")
+    parser.add_argument('--plantilla-fijo', default=PLANTILLAS_MARCAR['landline'],
+                        help="Formato para marcar fijos")
+    parser.add_argument('--graficos', action='store_true',
+                        help=f"Generar {ARCHIVO_GRAFICOS} (requiere matplotlib)")
+    parser.add_argument('--secuencial', action='store_true',
+                        help="Leer, normalizar y escribir en secuencia, sin hilos (por defecto se usan con más de un núcleo)")
+    parser.add_argument('--ejemplos', action='store_true',
+                        help="Mostrar ejemplos de normalización antes de procesar")
+    args = parser.parse_args(argv)
+    plantillas = {'mobile': args.plantilla_movil, 'landline': args.plantilla_fijo}
+    plan = NumberingPlan.from_file(args.plan) if args.plan else None
     
-    if df_resultado is not None:
-        print(f"\n✅ ¡Procesamiento exitoso!")
-        print(f"Revisa los archivos generados para ver los resultados.")
-    else:
-        print(f"\n❌ No se pudo completar el procesamiento.")
\ No newline at end of file
+    # Con --stdout los datos ocupan la salida estándar y los mensajes van a stderr
+    with contextlib.redirect_stdout(sys.stderr) if args.stdout else contextlib.nullcontext():
+        if args.ejemplos:
+            mostrar_ejemplos_normalizacion()
+        
+        # Procesar archivo real
+        _, reporte = procesar_telefonos(args.archivo, args.chunksize, args.workers, args.formato, args.almacen,
+                                        plantillas, args.graficos, args.columna, args.salidas, args.directorio,
+                                        args.stdout, False if args.secuencial else None, plan, args.punto_control,
+                                        args.punto_control_cada)
+        
+        if reporte is not None:
+            print(f"\n✅ ¡Procesamiento exitoso!")
+            print(f"Revisa los archivos generados para ver los resultados.")
+        else:
+            print(f"\n❌ No se pudo completar el procesamiento.")
+    
+    return 0 if reporte is not None else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+import argparse
+import asyncio
+import bisect
+import json
+import math
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer, RESULT_COLUMNS
+
+# Ventana para juntar pedidos concurrentes en un mismo lote
+VENTANA_MS_DEFAULT = 2.0
+LOTE_MAXIMO_DEFAULT = 5_000
+
+# Límites superiores (ms) de los buckets del histograma de latencias
+BUCKETS_LATENCIA_MS = [0.5, 1, 2, 5, 10, 20, 50, 100, 250, 500, 1000, 5000]
+# Límites superiores de los buckets del histograma de tamaños de lote
+BUCKETS_LOTE = [1, 2, 5, 10, 50, 100, 500, 1000, 5000, 10000]
+
+ESTADOS_HTTP = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+MAX_CUERPO_BYTES = 16 * 1024 * 1024
+
+def _parametro(consulta: str, nombre: str, defecto: str = '') -> str:
+    """Valor de un parámetro de la query string; a diferencia de parse_qs, un '+' queda como '+'
+    y no como espacio, así '?numero=+5491133887576' llega entero (también vale %2B)"""
+    for par in consulta.split('&'):
+        clave, _, valor = par.partition('=')
+        if unquote(clave) == nombre:
+            return unquote(valor)
+    return defecto
+
+def _sin_no_finitos(valor):
+    """Reemplaza NaN e infinitos por None: no son JSON válido (p. ej. un 'original' de 1e400 o NaN)"""
+    if isinstance(valor, float):
+        return valor if math.isfinite(valor) else None
+    if isinstance(valor, dict):
+        return {clave: _sin_no_finitos(elemento) for clave, elemento in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_sin_no_finitos(elemento) for elemento in valor]
+    return valor
+
+def _a_json(respuesta: Dict[str, any]) -> bytes:
+    """Serializa una respuesta como JSON estricto; solo si hay números no finitos se recorre entera"""
+    try:
+        contenido = json.dumps(respuesta, ensure_ascii=False, allow_nan=False)
+    except ValueError:
+        contenido = json.dumps(_sin_no_finitos(respuesta), ensure_ascii=False, allow_nan=False)
+    return contenido.encode('utf-8')
+
+class Histograma:
+    """Histograma acumulativo con buckets fijos, al estilo Prometheus"""
+    
+    def __init__(self, limites: List[float]):
+        self.limites = limites
+        self.conteos = [0] * (len(limites) + 1)
+        self.total = 0
+        self.suma = 0.0
+    
+    def registrar(self, valor: float):
+        self.conteos[bisect.bisect_left(self.limites, valor)] += 1
+        self.total += 1
+        self.suma += valor
+    
+    def snapshot(self) -> Dict[str, any]:
+        buckets = {f"<={limite}": conteo for limite, conteo in zip(self.limites, self.conteos)}
+        buckets['+inf'] = self.conteos[-1]
+        return {
+            'total': self.total,
+            'promedio': round(self.suma / self.total, 4) if self.total else 0.0,
+            'buckets': buckets,
+        }
+
+class Metricas:
+    """Contadores del servicio: cola, latencias y tamaños de lote.
+    
+    tamano_lote mide solo los lotes que arma el agrupador; los pedidos a /normalizar/lote ya llegan
+    armados y van a tamano_pedido_lote, para que el tráfico masivo no tape cuánto se agrupa.
+    """
+    
+    def __init__(self):
+        self.inicio = time.time()
+        self.pedidos = 0
+        self.numeros = 0
+        self.cola_maxima = 0
+        self.latencia_ms = Histograma(BUCKETS_LATENCIA_MS)
+        self.espera_cola_ms = Histograma(BUCKETS_LATENCIA_MS)
+        self.tamano_lote = Histograma(BUCKETS_LOTE)
+        self.tamano_pedido_lote = Histograma(BUCKETS_LOTE)
+
+class AgrupadorLotes:
+    """Junta los números que llegan dentro de la ventana y los normaliza en una sola llamada vectorizada"""
+    
+    def __init__(self, normalizer: ArgentinaPhoneNormalizer, metricas: Metricas,
+                 ventana_ms: float = VENTANA_MS_DEFAULT, lote_maximo: int = LOTE_MAXIMO_DEFAULT):
+        self.normalizer = normalizer
+        self.metricas = metricas
+        self.ventana = ventana_ms / 1000
+        self.lote_maximo = lote_maximo
+        self.cola = asyncio.Queue()
+        self.tarea = None
+    
+    def iniciar(self):
+        if self.tarea is None:
+            self.tarea = asyncio.get_running_loop().create_task(self._procesar())
+    
+    async def detener(self):
+        if self.tarea is not None:
+            self.tarea.cancel()
+            try:
+                await self.tarea
+            except asyncio.CancelledError:
+                pass
+            self.tarea = None
+    
+    async def normalizar(self, numero) -> Dict[str, any]:
+        """Encola un número y espera su resultado"""
+        futuro = asyncio.get_running_loop().create_future()
+        await self.cola.put((numero, futuro, time.perf_counter()))
+        self.metricas.cola_maxima = max(self.metricas.cola_maxima, self.cola.qsize())
+        return await futuro
+    
+    async def _procesar(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            pendientes = [await self.cola.get()]
+            limite = loop.time() + self.ventana
+            while len(pendientes) < self.lote_maximo:
+                restante = limite - loop.time()
+                if restante <= 0:
+                    break
+                try:
+                    pendientes.append(await asyncio.wait_for(self.cola.get(), restante))
+                except asyncio.TimeoutError:
+                    break
+            
+            ahora = time.perf_counter()
+            for _, _, encolado in pendientes:
+                self.metricas.espera_cola_ms.registrar((ahora - encolado) * 1000)
+            self.metricas.tamano_lote.registrar(len(pendientes))
+            
+            numeros = [numero for numero, _, _ in pendientes]
+            try:
+                filas = await loop.run_in_executor(None, normalizar_lote, self.normalizer, numeros)
+            except Exception as e:
+                for _, futuro, _ in pendientes:
+                    if not futuro.done():
+                        futuro.set_exception(e)
+                continue
+            for (_, futuro, _), fila in zip(pendientes, filas):
+                if not futuro.done():
+                    futuro.set_result(fila)
+
+def normalizar_lote(normalizer: ArgentinaPhoneNormalizer, numeros: List) -> List[Dict[str, any]]:
+    """Normaliza una lista con el motor vectorizado y devuelve un dict por número"""
+    if not numeros:
+        return []
+    resultado = normalizer.batch_normalize_compact(numeros)
+    columnas = [resultado.column(nombre) for nombre in RESULT_COLUMNS]
+    columnas = [columna.tolist() if hasattr(columna, 'tolist') else list(columna) for columna in columnas]
+    return [dict(zip(RESULT_COLUMNS, fila)) for fila in zip(*columnas)]
+
+class ServicioNormalizador:
+    """Servicio HTTP de normalización con un normalizador único y pedidos agrupados en lotes"""
+    
+    def __init__(self, ventana_ms: float = VENTANA_MS_DEFAULT, lote_maximo: int = LOTE_MAXIMO_DEFAULT,
+                 normalizer: Optional[ArgentinaPhoneNormalizer] = None):
+        self.normalizer = normalizer or ArgentinaPhoneNormalizer()
+        self.metricas = Metricas()
+        self.agrupador = AgrupadorLotes(self.normalizer, self.metricas, ventana_ms, lote_maximo)
+        self.servidor = None
+    
+    async def atender(self, metodo: str, ruta: str, cuerpo: bytes = b'') -> Tuple[int, Dict[str, any]]:
+        """Resuelve un pedido y devuelve (estado HTTP, respuesta JSON); lo usan el servidor y el cliente local"""
+        inicio = time.perf_counter()
+        self.agrupador.iniciar()
+        self.metricas.pedidos += 1
+        try:
+            return await self._rutear(metodo, ruta, cuerpo)
+        except (ValueError, KeyError, TypeError) as e:
+            return 400, {'error': f"Pedido inválido: {e}"}
+        except Exception as e:
+            return 500, {'error': f"Error interno: {e}"}
+        finally:
+            self.metricas.latencia_ms.registrar((time.perf_counter() - inicio) * 1000)
+    
+    async def _rutear(self, metodo: str, ruta: str, cuerpo: bytes) -> Tuple[int, Dict[str, any]]:
+        url = urlsplit(ruta)
+        datos = json.loads(cuerpo) if cuerpo else {}
+        
+        if url.path == '/normalizar':
+            if metodo == 'GET':
+                numero = _parametro(url.query, 'numero')
+            elif metodo == 'POST':
+                numero = datos['numero']
+            else:
+                return 405, {'error': "Método no permitido"}
+            self.metricas.numeros += 1
+            return 200, await self.agrupador.normalizar(numero)
+        
+        if url.path == '/normalizar/lote':
+            if metodo != 'POST':
+                return 405, {'error': "Método no permitido"}
+            numeros = datos['numeros']
+            if not isinstance(numeros, list):
+                raise TypeError("'numeros' debe ser una lista")
+            self.metricas.numeros += len(numeros)
+            self.metricas.tamano_pedido_lote.registrar(len(numeros))
+            filas = await asyncio.get_running_loop().run_in_executor(None, normalizar_lote, self.normalizer, numeros)
+            return 200, {'resultados': filas}
+        
+        if url.path == '/metricas':
+            return 200, self.snapshot_metricas()
+        
+        if url.path == '/salud':
+            return 200, {'estado': 'ok'}
+        
+        return 404, {'error': f"Ruta desconocida: {url.path}"}
+    
+    def snapshot_metricas(self) -> Dict[str, any]:
+        """Estado actual de la cola y los histogramas"""
+        return {
+            'uptime_segundos': round(time.time() - self.metricas.inicio, 1),
+            'pedidos': self.metricas.pedidos,
+            'numeros': self.metricas.numeros,
+            'cola_actual': self.agrupador.cola.qsize(),
+            'cola_maxima': self.metricas.cola_maxima,
+            'latencia_ms': self.metricas.latencia_ms.snapshot(),
+            'espera_cola_ms': self.metricas.espera_cola_ms.snapshot(),
+            'tamano_lote': self.metricas.tamano_lote.snapshot(),
+            'tamano_pedido_lote': self.metricas.tamano_pedido_lote.snapshot(),
+        }
+    
+    async def _conexion(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Atiende una conexión HTTP/1.1 con keep-alive"""
+        try:
+            while True:
+                linea = await reader.readline()
+                if not linea:
+                    break
+                metodo, ruta, _ = linea.decode('latin-1').split(' ', 2)
+                
+                encabezados = {}
+                while True:
+                    encabezado = await reader.readline()
+                    if encabezado in (b'\r\n', b'\n', b''):
+                        break
+                    nombre, _, valor = encabezado.decode('latin-1').partition(':')
+                    encabezados[nombre.strip().lower()] = valor.strip()
+                
+                largo = int(encabezados.get('content-length', 0))
+                if largo > MAX_CUERPO_BYTES:
+                    estado, respuesta = 413, {'error': "Cuerpo demasiado grande"}
+                else:
+                    cuerpo = await reader.readexactly(largo) if largo else b''
+                    estado, respuesta = await self.atender(metodo, ruta, cuerpo)
+                
+                contenido = _a_json(respuesta)
+                cerrar = encabezados.get('connection', '').lower() == 'close' or estado == 413
+                writer.write(
+                    f"HTTP/1.1 {estado} {ESTADOS_HTTP.get(estado, '')}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(contenido)}\r\n"
+                    f"Connection: {'close' if cerrar else 'keep-alive'}\r\n\r\n".encode('latin-1') + contenido
+                )
+                await writer.drain()
+                if cerrar:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+    
+    async def iniciar(self, host: str = '127.0.0.1', puerto: int = 8080):
+        """Abre el socket y arranca el agrupador de lotes"""
+        self.agrupador.iniciar()
+        self.servidor = await asyncio.start_server(self._conexion, host, puerto)
+        return self.servidor
+    
+    async def detener(self):
+        if self.servidor is not None:
+            self.servidor.close()
+            await self.servidor.wait_closed()
+        await self.agrupador.detener()
+
+class ClienteLocal:
+    """Cliente en proceso para pruebas: llama al servicio sin pasar por sockets"""
+    
+    def __init__(self, servicio: ServicioNormalizador):
+        self.servicio = servicio
+    
+    async def get(self, ruta: str) -> Tuple[int, Dict[str, any]]:
+        return self._como_http(*await self.servicio.atender('GET', ruta))
+    
+    async def post(self, ruta: str, datos: Dict[str, any]) -> Tuple[int, Dict[str, any]]:
+        return self._como_http(*await self.servicio.atender('POST', ruta, json.dumps(datos).encode('utf-8')))
+    
+    @staticmethod
+    def _como_http(estado: int, respuesta: Dict[str, any]) -> Tuple[int, Dict[str, any]]:
+        """Pasa la respuesta por la misma serialización que el servidor"""
+        return estado, json.loads(_a_json(respuesta))
+
+async def _servir(host: str, puerto: int, ventana_ms: float, lote_maximo: int):
+    servicio = ServicioNormalizador(ventana_ms, lote_maximo)
+    servidor = await servicio.iniciar(host, puerto)
+    print(f"Servicio de normalización escuchando en http://{host}:{puerto}")
+    print("Endpoints: /normalizar, /normalizar/lote, /metricas, /salud")
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        await servicio.detener()
+
+def main():
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Servicio HTTP de normalización de números argentinos")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=8080)
+    parser.add_argument('--ventana-ms', type=float, default=VENTANA_MS_DEFAULT,
+                        help="Milisegundos que se esperan para juntar pedidos en un lote")
+    parser.add_argument('--lote-maximo', type=int, default=LOTE_MAXIMO_DEFAULT,
+                        help="Cantidad máxima de números por lote")
+    args = parser.parse_args()
+    
+    try:
+        asyncio.run(_servir(args.host, args.puerto, args.ventana_ms, args.lote_maximo))
+    except KeyboardInterrupt:
+        print("\nServicio detenido")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import pandas as pd
+
+import benchmark
+import procesar_llamadas
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer, NumberingPlan
+from test_procesar_llamadas import _archivos, _csv_decimales
+
+
+def _numeros():
+    # Repetidos con otro formato, faltantes y filas que van por normalize_phone_number
+    numeros = benchmark.generar_numeros(3000, 8)
+    return numeros + ['11-3388-7576', '(11) 3388 7576', None, '', '１１３３８８７５７６'] + numeros[:500]
+
+
+def _plan_con_otro_operador():
+    base = NumberingPlan.default()
+    operadores = {nombre: dict(datos) for nombre, datos in base.mobile_operators.items()}
+    operadores['Nuevo'] = {'priority': -1, 'ranges': [(1133000000, 1133999999)]}
+    return NumberingPlan({codigo: dict(datos) for codigo, datos in base.area_codes.items()}, operadores)
+
+
+def test_segunda_corrida_desde_el_almacen(tmp_path, monkeypatch):
+    ruta = str(tmp_path / 'almacen.sqlite')
+    numeros = _numeros()
+    normalizer = ArgentinaPhoneNormalizer()
+    esperado = normalizer.batch_normalize(numeros, vectorized=False)
+    
+    store = normalizer.open_store(ruta)
+    pd.testing.assert_frame_equal(normalizer.batch_normalize_incremental(numeros, store), esperado)
+    claves = len(store)
+    assert store.stats['hits'] == 0 and store.stats['stored'] == claves > 0
+    store.close()
+    
+    # Reabierto con las mismas tablas: todo sale del almacén y el motor solo ve las filas sin clave
+    normalizadas = []
+    original = ArgentinaPhoneNormalizer.batch_normalize_compact
+    
+    def espia(self, phone_numbers, *args, **kwargs):
+        normalizadas.extend(phone_numbers)
+        return original(self, phone_numbers, *args, **kwargs)
+    
+    monkeypatch.setattr(ArgentinaPhoneNormalizer, 'batch_normalize_compact', espia)
+    store = normalizer.open_store(ruta)
+    resultado = normalizer.batch_normalize_incremental(numeros, store)
+    
+    assert store.stats == {'hits': claves, 'misses': 0, 'stored': 0, 'invalidated': False}
+    assert [normalizer.store_key(numero) for numero in normalizadas] == [None] * len(normalizadas)
+    pd.testing.assert_frame_equal(resultado, esperado)
+    store.close()
+
+
+def test_almacen_invalidado_si_cambian_las_tablas(tmp_path):
+    ruta = str(tmp_path / 'almacen.sqlite')
+    numeros = ['11 3388-7576', '1143218765', '0351 456-7890']
+    store = ArgentinaPhoneNormalizer().open_store(ruta)
+    ArgentinaPhoneNormalizer().batch_normalize_incremental(numeros, store)
+    store.close()
+    
+    normalizer = ArgentinaPhoneNormalizer(plan=_plan_con_otro_operador())
+    store = normalizer.open_store(ruta)
+    assert store.stats['invalidated'] and len(store) == 0
+    
+    resultado = normalizer.batch_normalize_incremental(numeros, store)
+    
+    assert store.stats['hits'] == 0
+    pd.testing.assert_frame_equal(resultado, normalizer.batch_normalize(numeros, vectorized=False))
+    assert normalizer.tables_version() != ArgentinaPhoneNormalizer().tables_version()
+    store.close()
+
+
+def test_pipeline_con_almacen(tmp_path):
+    entrada = str(tmp_path / 'llamadas.csv')
+    _csv_decimales(entrada, 3000)
+    almacen = str(tmp_path / 'almacen.sqlite')
+    
+    procesar_llamadas.procesar_telefonos(entrada, directorio=str(tmp_path / 'sin'), hilos=False)
+    for corrida in ('primera', 'segunda'):
+        procesar_llamadas.procesar_telefonos(entrada, almacen=almacen, directorio=str(tmp_path / corrida),
+                                             hilos=False)
+    
+    assert _archivos(tmp_path / 'primera') == _archivos(tmp_path / 'sin')
+    assert _archivos(tmp_path / 'segunda') == _archivos(tmp_path / 'sin')
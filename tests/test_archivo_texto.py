@@ -0,0 +1,91 @@
+import pandas as pd
+import pytest
+
+import benchmark
+import procesar_llamadas
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer
+from test_procesar_llamadas import _archivos
+
+
+def _lineas():
+    # Líneas vacías, solo espacios y fuera de ASCII
+    numeros = [numero for numero in benchmark.generar_numeros(3000, 5) if isinstance(numero, str)]
+    return numeros[:1000] + ['', '   ', '１１３３８８７５７６', 'abc', ''] + numeros[1000:]
+
+
+def _escribir(ruta, lineas, fin_de_linea, salto_final):
+    texto = fin_de_linea.join(lineas) + (fin_de_linea if salto_final else '')
+    with open(ruta, 'wb') as archivo:
+        archivo.write(texto.encode('utf-8'))
+
+
+def _no_vacias(ruta):
+    """Lo que el lector debe entregar: cada línea sin su \\r final, salteando las que quedan vacías"""
+    lineas = open(ruta, 'rb').read().decode('utf-8').split('\n')
+    return [linea for linea in (linea[:-1] if linea.endswith('\r') else linea for linea in lineas) if linea]
+
+
+def _bloques(normalizer, ruta, batch_size, skip_batches=0):
+    return [resultado.to_dataframe(categorical=False)
+            for resultado in normalizer.normalize_text_file(ruta, batch_size, skip_batches)]
+
+
+def _leer(normalizer, ruta, batch_size):
+    return pd.concat(_bloques(normalizer, ruta, batch_size), ignore_index=True)
+
+
+@pytest.mark.parametrize('fin_de_linea', ['\n', '\r\n'])
+@pytest.mark.parametrize('salto_final', [True, False])
+@pytest.mark.parametrize('batch_size', [7, 1000, 100_000])
+def test_igual_que_normalizar_las_lineas(tmp_path, fin_de_linea, salto_final, batch_size):
+    ruta = str(tmp_path / 'numeros.txt')
+    lineas = _lineas()
+    _escribir(ruta, lineas, fin_de_linea, salto_final)
+    normalizer = ArgentinaPhoneNormalizer()
+    
+    resultado = _leer(normalizer, ruta, batch_size)
+    
+    pd.testing.assert_frame_equal(resultado, normalizer.batch_normalize(_no_vacias(ruta), vectorized=False),
+                                  check_dtype=False)
+
+
+def test_ultima_linea_sin_salto_y_archivo_vacio(tmp_path):
+    ruta = tmp_path / 'numeros.txt'
+    normalizer = ArgentinaPhoneNormalizer()
+    
+    ruta.write_bytes(b'1133887576\r\n0351 456-7890')
+    assert _leer(normalizer, str(ruta), 10)['original'].tolist() == ['1133887576', '0351 456-7890']
+    # Solo se quita un \r por línea
+    ruta.write_bytes(b'\r\r\n1133887576\r')
+    assert _leer(normalizer, str(ruta), 10)['original'].tolist() == ['\r', '1133887576']
+    ruta.write_bytes(b'')
+    assert list(normalizer.normalize_text_file(str(ruta))) == []
+    ruta.write_bytes(b'\r\n\n\r\n')
+    assert list(normalizer.normalize_text_file(str(ruta))) == []
+
+
+def test_saltear_bloques(tmp_path):
+    ruta = str(tmp_path / 'numeros.txt')
+    lineas = _lineas()
+    _escribir(ruta, lineas, '\r\n', False)
+    normalizer = ArgentinaPhoneNormalizer()
+    
+    salteados = _bloques(normalizer, ruta, 500, skip_batches=3)
+    
+    # Los bloques se cuentan por líneas leídas, vacías incluidas: se retoma en el mismo corte
+    todos = _bloques(normalizer, ruta, 500)
+    assert len(salteados) == len(todos) - 3
+    for bloque, esperado in zip(salteados, todos[3:]):
+        pd.testing.assert_frame_equal(bloque, esperado)
+
+
+def test_pipeline_con_txt_crlf(tmp_path):
+    lineas = _lineas()
+    _escribir(str(tmp_path / 'unix.txt'), lineas, '\n', True)
+    _escribir(str(tmp_path / 'windows.txt'), lineas, '\r\n', False)
+    
+    for nombre in ('unix', 'windows'):
+        procesar_llamadas.procesar_telefonos(str(tmp_path / f'{nombre}.txt'), chunksize=1000,
+                                             directorio=str(tmp_path / nombre), hilos=False)
+    
+    assert _archivos(tmp_path / 'windows') == _archivos(tmp_path / 'unix')
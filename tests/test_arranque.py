@@ -0,0 +1,40 @@
+import json
+import os
+import subprocess
+import sys
+
+import benchmark
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _modulos_cargados(codigo):
+    """Ejecuta el código en un proceso nuevo y devuelve los módulos que quedaron ejecutados"""
+    programa = (codigo + "\nimport json, sys, types\n"
+                "print(json.dumps(sorted(nombre for nombre, modulo in sys.modules.items()\n"
+                "    if isinstance(modulo, types.ModuleType) and type(modulo) is types.ModuleType)))")
+    proceso = subprocess.run([sys.executable, '-c', programa], cwd=RAIZ, capture_output=True, text=True, check=True)
+    return set(json.loads(proceso.stdout.splitlines()[-1]))
+
+
+def test_camino_escalar_sin_pandas_ni_numpy():
+    cargados = _modulos_cargados(benchmark.ARRANQUES['normalize_phone_number'])
+    
+    # pandas y numpy quedan registrados como módulos perezosos, pero nunca se ejecutan
+    assert 'argentina_phone_normalizer' in cargados
+    assert not {nombre for nombre in cargados if nombre.split('.')[0] in ('pandas', 'numpy')}
+
+
+def test_pandas_se_carga_al_primer_uso():
+    cargados = _modulos_cargados(
+        "from argentina_phone_normalizer import ArgentinaPhoneNormalizer; "
+        "ArgentinaPhoneNormalizer().batch_normalize(['1133887576'])")
+    
+    assert {'pandas', 'numpy'} <= cargados
+
+
+def test_procesar_llamadas_sin_matplotlib():
+    cargados = _modulos_cargados(benchmark.ARRANQUES['import_procesar_llamadas'])
+    
+    assert 'procesar_llamadas' in cargados
+    assert not {nombre for nombre in cargados if nombre.split('.')[0] in ('matplotlib', 'seaborn')}
@@ -0,0 +1,80 @@
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import argentina_phone_normalizer
+import benchmark
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer, MIN_WORKER_CHUNK_SIZE
+
+
+def _corpus_mixto():
+    """Formatos reales, basura, entradas que el motor vectorizado deriva al camino escalar y faltantes"""
+    rng = random.Random(3)
+    corpus = [str(numero) for numero in benchmark.generar_numeros(4000, 2)]
+    corpus += [''.join(rng.choice('0123456789+-() .\t') for _ in range(rng.randint(0, 18))) for _ in range(3000)]
+    # Sin ASCII, locales de móvil con letras y escalares poco comunes: van por normalize_phone_number
+    corpus += ['１１３３８８７５７６', '+٥٤ ٩ ١١ ٣٣٨٨-٧٥٧٦', '11 3388 ٧٥٧٦', 'ñ1133887576', '+54 9 11 15 33AB-7576',
+               '911 15 3388 757x', '11 3388-7576 ext. 12']
+    corpus += [1133887576, 5491133887576, -1133887576, 0, 10**19, 1133887576.0, 2214567890.5, float('inf'),
+               np.int64(1133887576), np.float32(1.0), True, None, float('nan'), '', '   ', 'nan', 'None']
+    rng.shuffle(corpus)
+    return corpus
+
+
+@pytest.mark.parametrize('deduplicate', [False, True])
+def test_vectorizado_igual_que_escalar(monkeypatch, deduplicate):
+    corpus = _corpus_mixto() * 2
+    filas_escalares = []
+    original = ArgentinaPhoneNormalizer._fallback_rows
+    
+    def espia(self, values, state, python_scalars):
+        filas_escalares.append(int((state == argentina_phone_normalizer._STATE_FALLBACK).sum()))
+        return original(self, values, state, python_scalars)
+    
+    # Bloques chicos para cruzar varios límites de bloque
+    monkeypatch.setattr(argentina_phone_normalizer, 'BATCH_CHUNK_SIZE', 997)
+    monkeypatch.setattr(ArgentinaPhoneNormalizer, '_fallback_rows', espia)
+    normalizer = ArgentinaPhoneNormalizer()
+    
+    esperado = normalizer.batch_normalize(corpus, vectorized=False)
+    for entrada in (corpus, pd.Series(corpus, dtype=object)):
+        pd.testing.assert_frame_equal(normalizer.batch_normalize(entrada, deduplicate=deduplicate), esperado)
+    
+    assert sum(filas_escalares) > 0
+
+
+@pytest.mark.parametrize('dtype', ['int64', 'float64', 'str'])
+def test_vectorizado_columnas_tipadas(dtype):
+    rng = np.random.default_rng(4)
+    numeros = np.concatenate([1100000000 + rng.integers(0, 10**8, 3000), 5493510000000 + rng.integers(0, 10**7, 1000),
+                              rng.integers(0, 10**6, 500)])
+    serie = pd.Series(numeros).astype(dtype)
+    if dtype == 'float64':
+        serie[::37] = np.nan
+    normalizer = ArgentinaPhoneNormalizer()
+    
+    esperado = normalizer.batch_normalize(serie.tolist(), vectorized=False)
+    
+    pd.testing.assert_frame_equal(normalizer.batch_normalize(serie), esperado)
+
+
+def test_pool_reutilizado_entre_lotes():
+    normalizer = ArgentinaPhoneNormalizer()
+    rng = np.random.default_rng(0)
+    lotes = [pd.Series((1100000000 + rng.integers(0, 10**8, 3 * MIN_WORKER_CHUNK_SIZE)).astype(str)) for _ in range(2)]
+    
+    try:
+        resultados = []
+        pools = []
+        for lote in lotes:
+            resultados.append(normalizer.batch_normalize(lote, workers=2))
+            pools.append(normalizer._pool)
+        assert pools[0] is not None and pools[0] is pools[1]
+    finally:
+        normalizer.close()
+    assert normalizer._pool is None
+    
+    for lote, resultado in zip(lotes, resultados):
+        pd.testing.assert_frame_equal(resultado, normalizer.batch_normalize(lote))
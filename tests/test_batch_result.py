@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer, BatchResult, RESULT_COLUMNS
+from test_batch_normalize import _corpus_mixto
+
+
+@pytest.fixture(scope='module')
+def lote():
+    normalizer = ArgentinaPhoneNormalizer()
+    corpus = _corpus_mixto()
+    return corpus, normalizer.batch_normalize_compact(corpus), normalizer.batch_normalize(corpus, vectorized=False)
+
+
+def test_sin_categorias_igual_que_escalar(lote):
+    _, resultado, esperado = lote
+    
+    assert isinstance(resultado, BatchResult) and len(resultado) == len(esperado)
+    pd.testing.assert_frame_equal(resultado.to_dataframe(categorical=False), esperado)
+    for columna in RESULT_COLUMNS:
+        assert list(resultado.column(columna)) == list(esperado[columna]), columna
+
+
+def test_con_categorias(lote):
+    _, resultado, esperado = lote
+    
+    df = resultado.to_dataframe()
+    
+    assert list(df.columns) == RESULT_COLUMNS
+    for columna in RESULT_COLUMNS:
+        if columna in BatchResult.CATEGORICAL_COLUMNS:
+            assert isinstance(df[columna].dtype, pd.CategoricalDtype), columna
+            assert df[columna].astype(object).tolist() == esperado[columna].tolist(), columna
+        else:
+            pd.testing.assert_series_equal(df[columna], esperado[columna])
+
+
+def test_columnas_elegidas_y_take(lote):
+    corpus, resultado, esperado = lote
+    filas = np.random.default_rng(1).integers(0, len(corpus), 500)
+    
+    parcial = resultado.to_dataframe(categorical=False, columns=['format_e164', 'is_valid', 'errors'])
+    elegidos = [corpus[fila] for fila in filas]
+    expandido = resultado.take(filas, elegidos)
+    
+    pd.testing.assert_frame_equal(parcial, esperado[['format_e164', 'is_valid', 'errors']])
+    pd.testing.assert_frame_equal(expandido.to_dataframe(categorical=False),
+                                  ArgentinaPhoneNormalizer().batch_normalize(elegidos, vectorized=False))
+
+
+def test_listas_de_errores_independientes(lote):
+    _, resultado, _ = lote
+    
+    errores = resultado.column('errors')
+    con_error = [fila for fila, lista in enumerate(errores) if lista]
+    errores[con_error[0]].append('otro')
+    
+    # Cada fila tiene su propia lista: modificar una no cambia las demás ni las columnas siguientes
+    assert all(len(lista) == 1 for lista in errores[con_error[1:]])
+    assert resultado.column('errors')[con_error[0]] != errores[con_error[0]]
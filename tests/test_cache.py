@@ -0,0 +1,56 @@
+import benchmark
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer
+
+
+def test_cache_igual_que_sin_cache():
+    corpus = benchmark.generar_numeros(3000, 4) * 2
+    sin_cache = ArgentinaPhoneNormalizer()
+    con_cache = ArgentinaPhoneNormalizer(cache_size=500)
+    
+    assert [con_cache.normalize_phone_number(numero) for numero in corpus] == \
+        [sin_cache.normalize_phone_number(numero) for numero in corpus]
+
+
+def test_aciertos_por_numero_limpio():
+    normalizer = ArgentinaPhoneNormalizer(cache_size=10)
+    
+    primero = normalizer.normalize_phone_number('11-3388-7576')
+    # Otro formato del mismo número limpio reusa la entrada pero conserva su propio original
+    segundo = normalizer.normalize_phone_number('(11) 3388 7576')
+    
+    assert normalizer.cache_info() == {'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1, 'max_size': 10}
+    assert segundo['original'] == '(11) 3388 7576'
+    assert {**segundo, 'original': primero['original']} == primero
+
+
+def test_desalojo_del_menos_usado():
+    normalizer = ArgentinaPhoneNormalizer(cache_size=2)
+    
+    normalizer.normalize_phone_number('1133887576')
+    normalizer.normalize_phone_number('3514567890')
+    normalizer.normalize_phone_number('1133887576')
+    # Entra un tercero: sale 3514567890, el usado hace más tiempo
+    normalizer.normalize_phone_number('2214567890')
+    normalizer.normalize_phone_number('1133887576')
+    normalizer.normalize_phone_number('3514567890')
+    
+    assert normalizer.cache_info() == {'hits': 2, 'misses': 4, 'evictions': 2, 'size': 2, 'max_size': 2}
+    
+    normalizer.clear_cache()
+    assert normalizer.cache_info() == {'hits': 0, 'misses': 0, 'evictions': 0, 'size': 0, 'max_size': 2}
+
+
+def test_resultados_cacheados_no_se_comparten():
+    normalizer = ArgentinaPhoneNormalizer(cache_size=10)
+    
+    primero = normalizer.normalize_phone_number('0221-456-7890')
+    primero['errors'].append('modificado por el llamador')
+    primero['area_code'] = 'xx'
+    segundo = normalizer.normalize_phone_number('0221-456-7890')
+    segundo['errors'].clear()
+    tercero = normalizer.normalize_phone_number('0221-456-7890')
+    
+    esperado = ArgentinaPhoneNormalizer().normalize_phone_number('0221-456-7890')
+    assert esperado['errors']
+    assert segundo is not tercero and segundo['errors'] is not tercero['errors']
+    assert tercero == esperado
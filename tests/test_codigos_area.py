@@ -0,0 +1,76 @@
+import random
+
+import pandas as pd
+
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer, NumberingPlan
+
+
+def _plan_solapado():
+    """Plan por defecto más códigos que empiezan como otros ya existentes"""
+    base = NumberingPlan.default()
+    codigos = {codigo: dict(datos) for codigo, datos in base.area_codes.items()}
+    codigos['114'] = {'type': 'landline', 'region': 'Prueba_114', 'operator': 'landline'}
+    codigos['1145'] = {'type': 'mobile_landline', 'region': 'Prueba_1145', 'operator': 'mixed'}
+    codigos['3514'] = {'type': 'landline', 'region': 'Prueba_3514', 'operator': 'landline'}
+    operadores = {nombre: dict(datos) for nombre, datos in base.mobile_operators.items()}
+    return NumberingPlan(codigos, operadores, source='prueba')
+
+
+def _mas_largo(area_codes, digitos, minimo_local):
+    """Referencia directa: prueba los largos 4, 3 y 2 sobre el dict de códigos"""
+    for largo in (4, 3, 2):
+        if len(digitos) - largo >= minimo_local and digitos[:largo] in area_codes:
+            return digitos[:largo]
+    return ''
+
+
+def _primero_mas_corto(area_codes, digitos):
+    """Búsqueda original de identify_number_type: 2, 3 y 4 dígitos, el primero que deje 6 locales"""
+    for largo in [2, 3, 4]:
+        if digitos[:largo] in area_codes and len(digitos[largo:]) >= 6:
+            return digitos[:largo]
+    return ''
+
+
+def _digitos(semilla, cantidad, prefijos):
+    rng = random.Random(semilla)
+    return [rng.choice(prefijos) + ''.join(rng.choice('0123456789') for _ in range(rng.randint(0, 10)))
+            for _ in range(cantidad)]
+
+
+def test_trie_igual_que_referencia():
+    for plan in (NumberingPlan.default(), _plan_solapado()):
+        normalizer = ArgentinaPhoneNormalizer(plan=plan)
+        prefijos = list(plan.area_codes) + ['', '0', '9', '54']
+        
+        for digitos in _digitos(5, 20000, prefijos):
+            for minimo_local in (0, 6):
+                assert normalizer.match_area_code(digitos, minimo_local) == \
+                    _mas_largo(plan.area_codes, digitos, minimo_local), (digitos, minimo_local)
+        for codigo in list(plan.area_codes) + ['1', '99', '11111']:
+            assert normalizer.area_code_info(codigo) == plan.area_codes.get(codigo)
+
+
+def test_sin_solapamientos_igual_que_la_busqueda_original():
+    # Con la tabla incorporada ningún código es prefijo de otro: el más largo es el único
+    normalizer = ArgentinaPhoneNormalizer()
+    area_codes = normalizer.area_codes
+    
+    for digitos in _digitos(6, 20000, list(area_codes)):
+        if len(digitos) >= 8:
+            assert normalizer.match_area_code(digitos, 6) == _primero_mas_corto(area_codes, digitos)
+
+
+def test_prefijos_solapados_eligen_el_mas_largo():
+    normalizer = ArgentinaPhoneNormalizer(plan=_plan_solapado())
+    
+    assert normalizer.normalize_phone_number('1145678901')['area_code'] == '1145'
+    assert normalizer.normalize_phone_number('1149678901')['area_code'] == '114'
+    assert normalizer.normalize_phone_number('1133887576')['area_code'] == '11'
+    # Sin 6 dígitos locales detrás del código largo se usa el siguiente
+    assert normalizer.match_area_code('114567890', 6) == '114'
+    assert normalizer.normalize_phone_number('1145678901')['region'] == 'Prueba_1145'
+    
+    numeros = _digitos(7, 3000, ['11', '114', '1145', '351', '3514', '0', '+54 9 1145 15'])
+    pd.testing.assert_frame_equal(normalizer.batch_normalize(numeros),
+                                  normalizer.batch_normalize(numeros, vectorized=False))
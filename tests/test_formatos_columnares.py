@@ -0,0 +1,69 @@
+import os
+
+import pandas as pd
+import pytest
+
+import procesar_llamadas
+from test_procesar_llamadas import _archivos, _csv_decimales
+
+pytest.importorskip('pyarrow')
+
+
+def _leer_columnar(ruta):
+    """Lee una salida Parquet/Feather con las categorías como texto y errors como lista"""
+    df = pd.read_parquet(ruta) if ruta.endswith('.parquet') else pd.read_feather(ruta)
+    for columna in df.columns:
+        if isinstance(df[columna].dtype, pd.CategoricalDtype):
+            df[columna] = df[columna].astype(str)
+    if 'errors' in df:
+        df['errors'] = df['errors'].map(list)
+    return df
+
+
+def _salidas_columnares(directorio):
+    salidas = {}
+    for raiz, _, nombres in os.walk(directorio):
+        for nombre in nombres:
+            if nombre.endswith(('.parquet', '.feather')):
+                salidas[nombre] = _leer_columnar(os.path.join(raiz, nombre))
+    return salidas
+
+
+@pytest.mark.parametrize('formato', ['parquet', 'feather'])
+def test_salida_columnar(tmp_path, formato):
+    entrada = str(tmp_path / 'llamadas.csv')
+    _csv_decimales(entrada, 5000)
+    
+    df, _ = procesar_llamadas.procesar_telefonos(entrada, formato=formato, directorio=str(tmp_path / 'completo'),
+                                                 hilos=False)
+    procesar_llamadas.procesar_telefonos(entrada, chunksize=1000, formato=formato,
+                                         directorio=str(tmp_path / 'bloques'), hilos=False)
+    
+    completo = _salidas_columnares(tmp_path / 'completo')
+    bloques = _salidas_columnares(tmp_path / 'bloques')
+    assert set(completo) == set(bloques) and f'telefonos_validos.{formato}' in completo
+    for nombre in completo:
+        pd.testing.assert_frame_equal(bloques[nombre], completo[nombre], check_dtype=False)
+    
+    # El archivo completo trae lo mismo que el DataFrame en memoria, con las categorías como texto
+    leido = completo[f'telefonos_procesados_completo.{formato}']
+    esperado = df.astype({columna: str for columna in ['type', 'operator', 'region']})
+    pd.testing.assert_frame_equal(leido[list(df.columns)], esperado, check_dtype=False)
+
+
+@pytest.mark.parametrize('chunksize', [None, 1000])
+@pytest.mark.parametrize('extension', ['parquet', 'feather'])
+def test_entrada_columnar_igual_que_csv(tmp_path, extension, chunksize):
+    entrada = str(tmp_path / 'llamadas.csv')
+    _csv_decimales(entrada, 5000)
+    columnar = str(tmp_path / f'llamadas.{extension}')
+    # De Parquet/Feather solo se lee la columna del teléfono: el CSV de referencia tiene solo esa
+    tabla = pd.read_csv(entrada)[['TELEFONO']]
+    tabla.to_csv(entrada, index=False)
+    tabla.to_parquet(columnar) if extension == 'parquet' else tabla.to_feather(columnar)
+    
+    procesar_llamadas.procesar_telefonos(entrada, chunksize=chunksize, directorio=str(tmp_path / 'csv'), hilos=False)
+    procesar_llamadas.procesar_telefonos(columnar, chunksize=chunksize, directorio=str(tmp_path / 'columnar'),
+                                         hilos=False)
+    
+    assert _archivos(tmp_path / 'columnar') == _archivos(tmp_path / 'csv')
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer, NationalNumberIndex, NumberingPlan
+from test_codigos_area import _plan_solapado
+from test_operadores import OPERADORES_SOLAPADOS, _numeros_en_bordes, _plan
+
+
+def _planes():
+    return [NumberingPlan.default(), _plan_solapado(), _plan(OPERADORES_SOLAPADOS)]
+
+
+def _numeros(plan, semilla=0):
+    """Números de 10 dígitos al azar, los bordes de cada rango de operador y valores fuera de rango"""
+    numeros = list(np.random.default_rng(semilla).integers(10 ** 9, 10 ** 10, 20000))
+    numeros += [numero for numero in _numeros_en_bordes(plan.mobile_operators, semilla, 2000)
+                if 10 ** 9 <= numero < 10 ** 10]
+    numeros += [int(codigo) * 10 ** (10 - len(codigo)) + delta for codigo in plan.area_codes for delta in (-1, 0, 1)]
+    return np.array(numeros + [0, -1, 123, 10 ** 9 - 1, 10 ** 10, 10 ** 11 + 1], dtype=np.int64)
+
+
+@pytest.mark.parametrize('block_digits', [4, 6, 7])
+def test_igual_que_la_busqueda_escalar(block_digits):
+    for plan in _planes():
+        normalizer = ArgentinaPhoneNormalizer(plan=plan)
+        indice = NationalNumberIndex(plan, block_digits)
+        numeros = _numeros(plan)
+        
+        resultado = indice.lookup(numeros)
+        
+        for numero, valido, area, operador in zip(numeros.tolist(), resultado['is_valid'], resultado['area'],
+                                                  resultado['operator']):
+            codigo = normalizer.match_area_code(str(numero)) if 10 ** 9 <= numero < 10 ** 10 else ''
+            assert (valido, indice.area_code[area]) == (codigo != '', codigo), numero
+            if codigo:
+                assert indice.region[area] == plan.area_codes[codigo]['region'], numero
+                assert (indice.operator[operador] or 'Unknown') == normalizer.operator_for_number(numero), numero
+            else:
+                assert operador == 0, numero
+        np.testing.assert_array_equal(indice.is_valid(numeros), resultado['is_valid'])
+
+
+def test_igual_que_normalize_phone_number():
+    normalizer = ArgentinaPhoneNormalizer()
+    indice = normalizer.plan.national_index()
+    # Los que empiezan con 54 el camino escalar los toma como código de país
+    numeros = np.array([numero for numero in np.random.default_rng(1).integers(10 ** 9, 10 ** 10, 20000)
+                        if not str(numero).startswith('54')], dtype=np.int64)
+    
+    resultado = indice.lookup(numeros)
+    
+    validos = 0
+    for posicion, numero in enumerate(numeros.tolist()):
+        area = resultado['area'][posicion]
+        for texto in (str(numero), f'+54 9 {numero}'):
+            escalar = normalizer.normalize_phone_number(texto)
+            if not escalar['is_valid']:
+                continue
+            validos += 1
+            assert resultado['is_valid'][posicion], texto
+            assert (indice.area_code[area], indice.region[area]) == (escalar['area_code'], escalar['region']), texto
+            if escalar['type'] == 'mobile':
+                assert (indice.operator[resultado['operator'][posicion]] or 'Unknown') == escalar['operator'], texto
+    assert validos > 0
+
+
+def test_indice_del_plan_se_construye_una_vez():
+    plan = _plan_solapado()
+    
+    indice = plan.national_index()
+    
+    assert plan.national_index() is indice
+    assert NumberingPlan.default().national_index() is not indice
+    assert indice.area_code[indice.lookup([1145123456])['area'][0]] == '1145'
@@ -0,0 +1,91 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import procesar_llamadas
+from test_procesar_llamadas import _archivos, _csv_decimales
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def entrada(tmp_path):
+    ruta = str(tmp_path / 'llamadas.csv')
+    _csv_decimales(ruta, 3000)
+    return ruta
+
+
+def test_solo_las_salidas_elegidas(tmp_path, entrada):
+    todas = str(tmp_path / 'todas')
+    elegidas = str(tmp_path / 'elegidas')
+    
+    assert procesar_llamadas.main([entrada, '--directorio', todas, '--secuencial']) == 0
+    assert procesar_llamadas.main([entrada, '--directorio', elegidas, '--secuencial',
+                                   '--salidas', 'validos', 'marcar_txt', 'reporte']) == 0
+    
+    completas = _archivos(todas)
+    assert len(completas) == len(procesar_llamadas.SALIDAS_DEFAULT)
+    assert _archivos(elegidas) == {nombre: completas[nombre] for nombre in
+                                   ['telefonos_validos.csv', 'telefonos_para_marcar_argentina.txt',
+                                    'reporte_procesamiento.json']}
+
+
+@pytest.mark.parametrize('salida, nombre', [('marcar_txt', 'telefonos_para_marcar_argentina.txt'),
+                                            ('completo', 'telefonos_procesados_completo.csv')])
+@pytest.mark.parametrize('chunksize', [None, 1000])
+def test_salida_estandar(tmp_path, capfd, entrada, salida, nombre, chunksize):
+    bloques = ['--chunksize', str(chunksize)] if chunksize else []
+    procesar_llamadas.main([entrada, '--directorio', str(tmp_path / 'archivos'), '--secuencial'] + bloques)
+    capfd.readouterr()
+    
+    directorio = str(tmp_path / 'stdout')
+    assert procesar_llamadas.main([entrada, '--directorio', directorio, '--secuencial', '--stdout', salida]
+                                  + bloques) == 0
+    
+    # Sin --salidas solo se genera la elegida, y los mensajes van a stderr
+    capturado = capfd.readouterr()
+    assert capturado.out.encode() == _archivos(tmp_path / 'archivos')[nombre]
+    assert '¡Procesamiento exitoso!' in capturado.err
+    assert not os.path.exists(directorio) or _archivos(directorio) == {}
+
+
+def test_salida_estandar_junto_con_archivos(tmp_path, capfd, entrada):
+    directorio = str(tmp_path / 'salidas')
+    
+    procesar_llamadas.main([entrada, '--directorio', directorio, '--secuencial', '--salidas', 'validos',
+                            '--stdout', 'marcar_txt'])
+    
+    salida = capfd.readouterr().out
+    procesar_llamadas.main([entrada, '--directorio', str(tmp_path), '--secuencial', '--salidas', 'marcar_txt'])
+    
+    assert list(_archivos(directorio)) == ['telefonos_validos.csv']
+    assert salida.encode() == (tmp_path / 'telefonos_para_marcar_argentina.txt').read_bytes()
+
+
+def test_tuberia_de_entrada_a_salida(tmp_path, entrada):
+    procesar_llamadas.main([entrada, '--directorio', str(tmp_path), '--secuencial', '--salidas', 'marcar_txt'])
+    
+    with open(entrada, 'rb') as archivo:
+        proceso = subprocess.run([sys.executable, 'procesar_llamadas.py', '-', '--stdout', 'marcar_txt'], cwd=RAIZ,
+                                 stdin=archivo, capture_output=True, check=True)
+    
+    assert proceso.stdout == (tmp_path / 'telefonos_para_marcar_argentina.txt').read_bytes()
+
+
+@pytest.mark.parametrize('argumentos', [['--stdout', 'graficos'], ['--salidas', 'no_existe']])
+def test_opciones_invalidas(entrada, argumentos):
+    with pytest.raises(SystemExit):
+        procesar_llamadas.main([entrada] + argumentos)
+
+
+def test_formato_binario_no_va_a_la_salida_estandar(tmp_path, capfd, entrada):
+    directorio = str(tmp_path / 'salidas')
+    
+    assert procesar_llamadas.main([entrada, '--directorio', directorio, '--stdout', 'validos',
+                                   '--formato', 'parquet']) == 1
+    
+    capturado = capfd.readouterr()
+    assert capturado.out == '' and 'salida estándar' in capturado.err
+    assert not os.path.exists(directorio)
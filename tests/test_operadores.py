@@ -0,0 +1,72 @@
+import random
+
+import numpy as np
+import pandas as pd
+
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer, NumberingPlan
+
+# Rangos solapados a propósito: B tiene prioridad sobre A dentro de A y C no declara prioridad
+OPERADORES_SOLAPADOS = {
+    'A': {'ranges': [(1150000000, 1159999999), (2210000000, 2219999999)]},
+    'B': {'priority': -1, 'ranges': [(1152000000, 1153999999), (1158000000, 1161999999)]},
+    'C': {'ranges': [(1151000000, 1151999999), (1160000000, 1170000000)]},
+    'D': {'priority': -2, 'ranges': [(1153500000, 1153500009)]},
+}
+
+
+def _primer_rango(mobile_operators, numero):
+    """Referencia lineal: gana la menor 'priority'; sin ella, el orden del dict"""
+    orden = sorted(enumerate(mobile_operators.items()), key=lambda item: (item[1][1].get('priority', item[0]), item[0]))
+    for _, (operador, datos) in orden:
+        for desde, hasta in datos['ranges']:
+            if desde <= numero <= hasta:
+                return operador
+    return 'Unknown'
+
+
+def _numeros_en_bordes(mobile_operators, semilla, cantidad):
+    """Los bordes de cada rango, sus vecinos y números al azar alrededor"""
+    bordes = [borde for datos in mobile_operators.values() for rango in datos['ranges'] for borde in rango]
+    numeros = [borde + delta for borde in bordes for delta in (-1, 0, 1)]
+    rng = random.Random(semilla)
+    numeros += [rng.randint(min(bordes) - 10 ** 7, max(bordes) + 10 ** 7) for _ in range(cantidad)]
+    return numeros
+
+
+def _plan(mobile_operators):
+    base = NumberingPlan.default()
+    return NumberingPlan({codigo: dict(datos) for codigo, datos in base.area_codes.items()}, mobile_operators)
+
+
+def test_intervalos_igual_que_busqueda_lineal():
+    for operadores in (NumberingPlan.default().mobile_operators, OPERADORES_SOLAPADOS):
+        normalizer = ArgentinaPhoneNormalizer(plan=_plan(operadores))
+        for numero in _numeros_en_bordes(operadores, 3, 20000):
+            assert normalizer.operator_for_number(numero) == _primer_rango(operadores, numero), numero
+
+
+def test_prioridad_en_solapamientos():
+    normalizer = ArgentinaPhoneNormalizer(plan=_plan(OPERADORES_SOLAPADOS))
+    
+    assert normalizer.operator_for_number(1150000000) == 'A'
+    assert normalizer.operator_for_number(1151500000) == 'A'
+    assert normalizer.operator_for_number(1152500000) == 'B'
+    assert normalizer.operator_for_number(1153500005) == 'D'
+    assert normalizer.operator_for_number(1153500010) == 'B'
+    assert normalizer.operator_for_number(1160500000) == 'B'
+    assert normalizer.operator_for_number(1165000000) == 'C'
+    assert normalizer.operator_for_number(1190000000) == 'Unknown'
+    # Los intervalos compilados quedan ordenados y sin solaparse
+    inicios, fines = np.array(normalizer.operator_starts), np.array(normalizer.operator_ends)
+    assert (inicios <= fines).all() and (fines[:-1] < inicios[1:]).all()
+
+
+def test_operador_en_lotes_igual_que_escalar():
+    normalizer = ArgentinaPhoneNormalizer(plan=_plan(OPERADORES_SOLAPADOS))
+    numeros = [f"+54 9 {str(numero)[:2]} 15 {str(numero)[2:]}"
+               for numero in _numeros_en_bordes(OPERADORES_SOLAPADOS, 4, 3000) if 10 ** 9 <= numero < 10 ** 10]
+    
+    resultado = normalizer.batch_normalize(numeros)
+    
+    pd.testing.assert_frame_equal(resultado, normalizer.batch_normalize(numeros, vectorized=False))
+    assert set(resultado['operator']) >= {'A', 'B', 'C', 'D'}
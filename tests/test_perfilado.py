@@ -0,0 +1,74 @@
+from collections import Counter
+
+import pandas as pd
+
+import benchmark
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer, ERROR_BRANCHES, PROFILED_STAGES
+
+
+def _ramas(resultados):
+    """Errores por rama contados directamente sobre los mensajes"""
+    conteo = Counter({rama: 0 for _, rama in ERROR_BRANCHES})
+    for errores in resultados:
+        for error in errores:
+            conteo[next(rama for prefijo, rama in ERROR_BRANCHES if error.startswith(prefijo))] += 1
+    return dict(conteo)
+
+
+def test_desactivado_por_defecto():
+    normalizer = ArgentinaPhoneNormalizer()
+    
+    normalizer.normalize_phone_number('1133887576')
+    
+    assert normalizer.profile_snapshot() == {'enabled': False}
+    assert not any(etapa in normalizer.__dict__ for etapa in PROFILED_STAGES)
+    assert 'profile' not in normalizer.generate_report(normalizer.batch_normalize(['1133887576']))
+
+
+def test_contadores_del_camino_escalar():
+    numeros = benchmark.generar_numeros(2000, 3)
+    normalizer = ArgentinaPhoneNormalizer(profiling=True)
+    
+    resultados = [normalizer.normalize_phone_number(numero) for numero in numeros]
+    perfil = normalizer.profile_snapshot()
+    
+    etapas = perfil['stages']
+    assert set(etapas) == set(PROFILED_STAGES)
+    assert etapas['normalize_phone_number']['calls'] == len(numeros)
+    assert 0 < etapas['clean_input']['calls'] <= len(numeros)
+    assert etapas['format_result']['calls'] == sum(resultado['is_valid'] for resultado in resultados)
+    assert etapas['normalize_phone_number']['total_seconds'] >= etapas['identify_number_type']['total_seconds'] > 0
+    assert perfil['error_branches'] == _ramas(resultado['errors'] for resultado in resultados)
+    # La instrumentación no cambia los resultados
+    assert resultados == [ArgentinaPhoneNormalizer().normalize_phone_number(numero) for numero in numeros]
+
+
+def test_errores_por_rama_en_lotes():
+    numeros = benchmark.generar_numeros(5000, 4)
+    normalizer = ArgentinaPhoneNormalizer(profiling=True)
+    
+    df = normalizer.batch_normalize(numeros)
+    perfil = normalizer.generate_report(df)['profile']
+    
+    assert perfil['error_branches'] == _ramas(df['errors'])
+    assert perfil['stages']['batch_normalize']['calls'] == 1
+    assert perfil['stages']['batch_normalize_compact']['calls'] == 1
+    assert perfil['stages']['_normalize_chunk']['calls'] >= 1
+
+
+def test_reiniciar_y_desactivar():
+    normalizer = ArgentinaPhoneNormalizer(profiling=True)
+    normalizer.normalize_phone_number('abc')
+    
+    normalizer.reset_profile()
+    normalizer.normalize_phone_number('1133887576')
+    perfil = normalizer.profile_snapshot()
+    
+    assert perfil['stages']['normalize_phone_number']['calls'] == 1
+    assert sum(perfil['error_branches'].values()) == 0
+    
+    normalizer.disable_profiling()
+    assert normalizer.profile_snapshot() == {'enabled': False}
+    assert not any(etapa in normalizer.__dict__ for etapa in PROFILED_STAGES)
+    pd.testing.assert_frame_equal(normalizer.batch_normalize(['abc', '1133887576']),
+                                  ArgentinaPhoneNormalizer().batch_normalize(['abc', '1133887576']))
@@ -0,0 +1,86 @@
+import pickle
+
+import pytest
+
+import benchmark
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer, NumberingPlan
+from test_almacen import _plan_con_otro_operador
+
+
+def test_plan_inmutable():
+    plan = NumberingPlan.default()
+    
+    with pytest.raises(AttributeError):
+        plan.version = 'otra'
+    with pytest.raises(AttributeError):
+        del plan.area_codes
+    with pytest.raises(TypeError):
+        plan.area_codes['11'] = {'region': 'Otra', 'type': 'mobile'}
+    with pytest.raises(TypeError):
+        plan.area_codes['11']['region'] = 'Otra'
+    with pytest.raises(TypeError):
+        plan.mobile_operators.pop(next(iter(plan.mobile_operators)))
+    assert isinstance(next(iter(plan.mobile_operators.values()))['ranges'], tuple)
+
+
+def test_plan_compartido_por_los_normalizadores():
+    plan = NumberingPlan.default()
+    
+    assert NumberingPlan.default() is plan
+    for normalizer in (ArgentinaPhoneNormalizer(), ArgentinaPhoneNormalizer()):
+        assert normalizer.plan is plan
+        assert all(getattr(normalizer, nombre) is getattr(plan, nombre) for nombre in NumberingPlan.TABLES)
+        assert normalizer.tables_version() == plan.version
+
+
+def test_version_segun_las_tablas():
+    base = NumberingPlan.default()
+    copia = NumberingPlan(dict(base.area_codes), dict(base.mobile_operators), source='copia')
+    otro = _plan_con_otro_operador()
+    
+    assert copia.version == base.version and copia.source == 'copia'
+    assert otro.version != base.version
+    assert ArgentinaPhoneNormalizer(plan=otro).tables_version() == otro.version
+
+
+def test_pickle():
+    base = NumberingPlan.default()
+    otro = _plan_con_otro_operador()
+    
+    # El plan por defecto vuelve como el plan por defecto del proceso, no como una copia
+    assert pickle.loads(pickle.dumps(base)) is base
+    copia = pickle.loads(pickle.dumps(otro))
+    assert copia is not otro
+    assert (copia.version, copia.source, copia.area_codes, copia.mobile_operators) == (
+        otro.version, otro.source, otro.area_codes, otro.mobile_operators)
+    with pytest.raises(TypeError):
+        copia.area_codes['11'] = {}
+    
+    # Un normalizador serializado sigue usando las tablas de su plan
+    numeros = benchmark.generar_numeros(500, 6)
+    normalizer = ArgentinaPhoneNormalizer(plan=otro)
+    restaurado = pickle.loads(pickle.dumps(normalizer))
+    assert restaurado.tables_version() == otro.version
+    assert [restaurado.normalize_phone_number(numero) for numero in numeros] == [
+        normalizer.normalize_phone_number(numero) for numero in numeros]
+    assert pickle.loads(pickle.dumps(ArgentinaPhoneNormalizer())).plan is base
+
+
+def test_archivo_del_plan(tmp_path):
+    otro = _plan_con_otro_operador()
+    ruta = str(tmp_path / 'plan.json')
+    
+    otro.to_file(ruta)
+    leido = NumberingPlan.from_file(ruta)
+    
+    assert leido.version == otro.version and leido.source == ruta
+    assert leido.area_codes == otro.area_codes
+    assert ArgentinaPhoneNormalizer(plan=leido).normalize_phone_number('+54 9 11 15 3388-7576')['operator'] == 'Nuevo'
+
+
+def test_archivo_sin_claves(tmp_path):
+    ruta = tmp_path / 'plan.json'
+    ruta.write_text('{"area_codes": {}}', encoding='utf-8')
+    
+    with pytest.raises(ValueError, match='mobile_operators'):
+        NumberingPlan.from_file(str(ruta))
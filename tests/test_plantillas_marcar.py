@@ -0,0 +1,63 @@
+import pandas as pd
+import pytest
+
+import benchmark
+import procesar_llamadas
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer
+
+
+def _validos(cantidad=3000, semilla=9):
+    df = ArgentinaPhoneNormalizer().batch_normalize(benchmark.generar_numeros(cantidad, semilla))
+    return df[df['is_valid'] == True]
+
+
+def _fila_por_fila(df_validos):
+    """Armado original del dialer con iterrows"""
+    numeros = []
+    for _, row in df_validos.iterrows():
+        if row['type'] == 'mobile':
+            numeros.append(f"15{row['area_code']}{row['local_number']}")
+        else:
+            numeros.append(f"{row['area_code']}{row['local_number']}")
+    return numeros
+
+
+def test_plantillas_por_defecto_igual_que_iterrows():
+    df_validos = _validos()
+    
+    assert set(df_validos['type']) == {'mobile', 'landline'}
+    assert procesar_llamadas.formatear_para_marcar(df_validos) == _fila_por_fila(df_validos)
+
+
+def test_plantillas_propias():
+    df_validos = _validos(500)
+    plantillas = {'mobile': '0{area_code}15{local_number}', 'landline': 'tel:{format_e164}'}
+    
+    numeros = procesar_llamadas.formatear_para_marcar(df_validos, plantillas)
+    
+    esperado = ['0' + fila['area_code'] + '15' + fila['local_number'] if fila['type'] == 'mobile'
+                else 'tel:' + fila['format_e164'] for _, fila in df_validos.iterrows()]
+    assert numeros == esperado
+    # Solo se reemplaza la plantilla indicada; la otra queda por defecto
+    solo_movil = procesar_llamadas.formatear_para_marcar(df_validos, {'mobile': '{format_e164}'})
+    assert solo_movil == [fila['format_e164'] if fila['type'] == 'mobile' else fila['area_code'] + fila['local_number']
+                          for _, fila in df_validos.iterrows()]
+
+
+@pytest.mark.parametrize('plantilla', ['{no_existe}', '{area_code:>5}', '{local_number!r}'])
+def test_plantilla_invalida(plantilla):
+    with pytest.raises(ValueError):
+        procesar_llamadas.formatear_para_marcar(_validos(50), {'landline': plantilla})
+
+
+def test_txt_del_dialer_con_plantilla(tmp_path):
+    entrada = str(tmp_path / 'llamadas.csv')
+    pd.DataFrame({'TELEFONO': ['11 3388-7576', '+54 9 11 15 3388-7576', '0351 456-7890', '3514567890', 'x']}).to_csv(
+        entrada, index=False)
+    
+    procesar_llamadas.procesar_telefonos(entrada, chunksize=2, directorio=str(tmp_path), hilos=False,
+                                         plantillas={'mobile': '0{area_code}15{local_number}'})
+    
+    # Los repetidos entre bloques se descartan; cada línea termina en \n
+    txt = (tmp_path / 'telefonos_para_marcar_argentina.txt').read_bytes()
+    assert txt == b'1133887576\n0111533887576\n3514567890\n'
@@ -0,0 +1,177 @@
+import json
+import os
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import procesar_llamadas
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer
+
+
+def _telefonos(n, semilla=1):
+    """Móviles de CABA, fijos de Córdoba y algunos números cortos inválidos"""
+    rng = np.random.default_rng(semilla)
+    numeros = np.where(rng.random(n) < 0.5, 1100000000 + rng.integers(0, 10**8, n),
+                       3510000000 + rng.integers(0, 10**7, n))
+    numeros[rng.random(n) < 0.05] = 123
+    return numeros
+
+
+def _csv_decimales(ruta, n):
+    # Exportación de una columna float: cada valor termina en .0 y hay celdas vacías
+    numeros = _telefonos(n).astype(float)
+    numeros[np.random.default_rng(2).random(n) < 0.1] = np.nan
+    pd.DataFrame({'TELEFONO': numeros, 'NOMBRE': 'x'}).to_csv(ruta, index=False)
+
+
+def _csv_enteros_vacio_al_final(ruta, n):
+    # Enteros con una sola celda vacía en el último bloque: leído entero, la columna es float
+    numeros = _telefonos(n).astype(object)
+    numeros[-1] = None
+    pd.DataFrame({'TELEFONO': numeros}).to_csv(ruta, index=False)
+
+
+def _csv_texto_al_final(ruta, n):
+    # Números con 0 adelante y un texto solo en el último bloque: leído entero, la columna es texto
+    numeros = ['0' + str(numero) for numero in _telefonos(n)]
+    numeros[-1] = 'sin numero'
+    pd.DataFrame({'TELEFONO': numeros}).to_csv(ruta, index=False)
+
+
+def _archivos(directorio):
+    contenido = {}
+    for raiz, _, nombres in os.walk(directorio):
+        for nombre in nombres:
+            ruta = os.path.join(raiz, nombre)
+            if nombre.endswith('.json'):
+                reporte = json.load(open(ruta, encoding='utf-8'))
+                reporte.pop('fecha_procesamiento')
+                contenido[nombre] = reporte
+            else:
+                contenido[nombre] = open(ruta, 'rb').read()
+    return contenido
+
+
+@pytest.mark.parametrize('generar', [_csv_decimales, _csv_enteros_vacio_al_final, _csv_texto_al_final])
+def test_bloques_igual_que_completo(tmp_path, generar):
+    entrada = str(tmp_path / 'llamadas.csv')
+    generar(entrada, 5000)
+    
+    procesar_llamadas.procesar_telefonos(entrada, directorio=str(tmp_path / 'completo'), hilos=False)
+    procesar_llamadas.procesar_telefonos(entrada, chunksize=1000, directorio=str(tmp_path / 'bloques'), hilos=False)
+    
+    assert _archivos(tmp_path / 'bloques') == _archivos(tmp_path / 'completo')
+
+
+@pytest.mark.parametrize('chunksize', [None, 1000])
+def test_hilos_igual_que_secuencial(tmp_path, chunksize):
+    # Los hilos de escritura y de lectura solo cambian el orden del trabajo, no los bytes de las salidas
+    entrada = str(tmp_path / 'llamadas.csv')
+    _csv_texto_al_final(entrada, 5000)
+    
+    procesar_llamadas.procesar_telefonos(entrada, chunksize=chunksize, directorio=str(tmp_path / 'hilos'), hilos=True)
+    procesar_llamadas.procesar_telefonos(entrada, chunksize=chunksize, directorio=str(tmp_path / 'secuencial'),
+                                         hilos=False)
+    
+    assert _archivos(tmp_path / 'hilos') == _archivos(tmp_path / 'secuencial')
+
+
+def test_bloques_decimales_validos(tmp_path):
+    # 1163696168.0 leído como texto daría 11 dígitos y ningún número válido
+    entrada = str(tmp_path / 'llamadas.csv')
+    _csv_decimales(entrada, 5000)
+    
+    _, reporte = procesar_llamadas.procesar_telefonos(entrada, chunksize=1000, directorio=str(tmp_path), hilos=False)
+    
+    assert reporte['porcentaje_validez'] > 80
+
+
+@pytest.mark.parametrize('chunksize', [None, 1000])
+def test_columna_numerica_por_camino_entero(tmp_path, monkeypatch, chunksize):
+    entrada = str(tmp_path / 'llamadas.csv')
+    _csv_decimales(entrada, 5000)
+    bloques_numericos = []
+    original = ArgentinaPhoneNormalizer._normalize_numeric
+    
+    def espia(self, values, numbers, *args):
+        bloques_numericos.append(len(numbers))
+        return original(self, values, numbers, *args)
+    
+    monkeypatch.setattr(ArgentinaPhoneNormalizer, '_normalize_numeric', espia)
+    procesar_llamadas.procesar_telefonos(entrada, chunksize=chunksize, directorio=str(tmp_path), hilos=False)
+    
+    # Cada bloque pasa por el camino entero, sin convertir los números a texto
+    assert len(bloques_numericos) == (5 if chunksize else 1)
+
+
+@pytest.mark.parametrize('chunksize', [None, 2])
+def test_filas_repetidas_entre_bloques(tmp_path, chunksize):
+    # El mismo número con otro formato en otro bloque cuenta como repetido; las celdas vacías no
+    entrada = str(tmp_path / 'llamadas.csv')
+    pd.DataFrame({'TELEFONO': ['11-3388-7576', None, '1133887576', '351 456 7890', None, '(11) 3388-7576']}).to_csv(
+        entrada, index=False)
+    
+    _, reporte = procesar_llamadas.procesar_telefonos(entrada, chunksize=chunksize, directorio=str(tmp_path),
+                                                      hilos=False)
+    
+    assert reporte['duplicados']['filas_entrada_repetidas'] == 2
+
+
+def test_reanudar_desde_el_byte_guardado(tmp_path, monkeypatch):
+    # Nombres entre comillas con saltos de línea y líneas vacías: los cortes tienen que respetar los registros
+    entrada = str(tmp_path / 'llamadas.csv')
+    numeros = _telefonos(5000)
+    pd.DataFrame({'TELEFONO': numeros, 'NOMBRE': [f'Perez,\n"Juan" {i}' for i in range(5000)]}).to_csv(
+        entrada, index=False)
+    with open(entrada, 'a') as f:
+        f.write('\n\n1133887576,"al final"\n')
+    
+    procesar_llamadas.procesar_telefonos(entrada, directorio=str(tmp_path / 'completo'), hilos=False)
+    
+    original = procesar_llamadas._escribir_bloque
+    llamadas = []
+    
+    def corte(*args, **kwargs):
+        llamadas.append(None)
+        if len(llamadas) == 4:
+            raise RuntimeError('corte')
+        return original(*args, **kwargs)
+    
+    monkeypatch.setattr(procesar_llamadas, '_escribir_bloque', corte)
+    opciones = dict(chunksize=700, directorio=str(tmp_path / 'bloques'), hilos=False,
+                    punto_control=str(tmp_path / 'control.json'), intervalo_control=2)
+    procesar_llamadas.procesar_telefonos(entrada, **opciones)
+    monkeypatch.setattr(procesar_llamadas, '_escribir_bloque', original)
+    
+    cortes = []
+    cortar = procesar_llamadas._cortar_csv
+    monkeypatch.setattr(procesar_llamadas, '_cortar_csv', lambda *args: cortes.append(args[2]) or cortar(*args))
+    procesar_llamadas.procesar_telefonos(entrada, **opciones)
+    
+    # Sigue desde el final del segundo bloque sin releer los anteriores
+    assert cortes[0] > 0
+    assert _archivos(tmp_path / 'bloques') == _archivos(tmp_path / 'completo')
+
+
+def test_memoria_acotada_por_bloques(tmp_path, monkeypatch):
+    # Los números vistos (entrada y dialer) ocupan 8 bytes cada uno; el resto depende del tamaño de bloque
+    monkeypatch.setattr(procesar_llamadas, 'FILAS_TIPO_COLUMNA', 1000)
+    monkeypatch.setattr(procesar_llamadas, 'BUFFER_CSV', 1 << 16)
+    picos = {}
+    # La primera corrida arma las tablas del normalizador, que no dependen de la entrada
+    for n in (1000, 5000, 25000):
+        entrada = str(tmp_path / f'llamadas_{n}.csv')
+        numeros = np.random.default_rng(n).choice(np.arange(1100000000, 1199999999), n, replace=False)
+        pd.DataFrame({'TELEFONO': numeros.astype(str)}).to_csv(entrada, index=False)
+        tracemalloc.start()
+        try:
+            procesar_llamadas.procesar_telefonos(entrada, chunksize=1000, directorio=str(tmp_path), hilos=False,
+                                                 salidas=['marcar', 'reporte'])
+            picos[n] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    
+    # Con sets de strings eran unos 190 bytes por número distinto
+    assert (picos[25000] - picos[5000]) / 20000 < 64
@@ -0,0 +1,37 @@
+import pandas as pd
+import pytest
+
+import benchmark
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer, ReportAggregator
+
+
+def _sin_fecha(reporte):
+    reporte.pop('processed_at')
+    return reporte
+
+
+@pytest.mark.parametrize('numeros', [benchmark.generar_numeros(3000, 5), ['1133887576'] * 5, ['basura', '']])
+def test_reporte_categorico_igual_que_object(numeros):
+    normalizer = ArgentinaPhoneNormalizer()
+    resultado = normalizer.batch_normalize_compact(numeros)
+    
+    categorico = _sin_fecha(normalizer.generate_report(resultado.to_dataframe()))
+    
+    assert categorico == _sin_fecha(normalizer.generate_report(resultado.to_dataframe(categorical=False)))
+    assert categorico == _sin_fecha(normalizer.generate_report(pd.DataFrame(
+        [normalizer.normalize_phone_number(numero) for numero in numeros])))
+    assert 0 not in categorico['operator_distribution'].values()
+    assert 0 not in categorico['region_distribution'].values()
+
+
+def test_agregador_por_bloques_igual_que_completo():
+    normalizer = ArgentinaPhoneNormalizer()
+    resultados = normalizer.batch_normalize(benchmark.generar_numeros(3000, 6))
+    
+    agregado = ReportAggregator()
+    for inicio in range(0, len(resultados), 700):
+        # Como en un punto de control: cada bloque pasa por to_dict/from_dict antes de combinarse
+        bloque = ReportAggregator().update(resultados.iloc[inicio:inicio + 700])
+        agregado.merge(ReportAggregator.from_dict(bloque.to_dict()))
+    
+    assert _sin_fecha(agregado.to_report()) == _sin_fecha(ReportAggregator().update(resultados).to_report())
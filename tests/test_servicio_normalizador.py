@@ -0,0 +1,47 @@
+import asyncio
+import json
+
+from servicio_normalizador import ClienteLocal, ServicioNormalizador
+
+
+def test_pedidos_lote_en_su_propio_histograma():
+    async def correr():
+        servicio = ServicioNormalizador(ventana_ms=1)
+        cliente = ClienteLocal(servicio)
+        try:
+            await cliente.post('/normalizar/lote', {'numeros': ['1133887576'] * 300})
+            await asyncio.gather(*(cliente.get('/normalizar?numero=1133887576') for _ in range(3)))
+            return (await cliente.get('/metricas'))[1]
+        finally:
+            await servicio.detener()
+    
+    metricas = asyncio.run(correr())
+    
+    # El agrupador juntó solo los pedidos sueltos; el lote de 300 no entra en su histograma
+    assert metricas['tamano_pedido_lote']['total'] == 1
+    assert metricas['tamano_pedido_lote']['promedio'] == 300
+    assert metricas['tamano_lote']['total'] >= 1
+    assert metricas['tamano_lote']['promedio'] <= 3
+
+
+def test_signo_mas_y_numeros_no_finitos():
+    async def correr():
+        servicio = ServicioNormalizador(ventana_ms=1)
+        cliente = ClienteLocal(servicio)
+        try:
+            return (await cliente.get('/normalizar?numero=+5491133887576'),
+                    await cliente.get('/normalizar?numero=%2B54%209%2011%203388-7576'),
+                    await cliente.post('/normalizar', {'numero': float('inf')}),
+                    await cliente.post('/normalizar/lote', {'numeros': [float('nan'), 1e400, '1133887576']}))
+        finally:
+            await servicio.detener()
+    
+    (_, mas), (_, codificado), (estado, infinito), (_, lote) = asyncio.run(correr())
+    
+    # El '+' de la query string no se convierte en espacio
+    assert mas['original'] == '+5491133887576'
+    assert codificado['original'] == '+54 9 11 3388-7576'
+    # NaN e infinitos no son JSON válido: vuelven como null
+    assert estado == 200 and infinito['original'] is None and not infinito['is_valid']
+    assert [fila['original'] for fila in lote['resultados']] == [None, None, '1133887576']
+    assert json.dumps(lote, allow_nan=False)
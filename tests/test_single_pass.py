@@ -0,0 +1,53 @@
+import math
+import random
+
+import pytest
+
+import benchmark
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer
+
+PREFIJOS = ['+54', '0054', '54', '9', '0', '15', '+549', '5491115', '91115', '+5491115', '0054 9 221 15',
+            '54 9 2901 15', '+54 11', '011 15']
+
+
+def _aleatorios(semilla, cantidad):
+    """Cadenas armadas con dígitos, formato, prefijos y algunos caracteres que no son ASCII"""
+    rng = random.Random(semilla)
+    alfabeto = '0123456789+-() .\t\n\x1c٣a9154'
+    corpus = [''.join(rng.choice(alfabeto) for _ in range(rng.randint(0, 18))) for _ in range(cantidad)]
+    corpus += [rng.choice(PREFIJOS) + ''.join(rng.choice('0123456789--+ a') for _ in range(rng.randint(0, 12)))
+               for _ in range(cantidad)]
+    return corpus
+
+
+CORPUS = {
+    'generados': benchmark.generar_numeros(5000, 1),
+    'aleatorios': _aleatorios(7, 10000),
+    'digitos_unicode': ['١١٣٣٨٨٧٥٧٦', '１１３３８８７５７６', '११३३८८७५७६', '11 3388 ٧٥٧٦', '+٥٤ ٩ ١١ ٣٣٨٨-٧٥٧٦',
+                        '11 3388 7576', '11—3388–7576', ' 1133887576 '],
+    'extensiones': ['11 3388-7576 ext. 12', '1133887576x123', '1133887576 int 45', '(011) 4321-5678 #12',
+                    '+54 11 3388-7576;ext=9', '0221-456-7890 interno 3', '1133887576,,22', '11-3388-7576 / 11-3388-7577'],
+    'faltantes': [None, float('nan'), math.nan, '', ' ', '   ', '\t', 'nan', 'NaN', 'None', 'none', 'null'],
+    'enteros': [1133887576, 5491133887576, 91133887576, 2214567890, 0, -1133887576, 123, 10**19, True, False],
+    'decimales': [1133887576.0, 5491133887576.0, 2214567890.5, -1.0, 0.0, 1e20, float('inf'), float('-inf')],
+    'bordes': ['+54', '0054', '54', '5', '9', '+5', '00549111512345678', '911151234567', '9221151234567',
+               '92901151234567', '54911151234567', '+', '++5411', '0', '15', '-', '()', '.'],
+}
+
+
+def _resumen(resultado):
+    return (resultado['is_valid'], resultado['format_e164'], resultado['format_national'],
+            resultado['area_code'], tuple(resultado['errors']))
+
+
+@pytest.mark.parametrize('nombre', list(CORPUS))
+def test_single_pass_igual_que_regex(nombre):
+    regex = ArgentinaPhoneNormalizer(parser='regex')
+    single_pass = ArgentinaPhoneNormalizer(parser='single_pass')
+    
+    distintos = [(numero, _resumen(regex.normalize_phone_number(numero)),
+                  _resumen(single_pass.normalize_phone_number(numero)))
+                 for numero in CORPUS[nombre]]
+    distintos = [fila for fila in distintos if fila[1] != fila[2]]
+    
+    assert distintos == []
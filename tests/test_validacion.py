@@ -0,0 +1,34 @@
+import pytest
+
+from argentina_phone_normalizer import ArgentinaPhoneNormalizer, _error_code
+from test_single_pass import CORPUS
+
+
+def _esperado(resultado):
+    codigo = _error_code(resultado['errors'][0]) if resultado['errors'] else 0
+    return codigo, resultado['format_e164'] if codigo == 0 else ''
+
+
+@pytest.mark.parametrize('nombre', list(CORPUS))
+def test_check_igual_que_normalize_phone_number(nombre):
+    normalizer = ArgentinaPhoneNormalizer()
+    
+    distintos = [(numero, _esperado(normalizer.normalize_phone_number(numero)),
+                  (normalizer.validation_code(numero), normalizer.to_e164(numero)))
+                 for numero in CORPUS[nombre]]
+    distintos = [fila for fila in distintos if fila[1] != fila[2]]
+    
+    assert distintos == []
+    assert [normalizer.is_valid(numero) for numero in CORPUS[nombre]] == \
+        [normalizer.validation_code(numero) == 0 for numero in CORPUS[nombre]]
+
+
+def test_check_sigue_a_las_tablas():
+    normalizer = ArgentinaPhoneNormalizer()
+    assert normalizer.is_valid('1133887576')
+    assert normalizer.to_e164(2214567890) == '+542214567890'
+    
+    # Al reemplazar las tablas se rehacen los tipos y prefijos que usa _check
+    normalizer.area_codes = {codigo: datos for codigo, datos in normalizer.area_codes.items() if codigo != '11'}
+    assert not normalizer.is_valid('1133887576')
+    assert normalizer.to_e164(2214567890) == '+542214567890'